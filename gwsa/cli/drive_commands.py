@@ -16,11 +16,12 @@ def drive_group():
 @drive_group.command('list')
 @click.option('--folder-id', default=None, help='Folder ID to list. Defaults to My Drive root.')
 @click.option('--max-results', type=int, default=100, help='Maximum items to return.')
+@click.option('--page-token', default=None, help='Token from a previous next_page_token to continue listing.')
 @require_scopes('drive')
-def list_folder(folder_id, max_results):
+def list_folder(folder_id, max_results, page_token):
     """List contents of a Drive folder."""
     try:
-        result = drive.list_folder(folder_id=folder_id, max_results=max_results)
+        result = drive.list_folder(folder_id=folder_id, max_results=max_results, page_token=page_token)
         click.echo(json.dumps(result, indent=2))
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
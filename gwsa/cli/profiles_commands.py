@@ -22,6 +22,13 @@ from gwsa.sdk.config import get_config_file_path
 from .decorators import format_time_ago, format_status, show_profile_guidance
 
 
+def _adc_path() -> Path:
+    """Return the central gcloud ADC file location for the current HOME/APPDATA."""
+    if sys.platform == "win32":
+        return Path(os.environ.get("APPDATA", "")) / "gcloud" / "application_default_credentials.json"
+    return Path.home() / ".config" / "gcloud" / "application_default_credentials.json"
+
+
 @click.group()
 def profiles():
     """Manage authentication profiles for multiple Google identities."""
@@ -289,7 +296,7 @@ def refresh_cmd(name, basic_scopes):
 
         if profile_type == "adc":
             # Backup central ADC file to prevent gcloud from clobbering it
-            central_adc = Path.home() / ".config" / "gcloud" / "application_default_credentials.json"
+            central_adc = _adc_path()
             backup_path = None
             if central_adc.exists():
                 backup_path = central_adc.with_suffix(".json.gwsa-backup")
@@ -333,7 +340,7 @@ def refresh_cmd(name, basic_scopes):
                 creds = Credentials.from_authorized_user_info(token_data)
                 
                 with open(temp_path, 'w') as f:
-                    json.dump(token_data, f, indent=2)
+                    json.dump(token_data, f, separators=(",", ":"))
 
             finally:
                 # Restore the original central ADC file
@@ -361,7 +368,7 @@ def refresh_cmd(name, basic_scopes):
             token_data = json.loads(creds.to_json())
             token_data["type"] = "authorized_user"
             with open(temp_path, 'w') as f:
-                json.dump(token_data, f, indent=2)
+                json.dump(token_data, f, separators=(",", ":"))
 
         # Validate with tokeninfo
         click.echo("Validating new credentials...")
@@ -457,7 +464,7 @@ def add_cmd(name, profile_type, quota_project, basic_scopes):
             # gcloud always writes to the central ADC location, so we
             # backup the existing file, let gcloud write, copy to vault,
             # then restore the original.
-            central_adc = Path.home() / ".config" / "gcloud" / "application_default_credentials.json"
+            central_adc = _adc_path()
             backup_path = None
             if central_adc.exists():
                 backup_path = central_adc.with_suffix(".json.gwsa-backup")
@@ -688,8 +695,8 @@ def apply_cmd(name):
         sys.exit(1)
 
     # Determine global gcloud ADC path
-    central_adc_dir = Path.home() / ".config" / "gcloud"
-    central_adc_file = central_adc_dir / "application_default_credentials.json"
+    central_adc_file = _adc_path()
+    central_adc_dir = central_adc_file.parent
     
     # Ensure directory exists
     central_adc_dir.mkdir(parents=True, exist_ok=True)
@@ -29,9 +29,15 @@ CLIENT_SECRETS_FILE = os.path.join(_CONFIG_DIR, "client_secrets.json")
 def hash_file(filepath: Path, truncate: int = 8) -> str:
     """Create a short hash of file contents"""
     try:
-        with open(filepath, 'r') as f:
-            content = f.read()
-        return hashlib.sha256(content.encode()).hexdigest()[:truncate]
+        with open(filepath, 'rb') as f:
+            if hasattr(hashlib, 'file_digest'):
+                digest = hashlib.file_digest(f, 'sha256')
+            else:
+                # Python < 3.11: stream the file in 64 KiB chunks
+                digest = hashlib.sha256()
+                for chunk in iter(lambda: f.read(65536), b''):
+                    digest.update(chunk)
+        return digest.hexdigest()[:truncate]
     except Exception:
         return "ERROR"
 
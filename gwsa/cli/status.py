@@ -3,6 +3,7 @@
 import json
 import hashlib
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Tuple, Optional
 import click
@@ -10,9 +11,13 @@ import click
 from . import setup_local
 
 
+@lru_cache(maxsize=1)
 def get_gworkspace_access_dir() -> Tuple[Optional[Path], list]:
     """Find gworkspace-access directory.
     Returns (found_path, list_of_checked_paths)
+
+    The lookup is cached for the life of the process; call
+    get_gworkspace_access_dir.cache_clear() after changing GWSA_CONFIG_DIR.
     """
     # Check environment variable first
     env_path = os.getenv('GWSA_CONFIG_DIR')
@@ -35,21 +40,24 @@ def get_gworkspace_access_dir() -> Tuple[Optional[Path], list]:
     return None, checked_paths
 
 
-def hash_file(filepath: Path, truncate: int = 8) -> str:
-    """Create a short hash of file contents"""
+def _read_bytes(filepath: Path) -> Optional[bytes]:
+    """Read a file in one open, returning None if it does not exist"""
     try:
-        with open(filepath, 'r') as f:
-            content = f.read()
-        return hashlib.sha256(content.encode()).hexdigest()[:truncate]
-    except Exception:
-        return "ERROR"
+        with open(filepath, 'rb') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
 
+def hash_bytes(data: bytes, truncate: int = 8) -> str:
+    """Create a short hash of already-read file contents"""
+    return hashlib.sha256(data).hexdigest()[:truncate]
 
-def load_json_safe(filepath: Path) -> Dict:
-    """Safely load JSON file"""
+
+def load_json_safe(data: bytes) -> Dict:
+    """Safely parse JSON from already-read file contents"""
     try:
-        with open(filepath, 'r') as f:
-            return json.load(f)
+        return json.loads(data)
     except Exception as e:
         return {"error": str(e)}
 
@@ -69,7 +77,8 @@ def check_client_config() -> Tuple[bool, Dict]:
 
     client_secrets_path = gwa_dir / 'client_secrets.json'
 
-    if not client_secrets_path.exists():
+    data = _read_bytes(client_secrets_path)
+    if data is None:
         return False, {
             "status": "MISSING CONFIG",
             "message": "client_secrets.json not found",
@@ -77,26 +86,25 @@ def check_client_config() -> Tuple[bool, Dict]:
             "project_id": None
         }
 
-    client_secrets = load_json_safe(client_secrets_path)
-    creds_hash = hash_file(client_secrets_path)
-    project_id = client_secrets.get('installed', {}).get('project_id', 'UNKNOWN')
-    client_id = client_secrets.get('installed', {}).get('client_id', 'UNKNOWN')[:20]
-
+    client_secrets = load_json_safe(data)
     if 'error' in client_secrets:
         return False, {
             "status": "PARSE ERROR",
             "error": client_secrets['error'],
-            "client_creds_hash": creds_hash,
-            "project_id": project_id
+            "client_creds_hash": None,
+            "project_id": None
         }
 
+    creds_hash = hash_bytes(data)
+    installed = client_secrets.get('installed') or {}
+
     return True, {
         "status": "CONFIGURED",
         "client_secrets_file": str(client_secrets_path),
         "client_creds_hash": creds_hash,
-        "project_id": project_id,
-        "client_id_prefix": client_id,
-        "scopes": client_secrets.get('installed', {}).get('scopes', [])
+        "project_id": installed.get('project_id', 'UNKNOWN'),
+        "client_id_prefix": installed.get('client_id', 'UNKNOWN')[:20],
+        "scopes": installed.get('scopes', [])
     }
 
 
@@ -112,15 +120,16 @@ def check_user_credentials() -> Tuple[bool, Dict]:
 
     user_token_path = gwa_dir / 'user_token.json'
 
-    if not user_token_path.exists():
+    data = _read_bytes(user_token_path)
+    if data is None:
         return False, {
             "status": "NO USER TOKEN",
             "user_token_path": str(user_token_path),
             "message": "user_token.json not found - run 'gwsa setup' to authenticate"
         }
 
-    user_token = load_json_safe(user_token_path)
-    token_hash = hash_file(user_token_path)
+    user_token = load_json_safe(data)
+    token_hash = hash_bytes(data)
 
     if 'error' in user_token:
         return False, {
@@ -142,8 +151,7 @@ def check_user_credentials() -> Tuple[bool, Dict]:
 def print_table(title: str, status_ok: bool, data: Dict) -> None:
     """Print a formatted status table"""
     status_indicator = "✓" if status_ok else "✗"
-    click.echo(f"\n{status_indicator} {title}")
-    click.echo("=" * 80)
+    lines = [f"\n{status_indicator} {title}", "=" * 80]
 
     for key, value in data.items():
         if isinstance(value, list):
@@ -151,25 +159,28 @@ def print_table(title: str, status_ok: bool, data: Dict) -> None:
         elif value is None:
             value = "(not set)"
 
-        click.echo(f"  {key:<30} {str(value):<45}")
+        lines.append(f"  {key:<30} {str(value):<45}")
 
-    click.echo("=" * 80)
+    lines.append("=" * 80)
+    click.echo("\n".join(lines))
 
 
 def status():
     """Check gwsa configuration and credential status."""
-    click.echo("\n" + "=" * 80)
-    click.echo("gworkspace-access (gwsa) Configuration Status")
-    click.echo("=" * 80)
-
     # Show installation check
     gwa_dir, checked_paths = get_gworkspace_access_dir()
-    click.echo("\nCONFIGURATION PATH SEARCH")
-    click.echo("=" * 80)
+    lines = [
+        "\n" + "=" * 80,
+        "gworkspace-access (gwsa) Configuration Status",
+        "=" * 80,
+        "\nCONFIGURATION PATH SEARCH",
+        "=" * 80,
+    ]
     for path in checked_paths:
         status_indicator = "✓ FOUND" if gwa_dir and str(gwa_dir) == path else "✗ not found"
-        click.echo(f"  {status_indicator:<10} {path}")
-    click.echo("=" * 80)
+        lines.append(f"  {status_indicator:<10} {path}")
+    lines.append("=" * 80)
+    click.echo("\n".join(lines))
 
     # Check client configuration
     client_ok, client_data = check_client_config()
@@ -180,23 +191,25 @@ def status():
     print_table("USER AUTHENTICATION", user_ok, user_data)
 
     # Overall status
-    click.echo("\n" + "=" * 80)
+    lines = ["\n" + "=" * 80]
     if client_ok and user_ok:
-        click.echo("✓ gwsa is fully configured and ready to use")
-        return 0
+        lines.append("✓ gwsa is fully configured and ready to use")
+        exit_code = 0
     elif client_ok and not user_ok:
-        click.echo("⚠ Client app configured but user authentication missing")
-        click.echo("  Run: gwsa setup")
-        return 1
+        lines.append("⚠ Client app configured but user authentication missing")
+        lines.append("  Run: gwsa setup")
+        exit_code = 1
     elif not client_ok and user_ok:
-        click.echo("⚠ User authenticated but client app configuration missing")
-        click.echo("  This is unusual - check your gworkspace-access installation")
-        return 1
+        lines.append("⚠ User authenticated but client app configuration missing")
+        lines.append("  This is unusual - check your gworkspace-access installation")
+        exit_code = 1
     else:
-        click.echo("✗ gwsa is not properly configured")
-        if not get_gworkspace_access_dir()[0]:
-            click.echo("  gworkspace-access not found - install it from:")
-            click.echo("  https://github.com/krisrowe/gworkspace-access")
+        lines.append("✗ gwsa is not properly configured")
+        if not gwa_dir:
+            lines.append("  gworkspace-access not found - install it from:")
+            lines.append("  https://github.com/krisrowe/gworkspace-access")
         else:
-            click.echo("  Run: gwsa setup")
-        return 1
+            lines.append("  Run: gwsa setup")
+        exit_code = 1
+    click.echo("\n".join(lines))
+    return exit_code
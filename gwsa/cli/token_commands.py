@@ -6,15 +6,27 @@ import json
 import os
 import subprocess
 from pathlib import Path
-from .auth.scopes import resolve_scopes
-from .auth.check_access import FEATURE_SCOPES, IDENTITY_SCOPES
-from gwsa.sdk.auth import SCOPE_ALIASES
 from .setup_local import CLIENT_SECRETS_FILE
 
-# Build dynamic help string for scopes
-ALL_ALIAS_KEYS = set(SCOPE_ALIASES.keys()) | set(FEATURE_SCOPES.keys())
-AVAILABLE_SCOPES = ", ".join(sorted(list(ALL_ALIAS_KEYS)))
-SCOPE_HELP = f"Comma-separated list of scopes ({AVAILABLE_SCOPES}), the 'all' keyword, or full URLs."
+
+def _scope_help() -> str:
+    """Build the --scopes help string from the known scope aliases."""
+    from .auth.check_access import FEATURE_SCOPES
+    from gwsa.sdk.auth import SCOPE_ALIASES
+
+    all_alias_keys = set(SCOPE_ALIASES.keys()) | set(FEATURE_SCOPES.keys())
+    available_scopes = ", ".join(sorted(all_alias_keys))
+    return f"Comma-separated list of scopes ({available_scopes}), the 'all' keyword, or full URLs."
+
+
+class _ScopesOption(click.Option):
+    """Option whose help text is only assembled when --help is rendered."""
+
+    def get_help_record(self, ctx):
+        if self.help is None:
+            self.help = _scope_help()
+        return super().get_help_record(ctx)
+
 
 @click.group()
 def token():
@@ -23,7 +35,7 @@ def token():
 
 @token.command("generate")
 @click.argument("source", type=click.Choice(["adc", "custom"]))
-@click.option("--scopes", help=SCOPE_HELP)
+@click.option("--scopes", cls=_ScopesOption)
 @click.option("--output", "-o", type=click.Path(), help="Write token JSON to this file instead of stdout.")
 def generate_cmd(source, scopes, output):
     """Generate a Google API token JSON without affecting profiles.
@@ -33,6 +45,9 @@ def generate_cmd(source, scopes, output):
     This command performs an interactive authentication flow and outputs the resulting
     credential JSON. It does NOT save the token to any gwsa profile.
     """
+    from .auth.scopes import resolve_scopes
+    from .auth.check_access import FEATURE_SCOPES, IDENTITY_SCOPES
+
     # 1. Resolve Scopes
     if scopes == "all":
         all_scopes = {s for s_set in FEATURE_SCOPES.values() for s in s_set} | IDENTITY_SCOPES
@@ -44,6 +59,7 @@ def generate_cmd(source, scopes, output):
         requested_scopes = []
 
     token_data = None
+    adc_bytes = None
 
     if source == "adc":
         click.echo("Initiating ADC Login via gcloud...", err=True)
@@ -65,8 +81,7 @@ def generate_cmd(source, scopes, output):
                 click.secho(f"Error: ADC file not found after login at {adc_path}", fg="red", err=True)
                 sys.exit(1)
                 
-            with open(adc_path, "r") as f:
-                token_data = json.load(f)
+            adc_bytes = adc_path.read_bytes()
         except Exception as e:
             click.secho(f"Error generating ADC token: {e}", fg="red", err=True)
             sys.exit(1)
@@ -102,6 +117,14 @@ def generate_cmd(source, scopes, output):
             sys.exit(1)
 
     # 2. Output handling
+    if adc_bytes is not None:
+        if output:
+            # gcloud already wrote valid token JSON; copy it without re-encoding
+            Path(output).write_bytes(adc_bytes)
+            click.echo(f"Token saved to {output}", err=True)
+            return
+        token_data = json.loads(adc_bytes)
+
     if token_data:
         output_json = json.dumps(token_data, indent=2)
         if output:
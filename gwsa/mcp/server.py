@@ -7,23 +7,223 @@ configured, just like the CLI.
 Profile operations are read-only (no creation, no credential changes).
 """
 
+import asyncio
+import contextvars
+import functools
+import inspect
 import json
 import logging
-from typing import Any, Optional
-
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Optional, get_origin
+
+import anyio
 from mcp.server.fastmcp import FastMCP
 from googleapiclient.errors import HttpError
 
 from gwsa.sdk import profiles, mail, docs, drive, auth, chat
+from gwsa.sdk.cache import get_cached_members, set_cached_members, clear_memory_caches
+from gwsa.sdk.chat import get_recent_chats
+from gwsa.sdk.people import get_person_name, get_first_name, prefetch_person_names
 from gwsa.sdk.exceptions import LocalPathError, InvalidDocIdError
 
+try:
+    import orjson  # Optional: faster JSON encoding when installed
+except ImportError:
+    orjson = None
+
+try:
+    import uvloop  # Optional: faster event loop when installed
+except ImportError:
+    uvloop = None
+
 logger = logging.getLogger(__name__)
 
+
+# Clients parse resource payloads, so they are compact unless GWSA_MCP_PRETTY_JSON=1
+_PRETTY_JSON = os.getenv("GWSA_MCP_PRETTY_JSON") == "1"
+
+
+def _dumps(obj: Any) -> str:
+    """Encode a payload as JSON, using orjson when it is installed."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if _PRETTY_JSON else 0)
+        return orjson.dumps(obj, default=str, option=option).decode()
+    if _PRETTY_JSON:
+        return json.dumps(obj, indent=2, default=str)
+    return json.dumps(obj, separators=(",", ":"), default=str)
+
+
+async def _warmup_chat_cache() -> None:
+    """Populate the chat member and person-name caches for recent spaces."""
+    try:
+        result = await list_chat_spaces(limit=20, resolve_names=True)
+        if "error" in result:
+            logger.warning(f"Chat cache warmup failed: {result['error']}")
+        else:
+            logger.debug(f"Chat cache warmed for {len(result['spaces'])} spaces")
+    except Exception as e:
+        logger.warning(f"Chat cache warmup failed: {e}")
+
+
+# Strong references to fire-and-forget tasks so they are not garbage collected
+_background_tasks: set[asyncio.Task] = set()
+
+
+def _run_in_background(coro) -> None:
+    """Start a coroutine without waiting for it."""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+async def _prefetch_labels() -> None:
+    """Cache the active account's label IDs so the first label change costs one call."""
+    try:
+        count = await _to_thread(mail.prefetch_labels)
+        logger.debug(f"Prefetched {count} Gmail labels")
+    except Exception as e:
+        logger.debug(f"Label prefetch skipped: {e}")
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP):
+    """Start optional background warmup (GWSA_MCP_WARMUP=1) when the server boots."""
+    warmup_task = None
+    if os.getenv("GWSA_MCP_WARMUP") == "1":
+        warmup_task = asyncio.create_task(_warmup_chat_cache())
+    try:
+        yield
+    finally:
+        if warmup_task and not warmup_task.done():
+            warmup_task.cancel()
+
+
 # Create the MCP server
-mcp = FastMCP("gwsa")
+mcp = FastMCP("gwsa", lifespan=_lifespan)
+
+
+# Errors caused by the caller's input; returned as-is without logging
+_CALLER_ERRORS = (LocalPathError, InvalidDocIdError, drive.AmbiguousFolderError)
+
+
+def _http_error_result(e: HttpError) -> dict[str, Any]:
+    """Build the error payload for a Google API error."""
+    if e.resp.status == 403:
+        return {
+            "error": "The caller does not have permission.",
+            "details": str(e),
+            "hint": "The active gwsa profile may not have access to this resource. "
+                    "Try switching profiles with the `switch_profile` tool or "
+                    "running `gwsa setup --new-user` to re-authenticate."
+        }
+    return {"error": str(e)}
+
+
+def _tool_errors(fn=None, *, success_flag: bool = False):
+    """Turn exceptions raised by a tool into an error payload for the client.
+
+    Tools annotated as returning a list get the payload wrapped in a list;
+    with success_flag the payload also carries "success": False.
+    """
+    if fn is None:
+        return functools.partial(_tool_errors, success_flag=success_flag)
+    returns_list = get_origin(inspect.signature(fn).return_annotation) is list
+
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        try:
+            return await fn(*args, **kwargs)
+        except _CALLER_ERRORS as e:
+            error = {"error": str(e)}
+        except HttpError as e:
+            logger.error(f"Google API error in {fn.__name__}: {e}")
+            error = _http_error_result(e)
+        except Exception as e:
+            logger.error(f"Error in {fn.__name__}: {e}")
+            error = {"error": str(e)}
+        if success_flag:
+            error = {"success": False, **error}
+        return [error] if returns_list else error
+
+    return wrapper
+
+
+# SDK calls run on a dedicated pool. Its size caps calls in flight across all
+# tool invocations (keeping concurrent clients under per-user API rate limits),
+# and its few long-lived threads keep their cached services' connections warm
+# instead of opening new ones on whichever default-executor thread is free.
+_MAX_CONCURRENT_API_CALLS = 10
+_api_executor = ThreadPoolExecutor(max_workers=_MAX_CONCURRENT_API_CALLS, thread_name_prefix="gwsa-api")
+
+
+async def _to_thread(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run a blocking SDK call on the API worker pool."""
+    call = functools.partial(contextvars.copy_context().run, func, *args, **kwargs)
+    return await asyncio.get_running_loop().run_in_executor(_api_executor, call)
+
+
+async def _aexec(build_request: Callable[[], Any]) -> Any:
+    """Build and execute a googleapiclient request in a worker thread.
+
+    The request is built in the worker too, so it uses that thread's cached
+    service (httplib2 connections must not be shared across threads).
+    """
+    return await _to_thread(lambda: build_request().execute())
+
+
+# Chat API filters for the three valid space types, built once
+_SPACE_TYPE_FILTERS = {
+    space_type: f'space_type = "{space_type}"'
+    for space_type in ('DIRECT_MESSAGE', 'GROUP_CHAT', 'SPACE')
+}
+
+
+def _space_type_filter(space_type: str) -> str:
+    """Return the spaces.list filter for a space type (unknown values are passed through for the API to reject)."""
+    key = space_type.upper()
+    return _SPACE_TYPE_FILTERS.get(key) or f'space_type = "{key}"'
+
+
+# In-flight calls by key, shared by concurrent callers (see _singleflight)
+_inflight: dict[Any, asyncio.Task] = {}
+
+
+async def _singleflight(key: Any, coro_factory: Callable[[], Awaitable[Any]]) -> Any:
+    """Run coro_factory() once for concurrent callers with the same key.
+
+    Later callers await the call already in flight instead of starting their
+    own. The call is shielded, so one caller being cancelled does not cancel
+    it for the others.
+    """
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(coro_factory())
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    return await asyncio.shield(task)
+
+
+async def _resolve_person_names(user_ids, first_names: bool = False) -> dict[str, str]:
+    """Resolve each distinct user ID to a display (or first) name with one batched People lookup."""
+    resolve = get_first_name if first_names else get_person_name
+    unique_ids = list(dict.fromkeys(user_ids))
+    if not unique_ids:
+        return {}
+
+    def resolve_all() -> dict[str, str]:
+        # Uncached IDs are fetched together; the per-ID calls then hit the memo
+        prefetch_person_names(unique_ids)
+        return {user_id: resolve(user_id) for user_id in unique_ids}
+
+    return await _to_thread(resolve_all)
 
 
 @mcp.tool()
+@_tool_errors
 async def list_chat_spaces(
     limit: int = 10, 
     space_type: Optional[str] = None, 
@@ -63,60 +263,89 @@ async def list_chat_spaces(
         # Get full details for the 10 most recent spaces, including member names
         list_chat_spaces(verbose=True, resolve_names=True)
     """
-    try:
-        chat_service = chat.get_chat_service()
-        
-        filter_query = ''
-        if space_type:
-            filter_query = f"space_type = \"{space_type.upper()}\""
-            
-        result = chat_service.spaces().list(pageSize=limit, filter=filter_query).execute()
-        spaces = result.get('spaces', [])
-
-        if resolve_names:
-            from gwsa.sdk.people import get_person_name
-            from gwsa.sdk.cache import get_cached_members, set_cached_members
-            for space in spaces:
-                if space.get('spaceType') in ['DIRECT_MESSAGE', 'GROUP_CHAT']:
+    filter_query = _space_type_filter(space_type) if space_type else ''
+
+    result = await _aexec(lambda: chat.get_chat_service().spaces().list(pageSize=limit, filter=filter_query))
+    spaces = result.get('spaces', [])
+
+    if resolve_names:
+        def _fetch_members(space_names):
+            """Fetch memberships for several spaces using batched requests."""
+            service = chat.get_chat_service()
+            fetched = {}
+
+            def _on_response(request_id, response, exception):
+                if exception:
+                    logger.warning(f"Could not list members for space {request_id}: {exception}")
+                else:
+                    fetched[request_id] = response.get('memberships', [])
+
+            try:
+                # Batch requests accept at most 100 calls each
+                for i in range(0, len(space_names), 100):
+                    batch = service.new_batch_http_request(callback=_on_response)
+                    for name in space_names[i:i + 100]:
+                        batch.add(service.spaces().members().list(parent=name, pageSize=10), request_id=name)
+                    batch.execute()
+            except Exception as e:
+                logger.warning(f"Batch member listing failed, falling back to single requests: {e}")
+                for name in space_names:
+                    if name in fetched:
+                        continue
                     try:
-                        members = get_cached_members(space['name'])
-                        if not members:
-                            members_result = chat_service.spaces().members().list(parent=space['name'], pageSize=10).execute()
-                            members = members_result.get('memberships', [])
-                            set_cached_members(space['name'], members)
-                        
-                        participant_names = [
-                            get_person_name(m.get('member', {}).get('name')).split(' ')[0]
-                            for m in members
-                        ]
-                        space['participant_names'] = ", ".join(participant_names)
-                    except Exception as e:
-                        logger.warning(f"Could not resolve names for space {space['name']}: {e}")
-                        space['participant_names'] = "Error"
-
-        # If not verbose, return a simplified list. Otherwise, return the full objects.
-        if not verbose:
-            simplified_spaces = []
-            for space in spaces:
-                s = {
-                    "name": space.get("name"),
-                    "displayName": space.get("displayName", "Unknown"),
-                    "type": space.get("spaceType"),
-                }
-                if 'participant_names' in space:
-                    s['displayName'] = space['participant_names']
-                simplified_spaces.append(s)
-            return {"spaces": simplified_spaces}
-        else:
-            # For verbose output, just return the full (and potentially enriched) space objects
-            return {"spaces": spaces}
-
-    except Exception as e:
-        logger.error(f"Error listing chat spaces: {e}")
-        return {"error": str(e)}
+                        result = service.spaces().members().list(parent=name, pageSize=10).execute()
+                        fetched[name] = result.get('memberships', [])
+                    except Exception as exc:
+                        logger.warning(f"Could not list members for space {name}: {exc}")
+
+            for name, members in fetched.items():
+                set_cached_members(name, members)
+            return fetched
+
+        targets = [s for s in spaces if s.get('spaceType') in ['DIRECT_MESSAGE', 'GROUP_CHAT']]
+        members_by_space = {}
+        for space in targets:
+            members = await _to_thread(get_cached_members, space['name'])
+            if members:
+                members_by_space[space['name']] = members
+
+        missing = [space['name'] for space in targets if space['name'] not in members_by_space]
+        if missing:
+            members_by_space.update(await _to_thread(_fetch_members, missing))
+
+        first_names = await _resolve_person_names(
+            (m.get('member', {}).get('name')
+             for members in members_by_space.values() for m in members),
+            first_names=True,
+        )
+        for space in targets:
+            members = members_by_space.get(space['name'])
+            if members is None:
+                space['participant_names'] = "Error"
+                continue
+            space['participant_names'] = ", ".join(
+                first_names[m.get('member', {}).get('name')] for m in members
+            )
+
+    # If not verbose, return a simplified list. Otherwise, return the full objects.
+    if not verbose:
+        simplified_spaces = [
+            {
+                "name": space.get("name"),
+                "displayName": space['participant_names'] if 'participant_names' in space
+                               else space.get("displayName", "Unknown"),
+                "type": space.get("spaceType"),
+            }
+            for space in spaces
+        ]
+        return {"spaces": simplified_spaces}
+    else:
+        # For verbose output, just return the full (and potentially enriched) space objects
+        return {"spaces": spaces}
 
 
 @mcp.tool()
+@_tool_errors
 async def list_chat_members(space_id: str, limit: int = 100) -> dict[str, Any]:
     """
     List members of a Google Chat space, using a cache for name resolution.
@@ -129,39 +358,40 @@ async def list_chat_members(space_id: str, limit: int = 100) -> dict[str, Any]:
         Dict with a list of members, including their resource name, display name, and type.
         Results are cached to improve performance on subsequent calls for the same space.
     """
-    try:
-        from gwsa.sdk.people import get_person_name
-        from gwsa.sdk.cache import get_cached_members, set_cached_members
-
-        members = get_cached_members(space_id)
-        if not members:
-            chat_service = chat.get_chat_service()
-            result = chat_service.spaces().members().list(parent=space_id, pageSize=limit).execute()
-            members = result.get('memberships', [])
-            set_cached_members(space_id, members)
-        
-        simplified_members = []
-        for m in members:
-            member = m.get('member', {})
-            user_id = member.get('name')
-            # The member object from the Chat API often has a displayName.
-            # We fall back to our cached People API lookup if it's missing.
-            display_name = member.get('displayName') or get_person_name(user_id)
-                
-            simplified_members.append({
-                "name": user_id,
-                "displayName": display_name,
-                "type": member.get("type"),
-            })
-            
-        return {"members": simplified_members}
-    except Exception as e:
-        logger.error(f"Error listing chat members for space {space_id}: {e}")
-        return {"error": str(e)}
+    members = await _to_thread(get_cached_members, space_id)
+    if not members:
+        async def fetch_members():
+            result = await _aexec(
+                lambda: chat.get_chat_service().spaces().members().list(parent=space_id, pageSize=limit)
+            )
+            fetched = result.get('memberships', [])
+            await _to_thread(set_cached_members, space_id, fetched)
+            return fetched
+
+        # Concurrent misses for the same space share one members.list call
+        members = await _singleflight(('members', space_id, limit), fetch_members)
+
+    # The member object from the Chat API often has a displayName.
+    # We fall back to our cached People API lookup if it's missing.
+    fallback_names = await _resolve_person_names(
+        m.get('member', {}).get('name') for m in members
+        if not m.get('member', {}).get('displayName')
+    )
+    simplified_members = [
+        {
+            "name": member.get('name'),
+            "displayName": member.get('displayName') or fallback_names[member.get('name')],
+            "type": member.get("type"),
+        }
+        for member in (m.get('member', {}) for m in members)
+    ]
+
+    return {"members": simplified_members}
 
 
 
 @mcp.tool()
+@_tool_errors
 async def list_chat_messages(space_id: str, filter: str = None, page_size: int = 25) -> dict[str, Any]:
     """
     Lists messages in a Google Chat space, with an optional filter.
@@ -177,38 +407,42 @@ async def list_chat_messages(space_id: str, filter: str = None, page_size: int =
     Returns:
         A dictionary containing a list of matching messages with their name, text, createTime, and author, along with a nextPageToken if more results are available.
     """
-    try:
-        chat_service = chat.get_chat_service()
-        response = chat_service.spaces().messages().list(parent=space_id, filter=filter, pageSize=page_size).execute()
-        
-        # Simplify the output for clarity
-        from gwsa.sdk.people import get_person_name
-        
-        messages = response.get('messages', [])
-        simplified_messages = []
-        for message in messages:
-            sender = message.get("sender", {})
-            user_id = sender.get("name")
-            author_name = get_person_name(user_id)
-            
-            simplified_messages.append({
-                "name": message.get("name"),
-                "text": message.get("text"),
-                "createTime": message.get("createTime"),
-                "author": author_name,
-            })
-        
-        return {
-            "messages": simplified_messages,
-            "nextPageToken": response.get("nextPageToken"),
+    response = await _aexec(
+        lambda: chat.get_chat_service().spaces().messages().list(
+            parent=space_id, filter=filter, pageSize=page_size
+        )
+    )
+    
+    # Simplify the output for clarity
+    messages = response.get('messages', [])
+    author_names = await _resolve_person_names(
+        message.get("sender", {}).get("name") for message in messages
+    )
+    simplified_messages = [
+        {
+            "name": message.get("name"),
+            "text": message.get("text"),
+            "createTime": message.get("createTime"),
+            "author": author_names[message.get("sender", {}).get("name")],
         }
-    except Exception as e:
-        logger.error(f"Error listing chat messages in space '{space_id}': {e}")
-        return {"error": str(e)}
+        for message in messages
+    ]
+    
+    return {
+        "messages": simplified_messages,
+        "nextPageToken": response.get("nextPageToken"),
+    }
 
 
 @mcp.tool()
-async def search_chat_messages(space_id: str, query: str, limit: int = 100) -> dict[str, Any]:
+@_tool_errors
+async def search_chat_messages(
+    space_id: str,
+    query: str,
+    limit: int = 100,
+    max_matches: Optional[int] = None,
+    after: Optional[str] = None,
+) -> dict[str, Any]:
     """
     Search for messages in a Google Chat space containing specific text.
     
@@ -219,46 +453,73 @@ async def search_chat_messages(space_id: str, query: str, limit: int = 100) -> d
         space_id: The resource name of the space, e.g., "spaces/AAAAAAAAAAA".
         query: The text string to search for (case-insensitive).
         limit: The maximum number of recent messages to scan (default 100).
+        max_matches: Optional. Stop scanning once this many matches are found.
+        after: Optional. Only scan messages created after this RFC 3339 timestamp
+               (e.g., "2025-12-15T10:00:00Z"); applied server-side.
 
     Returns:
         A dictionary containing a list of matching messages.
     """
-    try:
-        chat_service = chat.get_chat_service()
-        results = chat_service.spaces().messages().list(parent=space_id, pageSize=limit).execute()
+    filter_query = f'createTime > "{after}"' if after else None
+    pattern = re.compile(re.escape(query), re.IGNORECASE)
+
+    # Page through messages, keeping only matches, until the scan budget
+    # is spent or enough matches are found
+    matches = []
+    scanned = 0
+    page_token = None
+    while scanned < limit:
+        results = await _aexec(
+            lambda: chat.get_chat_service().spaces().messages().list(
+                parent=space_id,
+                filter=filter_query,
+                pageSize=min(100, limit - scanned),
+                pageToken=page_token,
+            )
+        )
         messages = results.get('messages', [])
-        
-        matches = [msg for msg in messages if query.lower() in msg.get('text', '').lower()]
-        
-        from gwsa.sdk.people import get_person_name
-        
-        simplified_messages = []
-        for msg in matches:
-            author_name = get_person_name(msg.get('sender', {}).get('name'))
-            simplified_messages.append({
-                "name": msg.get("name"),
-                "text": msg.get("text"),
-                "createTime": msg.get("createTime"),
-                "author": author_name,
-            })
-
-        return {
-            "messages": simplified_messages,
-            "scanned_count": len(messages),
-            "matches_found": len(simplified_messages),
+        scanned += len(messages)
+
+        for msg in messages:
+            if pattern.search(msg.get('text', '')):
+                matches.append(msg)
+                if max_matches and len(matches) >= max_matches:
+                    break
+
+        page_token = results.get('nextPageToken')
+        if not messages or not page_token or (max_matches and len(matches) >= max_matches):
+            break
+
+    author_names = await _resolve_person_names(
+        msg.get('sender', {}).get('name') for msg in matches
+    )
+    simplified_messages = [
+        {
+            "name": msg.get("name"),
+            "text": msg.get("text"),
+            "createTime": msg.get("createTime"),
+            "author": author_names[msg.get('sender', {}).get('name')],
         }
-    except Exception as e:
-        logger.error(f"Error searching chat messages in space '{space_id}': {e}")
-        return {"error": str(e)}
+        for msg in matches
+    ]
+
+    return {
+        "messages": simplified_messages,
+        "scanned_count": scanned,
+        "matches_found": len(simplified_messages),
+    }
 
 
 @mcp.tool()
+@_tool_errors
 async def get_recent_direct_messages(limit: int = 10) -> dict[str, Any]:
     """
     Get the most recent Direct Messages (DMs).
 
     This is more convenient than filtering all spaces. It returns a sorted list
     of the most recent DMs.
+    Costs one spaces.list request per 1000 DMs (plus one batched member
+    lookup for unnamed DMs).
 
     Args:
         limit: The maximum number of recent DMs to return.
@@ -266,22 +527,19 @@ async def get_recent_direct_messages(limit: int = 10) -> dict[str, Any]:
     Returns:
         A dictionary containing a list of the most recent DM spaces.
     """
-    try:
-        from gwsa.sdk.chat import get_recent_chats
-        chats = get_recent_chats(chat_type='DIRECT_MESSAGE', limit=limit)
-        return {"direct_messages": chats}
-    except Exception as e:
-        logger.error(f"Error getting recent DMs: {e}")
-        return {"error": str(e)}
+    chats = await _to_thread(get_recent_chats, chat_type='DIRECT_MESSAGE', limit=limit)
+    return {"direct_messages": chats}
 
 
 @mcp.tool()
+@_tool_errors
 async def get_recent_group_chats(limit: int = 10) -> dict[str, Any]:
     """
     Get the most recent Group Chats.
 
     This is more convenient than filtering all spaces. It returns a sorted list
     of the most recent group chats.
+    Costs one spaces.list request per 1000 group chats.
 
     Args:
         limit: The maximum number of recent group chats to return.
@@ -289,13 +547,8 @@ async def get_recent_group_chats(limit: int = 10) -> dict[str, Any]:
     Returns:
         A dictionary containing a list of the most recent group chat spaces.
     """
-    try:
-        from gwsa.sdk.chat import get_recent_chats
-        chats = get_recent_chats(chat_type='GROUP_CHAT', limit=limit)
-        return {"group_chats": chats}
-    except Exception as e:
-        logger.error(f"Error getting recent group chats: {e}")
-        return {"error": str(e)}
+    chats = await _to_thread(get_recent_chats, chat_type='GROUP_CHAT', limit=limit)
+    return {"group_chats": chats}
 
 
 # =============================================================================
@@ -303,6 +556,7 @@ async def get_recent_group_chats(limit: int = 10) -> dict[str, Any]:
 # =============================================================================
 
 @mcp.tool()
+@_tool_errors
 async def list_profiles() -> list[dict[str, Any]]:
     """
     List all available authentication profiles.
@@ -315,25 +569,22 @@ async def list_profiles() -> list[dict[str, Any]]:
 
     Use switch_profile to change the active profile.
     """
-    try:
-        profile_list = profiles.list_profiles()
-        # Filter out sensitive info, keep only what's needed
-        safe_profiles = []
-        for p in profile_list:
-            safe_profiles.append({
-                "name": p["name"],
-                "email": p.get("email"),
-                "is_active": p["is_active"],
-                "is_adc": p["is_adc"],
-                "last_validated": p.get("last_validated"),
-            })
-        return safe_profiles
-    except Exception as e:
-        logger.error(f"Error listing profiles: {e}")
-        return [{"error": str(e)}]
+    profile_list = await _to_thread(profiles.list_profiles)
+    # Filter out sensitive info, keep only what's needed
+    return [
+        {
+            "name": p["name"],
+            "email": p.get("email"),
+            "is_active": p["is_active"],
+            "is_adc": p["is_adc"],
+            "last_validated": p.get("last_validated"),
+        }
+        for p in profile_list
+    ]
 
 
 @mcp.tool()
+@_tool_errors
 async def get_active_profile() -> Optional[dict[str, Any]]:
     """
     Get the currently active authentication profile.
@@ -341,21 +592,18 @@ async def get_active_profile() -> Optional[dict[str, Any]]:
     Returns the profile name and associated email address.
     Returns null if no profile is configured.
     """
-    try:
-        profile = profiles.get_active_profile()
-        if profile:
-            return {
-                "name": profile["name"],
-                "email": profile.get("email"),
-                "is_adc": profile["is_adc"],
-            }
-        return None
-    except Exception as e:
-        logger.error(f"Error getting active profile: {e}")
-        return {"error": str(e)}
+    profile = await _to_thread(profiles.get_active_profile)
+    if profile:
+        return {
+            "name": profile["name"],
+            "email": profile.get("email"),
+            "is_adc": profile["is_adc"],
+        }
+    return None
 
 
 @mcp.tool()
+@_tool_errors
 async def switch_profile(profile_name: str) -> dict[str, Any]:
     """
     Switch to a different authentication profile.
@@ -369,27 +617,50 @@ async def switch_profile(profile_name: str) -> dict[str, Any]:
     Returns:
         Success message or error if profile doesn't exist
     """
-    try:
-        if not profiles.profile_exists(profile_name):
-            return {
-                "error": f"Profile '{profile_name}' does not exist",
-                "hint": "Available profiles can be listed with list_profiles"
-            }
+    current = await _to_thread(profiles.get_active_profile)
+    if current and current["name"] == profile_name:
+        return {
+            "success": True,
+            "message": f"Profile '{profile_name}' is already active",
+            "email": current.get("email")
+        }
 
-        success = profiles.set_active_profile(profile_name)
-        if success:
-            # Get the profile info to return
-            profile = profiles.get_active_profile()
-            return {
-                "success": True,
-                "message": f"Switched to profile '{profile_name}'",
-                "email": profile.get("email") if profile else None
-            }
-        else:
-            return {"error": "Failed to switch profile"}
-    except Exception as e:
-        logger.error(f"Error switching profile: {e}")
-        return {"error": str(e)}
+    # set_active_profile only fails when the profile doesn't exist
+    success = await _to_thread(profiles.set_active_profile, profile_name)
+    if not success:
+        return {
+            "error": f"Profile '{profile_name}' does not exist",
+            "hint": "Available profiles can be listed with list_profiles"
+        }
+
+    _invalidate_resource_cache()
+    auth.clear_service_cache()
+    clear_memory_caches()
+    _run_in_background(_prefetch_labels())
+    metadata = await _to_thread(profiles.load_profile_metadata, profile_name)
+    return {
+        "success": True,
+        "message": f"Switched to profile '{profile_name}'",
+        "email": metadata.get("email")
+    }
+
+
+@mcp.tool()
+@_tool_errors
+async def clear_gwsa_cache() -> dict[str, Any]:
+    """
+    Clear in-memory lookups cached by the server.
+
+    Folder paths and label names are resolved to IDs once and reused for a
+    few minutes. Use this after renaming, moving or deleting folders or labels
+    outside of gwsa so the next call sees the change.
+
+    Returns:
+        Success flag and the number of caches cleared
+    """
+    cleared = clear_memory_caches()
+    _invalidate_resource_cache()
+    return {"success": True, "caches_cleared": cleared}
 
 
 # =============================================================================
@@ -397,6 +668,7 @@ async def switch_profile(profile_name: str) -> dict[str, Any]:
 # =============================================================================
 
 @mcp.tool()
+@_tool_errors
 async def search_emails(
     query: str,
     max_results: int = 25,
@@ -411,52 +683,72 @@ async def search_emails(
                "after:2024/01/01 before:2024/12/31", "label:important is:unread")
         max_results: Maximum number of messages to return (default 25, max 500)
         page_token: Pagination token from previous search result
-        format: "metadata" (fast, headers only) or "full" (includes body, slower)
+        format: "metadata" (fast: headers only) or "full" (includes body;
+                larger responses). Both fetch messages in batched requests.
 
     Returns:
         Dict with list of messages and pagination info
     """
-    try:
-        messages, metadata = mail.search_messages(
-            query=query,
-            max_results=max_results,
-            page_token=page_token,
-            format=format
-        )
-        return {
-            "messages": messages,
-            "resultSizeEstimate": metadata.get("resultSizeEstimate", 0),
-            "nextPageToken": metadata.get("nextPageToken")
-        }
-    except Exception as e:
-        logger.error(f"Error searching emails: {e}")
-        return {"error": str(e)}
+    messages, metadata = await _to_thread(
+        mail.search_messages,
+        query=query,
+        max_results=max_results,
+        page_token=page_token,
+        format=format
+    )
+    return {
+        "messages": messages,
+        "resultSizeEstimate": metadata.get("resultSizeEstimate", 0),
+        "nextPageToken": metadata.get("nextPageToken")
+    }
 
 
 @mcp.tool()
-async def read_email(message_id: str) -> dict[str, Any]:
+@_tool_errors
+async def read_email(message_id: str, format: str = "full") -> dict[str, Any]:
     """
     Read a specific email message by ID.
 
     Args:
         message_id: The Gmail message ID (obtained from search_emails)
+        format: "full" (default) for the complete message, or "metadata" for
+                headers, snippet and labels only (smaller and faster)
 
     Returns:
         Full message content including subject, from, to, date, body (text and html),
-        snippet, labels, and attachments (with filename, mimeType, size, attachmentId)
+        snippet, labels, and attachments (with filename, mimeType, size, attachmentId).
+        With format="metadata", body text/html are null and attachments is empty.
     """
-    try:
-        message = mail.read_message(message_id)
-        # Remove raw field to reduce output size
-        if "raw" in message:
-            del message["raw"]
-        return message
-    except Exception as e:
-        logger.error(f"Error reading email: {e}")
-        return {"error": str(e)}
+    return await _to_thread(mail.read_message, message_id, format=format)
+
+
+@mcp.tool()
+@_tool_errors
+async def read_emails(message_ids: list[str]) -> dict[str, Any]:
+    """
+    Read several email messages in one call.
+
+    Prefer this over calling read_email repeatedly: messages are fetched with
+    batched Gmail API requests instead of one round-trip per message.
+
+    Args:
+        message_ids: List of Gmail message IDs (obtained from search_emails)
+
+    Returns:
+        Dict with "messages" keyed by message ID (same content as read_email),
+        plus "missing" listing any IDs that could not be retrieved
+    """
+    results = await _to_thread(mail.read_messages, message_ids)
+    messages = {msg["id"]: msg for msg in results}
+    return {
+        "messages": messages,
+        "count": len(messages),
+        "missing": [mid for mid in message_ids if mid not in messages],
+    }
 
 
 @mcp.tool()
+@_tool_errors
 async def add_email_label(message_id: str, label_name: str) -> dict[str, Any]:
     """
     Add a label to an email message.
@@ -470,20 +762,17 @@ async def add_email_label(message_id: str, label_name: str) -> dict[str, Any]:
     Returns:
         Updated message with new labels
     """
-    try:
-        result = mail.add_label(message_id, label_name)
-        return {
-            "success": True,
-            "message_id": message_id,
-            "label_added": label_name,
-            "current_labels": result.get("labelIds", [])
-        }
-    except Exception as e:
-        logger.error(f"Error adding label: {e}")
-        return {"error": str(e)}
+    result = await _to_thread(mail.add_label, message_id, label_name)
+    return {
+        "success": True,
+        "message_id": message_id,
+        "label_added": label_name,
+        "current_labels": result.get("labelIds", [])
+    }
 
 
 @mcp.tool()
+@_tool_errors
 async def remove_email_label(message_id: str, label_name: str) -> dict[str, Any]:
     """
     Remove a label from an email message.
@@ -495,20 +784,17 @@ async def remove_email_label(message_id: str, label_name: str) -> dict[str, Any]
     Returns:
         Updated message with remaining labels
     """
-    try:
-        result = mail.remove_label(message_id, label_name)
-        return {
-            "success": True,
-            "message_id": message_id,
-            "label_removed": label_name,
-            "current_labels": result.get("labelIds", [])
-        }
-    except Exception as e:
-        logger.error(f"Error removing label: {e}")
-        return {"error": str(e)}
+    result = await _to_thread(mail.remove_label, message_id, label_name)
+    return {
+        "success": True,
+        "message_id": message_id,
+        "label_removed": label_name,
+        "current_labels": result.get("labelIds", [])
+    }
 
 
 @mcp.tool()
+@_tool_errors
 async def list_email_labels() -> list[dict[str, Any]]:
     """
     List all Gmail labels available in the current account.
@@ -516,23 +802,16 @@ async def list_email_labels() -> list[dict[str, Any]]:
     Returns:
         List of labels with their IDs, names, and types (system or user)
     """
-    try:
-        labels = mail.list_labels()
-        # Simplify output
-        simplified = []
-        for label in labels:
-            simplified.append({
-                "id": label["id"],
-                "name": label["name"],
-                "type": label.get("type", "user")
-            })
-        return simplified
-    except Exception as e:
-        logger.error(f"Error listing labels: {e}")
-        return [{"error": str(e)}]
+    labels = await _to_thread(mail.list_labels)
+    # Simplify output
+    return [
+        {"id": label["id"], "name": label["name"], "type": label.get("type", "user")}
+        for label in labels
+    ]
 
 
 @mcp.tool()
+@_tool_errors(success_flag=True)
 async def send_email(
     to: str,
     subject: str,
@@ -555,27 +834,25 @@ async def send_email(
     Returns:
         Dict with message ID and thread ID of the sent email
     """
-    try:
-        result = mail.send_message(
-            to=to,
-            subject=subject,
-            body=body,
-            cc=cc,
-            bcc=bcc,
-            html_body=html_body,
-        )
-        return {
-            "success": True,
-            "message_id": result.get("id"),
-            "thread_id": result.get("threadId"),
-            "message": f"Email sent successfully to {to}",
-        }
-    except Exception as e:
-        logger.error(f"Error sending email: {e}")
-        return {"success": False, "error": str(e)}
+    result = await _to_thread(
+        mail.send_message,
+        to=to,
+        subject=subject,
+        body=body,
+        cc=cc,
+        bcc=bcc,
+        html_body=html_body,
+    )
+    return {
+        "success": True,
+        "message_id": result.get("id"),
+        "thread_id": result.get("threadId"),
+        "message": f"Email sent successfully to {to}",
+    }
 
 
 @mcp.tool()
+@_tool_errors(success_flag=True)
 async def reply_email(
     message_id: str,
     body: str,
@@ -594,26 +871,24 @@ async def reply_email(
     Returns:
         Dict with message/draft ID, thread ID, and success status
     """
-    try:
-        result = mail.reply_message(
-            reply_to_message_id=message_id,
-            body=body,
-            include_quote=include_quote,
-            as_draft=as_draft,
-        )
-        return {
-            "success": True,
-            "id": result.get("id"),
-            "thread_id": result.get("threadId"),
-            "is_draft": result.get("is_draft", False),
-            "message": "Reply draft created" if result.get("is_draft") else "Reply sent successfully",
-        }
-    except Exception as e:
-        logger.error(f"Error replying to email: {e}")
-        return {"success": False, "error": str(e)}
+    result = await _to_thread(
+        mail.reply_message,
+        reply_to_message_id=message_id,
+        body=body,
+        include_quote=include_quote,
+        as_draft=as_draft,
+    )
+    return {
+        "success": True,
+        "id": result.get("id"),
+        "thread_id": result.get("threadId"),
+        "is_draft": result.get("is_draft", False),
+        "message": "Reply draft created" if result.get("is_draft") else "Reply sent successfully",
+    }
 
 
 @mcp.tool()
+@_tool_errors(success_flag=True)
 async def create_email_draft(
     to: str,
     subject: str,
@@ -636,26 +911,24 @@ async def create_email_draft(
     Returns:
         Dict with draft ID and message details
     """
-    try:
-        result = mail.create_draft(
-            to=to,
-            subject=subject,
-            body=body,
-            cc=cc,
-            bcc=bcc,
-            html_body=html_body,
-        )
-        return {
-            "success": True,
-            "draft_id": result.get("id"),
-            "message": "Draft created successfully",
-        }
-    except Exception as e:
-        logger.error(f"Error creating email draft: {e}")
-        return {"success": False, "error": str(e)}
+    result = await _to_thread(
+        mail.create_draft,
+        to=to,
+        subject=subject,
+        body=body,
+        cc=cc,
+        bcc=bcc,
+        html_body=html_body,
+    )
+    return {
+        "success": True,
+        "draft_id": result.get("id"),
+        "message": "Draft created successfully",
+    }
 
 
 @mcp.tool()
+@_tool_errors(success_flag=True)
 async def download_email_attachment(
     message_id: str,
     attachment_id: str,
@@ -672,28 +945,20 @@ async def download_email_attachment(
     Returns:
         Dict with success status, file path, and size in bytes
     """
-    try:
-        result = mail.get_attachment(message_id, attachment_id)
-        data = result['data']
-        size = result['size']
+    # Decode and write to disk off the event loop, chunk by chunk
+    size = await _to_thread(mail.save_attachment, message_id, attachment_id, save_path)
 
-        # Write the binary data to the specified path
-        with open(save_path, 'wb') as f:
-            f.write(data)
-
-        return {
-            "success": True,
-            "message_id": message_id,
-            "attachment_id": attachment_id,
-            "saved_to": save_path,
-            "size_bytes": size
-        }
-    except Exception as e:
-        logger.error(f"Error downloading attachment: {e}")
-        return {"success": False, "error": str(e)}
+    return {
+        "success": True,
+        "message_id": message_id,
+        "attachment_id": attachment_id,
+        "saved_to": save_path,
+        "size_bytes": size
+    }
 
 
 @mcp.tool()
+@_tool_errors
 async def get_email_thread(thread_id: str) -> dict[str, Any]:
     """
     Retrieve a full Gmail thread, including all its messages.
@@ -704,12 +969,8 @@ async def get_email_thread(thread_id: str) -> dict[str, Any]:
     Returns:
         Dict containing thread details, with a list of simplified messages.
     """
-    try:
-        thread = mail.get_thread(thread_id=thread_id)
-        return thread
-    except Exception as e:
-        logger.error(f"Error getting email thread '{thread_id}': {e}")
-        return {"error": str(e)}
+    thread = await _to_thread(mail.get_thread, thread_id=thread_id)
+    return thread
 
 
 # =============================================================================
@@ -717,6 +978,7 @@ async def get_email_thread(thread_id: str) -> dict[str, Any]:
 # =============================================================================
 
 @mcp.tool()
+@_tool_errors
 async def list_docs(max_results: int = 25, query: Optional[str] = None) -> dict[str, Any]:
     """
     NOTE: This tool works ONLY with remote Google Docs resources in the cloud.
@@ -728,15 +990,12 @@ async def list_docs(max_results: int = 25, query: Optional[str] = None) -> dict[
     Returns:
         Dict with list of documents including id, title, url, and timestamps
     """
-    try:
-        result = docs.list_documents(max_results=max_results, query=query)
-        return result
-    except Exception as e:
-        logger.error(f"Error listing docs: {e}")
-        return {"error": str(e)}
+    result = await _to_thread(docs.list_documents, max_results=max_results, query=query)
+    return result
 
 
 @mcp.tool()
+@_tool_errors
 async def create_doc(
     title: str,
     body_text: Optional[str] = None,
@@ -755,15 +1014,12 @@ async def create_doc(
     Returns:
         Dict with document id, title, and url
     """
-    try:
-        result = docs.create_document(title=title, body_text=body_text, folder_id=folder_id)
-        return result
-    except Exception as e:
-        logger.error(f"Error creating doc: {e}")
-        return {"error": str(e)}
+    result = await _to_thread(docs.create_document, title=title, body_text=body_text, folder_id=folder_id)
+    return result
 
 
 @mcp.tool()
+@_tool_errors
 async def read_doc(doc_id: str, format: str = "content") -> dict[str, Any]:
     """
     Read a Google Doc by ID.
@@ -778,38 +1034,19 @@ async def read_doc(doc_id: str, format: str = "content") -> dict[str, Any]:
     Returns:
         Document content in requested format
     """
-    try:
-        if format == "text":
-            text = docs.get_document_text(doc_id)
-            return {"text": text}
-        elif format == "raw":
-            doc = docs.get_document(doc_id)
-            return doc
-        else:
-            content = docs.get_document_content(doc_id)
-            return content
-    except (LocalPathError, InvalidDocIdError) as e:
-        return {"error": str(e)}
-    except ValueError as e:
-        logger.error(f"ValueError reading doc: {e}")
-        return {"error": str(e)}
-    except HttpError as e:
-        if e.resp.status == 403:
-            logger.error(f"Permission error reading doc: {e}")
-            return {
-                "error": "The caller does not have permission.",
-                "details": str(e),
-                "hint": "The active gwsa profile may not have access to this document. "
-                        "Try switching profiles with the `switch_profile` tool or "
-                        "running `gwsa setup --new-user` to re-authenticate."
-            }
-        raise
-    except Exception as e:
-        logger.error(f"Error reading doc: {e}")
-        return {"error": str(e)}
+    if format == "text":
+        text = await _to_thread(docs.get_document_text, doc_id)
+        return {"text": text}
+    elif format == "raw":
+        doc = await _to_thread(docs.get_document, doc_id)
+        return doc
+    else:
+        content = await _to_thread(docs.get_document_content, doc_id)
+        return content
 
 
 @mcp.tool()
+@_tool_errors
 async def append_to_doc(doc_id: str, text: str) -> dict[str, Any]:
     """
     Append text to the end of a Google Doc.
@@ -823,21 +1060,16 @@ async def append_to_doc(doc_id: str, text: str) -> dict[str, Any]:
     Returns:
         Success status and document revision info
     """
-    try:
-        result = docs.append_text(doc_id, text)
-        return {
-            "success": True,
-            "document_id": doc_id,
-            "write_control": result.get("writeControl", {})
-        }
-    except (LocalPathError, InvalidDocIdError) as e:
-        return {"error": str(e)}
-    except Exception as e:
-        logger.error(f"Error appending to doc: {e}")
-        return {"error": str(e)}
+    result = await _to_thread(docs.append_text, doc_id, text)
+    return {
+        "success": True,
+        "document_id": doc_id,
+        "write_control": result.get("writeControl", {})
+    }
 
 
 @mcp.tool()
+@_tool_errors
 async def insert_in_doc(doc_id: str, text: str, index: int = 1) -> dict[str, Any]:
     """
     Insert text at a specific position in a Google Doc.
@@ -852,22 +1084,17 @@ async def insert_in_doc(doc_id: str, text: str, index: int = 1) -> dict[str, Any
     Returns:
         Success status and document revision info
     """
-    try:
-        result = docs.insert_text(doc_id, text, index=index)
-        return {
-            "success": True,
-            "document_id": doc_id,
-            "inserted_at_index": index,
-            "write_control": result.get("writeControl", {})
-        }
-    except (LocalPathError, InvalidDocIdError) as e:
-        return {"error": str(e)}
-    except Exception as e:
-        logger.error(f"Error inserting in doc: {e}")
-        return {"error": str(e)}
+    result = await _to_thread(docs.insert_text, doc_id, text, index=index)
+    return {
+        "success": True,
+        "document_id": doc_id,
+        "inserted_at_index": index,
+        "write_control": result.get("writeControl", {})
+    }
 
 
 @mcp.tool()
+@_tool_errors
 async def replace_in_doc(
     doc_id: str,
     find_text: str,
@@ -888,24 +1115,18 @@ async def replace_in_doc(
     Returns:
         Number of occurrences replaced
     """
-    try:
-        result = docs.replace_text(doc_id, find_text, replace_with, match_case=match_case)
-        replies = result.get("replies", [])
-        occurrences = 0
-        if replies:
-            occurrences = replies[0].get("replaceAllText", {}).get("occurrencesChanged", 0)
-        return {
-            "success": True,
-            "document_id": doc_id,
-            "occurrences_replaced": occurrences,
-            "find_text": find_text,
-            "replace_with": replace_with
-        }
-    except (LocalPathError, InvalidDocIdError) as e:
-        return {"error": str(e)}
-    except Exception as e:
-        logger.error(f"Error replacing in doc: {e}")
-        return {"error": str(e)}
+    result = await _to_thread(docs.replace_text, doc_id, find_text, replace_with, match_case=match_case)
+    replies = result.get("replies", [])
+    occurrences = 0
+    if replies:
+        occurrences = replies[0].get("replaceAllText", {}).get("occurrencesChanged", 0)
+    return {
+        "success": True,
+        "document_id": doc_id,
+        "occurrences_replaced": occurrences,
+        "find_text": find_text,
+        "replace_with": replace_with
+    }
 
 
 # =============================================================================
@@ -913,31 +1134,34 @@ async def replace_in_doc(
 # =============================================================================
 
 @mcp.tool()
+@_tool_errors
 async def drive_list_folder(
     folder_id: Optional[str] = None,
-    max_results: int = 100
+    max_results: int = 100,
+    page_token: Optional[str] = None
 ) -> dict[str, Any]:
     """
     List contents of a Google Drive folder.
 
     Args:
         folder_id: Folder ID to list. Use None for My Drive root.
-        max_results: Maximum number of items to return (default 100)
+        max_results: Maximum number of items to return (default 100, max 1000)
+        page_token: Token from a previous call's next_page_token to get the next page
 
     Returns:
-        Dict with list of files/folders including id, name, type, mime_type, modified_time, size.
+        Dict with list of files/folders including id, name, type, mime_type, modified_time, size,
+        and next_page_token when more items remain.
         For shortcuts (mime_type: application/vnd.google-apps.shortcut), also includes
         target_id and target_mime_type - use target_id with drive_download to get the actual file.
     """
-    try:
-        result = drive.list_folder(folder_id=folder_id, max_results=max_results)
-        return result
-    except Exception as e:
-        logger.error(f"Error listing folder: {e}")
-        return {"error": str(e)}
+    result = await _to_thread(
+        drive.list_folder, folder_id=folder_id, max_results=max_results, page_token=page_token
+    )
+    return result
 
 
 @mcp.tool()
+@_tool_errors
 async def drive_create_folder(
     name: str,
     parent_id: Optional[str] = None
@@ -952,15 +1176,12 @@ async def drive_create_folder(
     Returns:
         Dict with folder id, name, and url
     """
-    try:
-        result = drive.create_folder(name=name, parent_id=parent_id)
-        return result
-    except Exception as e:
-        logger.error(f"Error creating folder: {e}")
-        return {"error": str(e)}
+    result = await _to_thread(drive.create_folder, name=name, parent_id=parent_id)
+    return result
 
 
 @mcp.tool()
+@_tool_errors
 async def drive_upload(
     local_path: str,
     folder_id: Optional[str] = None,
@@ -977,15 +1198,12 @@ async def drive_upload(
     Returns:
         Dict with file id, name, and url
     """
-    try:
-        result = drive.upload_file(local_path=local_path, folder_id=folder_id, name=name)
-        return result
-    except Exception as e:
-        logger.error(f"Error uploading file: {e}")
-        return {"error": str(e)}
+    result = await _to_thread(drive.upload_file, local_path=local_path, folder_id=folder_id, name=name)
+    return result
 
 
 @mcp.tool()
+@_tool_errors
 async def drive_update(
     file_id: str,
     local_path: str,
@@ -1002,15 +1220,12 @@ async def drive_update(
     Returns:
         Dict with updated file metadata.
     """
-    try:
-        result = drive.update_file(file_id=file_id, local_path=local_path, new_name=name)
-        return result
-    except Exception as e:
-        logger.error(f"Error updating file: {e}")
-        return {"error": str(e)}
+    result = await _to_thread(drive.update_file, file_id=file_id, local_path=local_path, new_name=name)
+    return result
 
 
 @mcp.tool()
+@_tool_errors
 async def drive_download(
     file_id: str,
     save_path: str
@@ -1018,6 +1233,9 @@ async def drive_download(
     """
     Download a file from Google Drive.
 
+    Google Docs, Sheets, Slides and Drawings are exported (to .docx, .xlsx,
+    .pptx and .png respectively); other files are saved as stored.
+
     Args:
         file_id: The Drive file ID to download
         save_path: Local path where the file should be saved
@@ -1025,15 +1243,12 @@ async def drive_download(
     Returns:
         Dict with success status, file path, and size in bytes
     """
-    try:
-        result = drive.download_file(file_id=file_id, save_path=save_path)
-        return result
-    except Exception as e:
-        logger.error(f"Error downloading file: {e}")
-        return {"error": str(e)}
+    result = await _to_thread(drive.download_file, file_id=file_id, save_path=save_path)
+    return result
 
 
 @mcp.tool()
+@_tool_errors
 async def drive_find_folder(
     path: str,
     drive_id: str = "my_drive",
@@ -1051,19 +1266,14 @@ async def drive_find_folder(
     Returns:
         Dict with folder id, name, and path. Returns error if not found or ambiguous.
     """
-    try:
-        result = drive.find_folder_by_path(path, drive=drive_id, folder_id=folder_id)
-        if result:
-            return result
-        return {"error": f"Folder not found: {path}"}
-    except drive.AmbiguousFolderError as e:
-        return {"error": str(e)}
-    except Exception as e:
-        logger.error(f"Error finding folder: {e}")
-        return {"error": str(e)}
+    result = await _to_thread(drive.find_folder_by_path, path, drive=drive_id, folder_id=folder_id)
+    if result:
+        return result
+    return {"error": f"Folder not found: {path}"}
 
 
 @mcp.tool()
+@_tool_errors
 async def drive_search_folders(
     name: str,
     match: str = "contains",
@@ -1083,32 +1293,58 @@ async def drive_search_folders(
         Dict with 'folders' list. Each folder has: id, name, parents (list of IDs),
         created_time, modified_time, drive_id (None if in My Drive).
     """
-    try:
-        if match not in ("contains", "exact"):
-            return {"error": f"Invalid match type: {match}. Use 'contains' or 'exact'."}
-        results = drive.search_folders(name, match=match, limit=limit)
-        return {"folders": results, "count": len(results)}
-    except Exception as e:
-        logger.error(f"Error searching folders: {e}")
-        return {"error": str(e)}
+    if match not in ("contains", "exact"):
+        return {"error": f"Invalid match type: {match}. Use 'contains' or 'exact'."}
+    results = await _to_thread(drive.search_folders, name, match=match, limit=limit)
+    return {"folders": results, "count": len(results)}
 
 
 # =============================================================================
 # Resources (read-only data access)
 # =============================================================================
 
+# Encoded resource payloads, keyed by (resource, active profile):
+# key -> (monotonic timestamp, JSON string)
+_resource_cache: dict[tuple[str, Optional[str]], tuple[float, str]] = {}
+
+
+def _invalidate_resource_cache() -> None:
+    """Drop cached resource payloads (e.g. after the active profile changes)."""
+    _resource_cache.clear()
+
+
+async def _cached_resource(
+    name: str,
+    ttl: float,
+    producer: Callable[[], Awaitable[Any]],
+) -> str:
+    """Return a resource's JSON encoding, reusing it for up to ttl seconds.
+
+    The producer is a tool's undecorated body (__wrapped__), so it returns
+    plain data or raises rather than returning an error payload. Exceptions
+    propagate (FastMCP reports them as resource errors), so failures are
+    never cached.
+    """
+    key = (name, await _to_thread(profiles.get_active_profile_name))
+    cached = _resource_cache.get(key)
+    if cached and time.monotonic() - cached[0] < ttl:
+        return cached[1]
+
+    encoded = _dumps(await producer())
+    _resource_cache[key] = (time.monotonic(), encoded)
+    return encoded
+
+
 @mcp.resource("gwsa://profiles")
 async def profiles_resource() -> str:
     """List of available authentication profiles."""
-    result = await list_profiles()
-    return json.dumps(result, indent=2)
+    return await _cached_resource("profiles", 10, list_profiles.__wrapped__)
 
 
 @mcp.resource("gwsa://labels")
 async def labels_resource() -> str:
     """List of Gmail labels in the current account."""
-    result = await list_email_labels()
-    return json.dumps(result, indent=2)
+    return await _cached_resource("labels", 30, list_email_labels.__wrapped__)
 
 
 # =============================================================================
@@ -1116,8 +1352,11 @@ async def labels_resource() -> str:
 # =============================================================================
 
 def run_server():
-    """Run the MCP server with stdio transport."""
-    mcp.run()
+    """Run the MCP server with stdio transport (on uvloop when it is installed)."""
+    if uvloop is None:
+        mcp.run()
+    else:
+        anyio.run(mcp.run_stdio_async, backend_options={"use_uvloop": True})
 
 
 if __name__ == "__main__":
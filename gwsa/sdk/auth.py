@@ -6,6 +6,8 @@ the active profile configuration.
 
 import os
 import logging
+import functools
+import threading
 from typing import Tuple, Optional, Any
 
 logger = logging.getLogger(__name__)
@@ -56,17 +58,39 @@ def resolve_scope_alias(alias: str) -> str:
     return SCOPE_ALIASES.get(alias, alias)
 
 
-def get_effective_scopes(granted_scopes: list) -> set:
+def _implication_closure(implications: dict) -> dict:
+    """Expand implication rules transitively (X implies Y implies Z => X implies Z)."""
+    closure = {scope: {scope, *implied} for scope, implied in implications.items()}
+    changed = True
+    while changed:
+        changed = False
+        for implied in closure.values():
+            expanded = set().union(*(closure.get(scope, {scope}) for scope in implied))
+            if expanded != implied:
+                implied |= expanded
+                changed = True
+    return {scope: frozenset(implied) for scope, implied in closure.items()}
+
+
+# Each scope mapped to itself plus everything it implies, directly or indirectly
+_SCOPE_CLOSURE = _implication_closure(SCOPE_IMPLICATIONS)
+
+
+@functools.lru_cache(maxsize=64)
+def _effective_scopes(granted_scopes: frozenset) -> frozenset:
+    return frozenset().union(granted_scopes, *(
+        _SCOPE_CLOSURE[scope] for scope in granted_scopes if scope in _SCOPE_CLOSURE
+    ))
+
+
+def get_effective_scopes(granted_scopes: list) -> frozenset:
     """
     Get effective scopes including implied ones.
 
     For example, if gmail.modify is granted, gmail.readonly is implied.
+    Results are memoized per distinct set of granted scopes.
     """
-    effective = set(granted_scopes)
-    for scope in granted_scopes:
-        implied = SCOPE_IMPLICATIONS.get(scope, [])
-        effective.update(implied)
-    return effective
+    return _effective_scopes(frozenset(granted_scopes))
 
 
 def has_scope(granted_scopes: list, required_scope: str) -> bool:
@@ -140,6 +164,66 @@ def get_credentials(
     raise ValueError("No active profile configured. Run 'gwsa setup' or 'gwsa profiles add' first.")
 
 
+# Built API services, per thread (httplib2 connections are not thread-safe),
+# keyed by (profile name, use_adc, api, version)
+_service_cache = threading.local()
+_cache_generation = 0
+
+
+def clear_service_cache() -> None:
+    """Discard cached API services in all threads (e.g. after a profile switch)."""
+    global _cache_generation
+    _cache_generation += 1
+
+
+def get_service(
+    api: str,
+    version: str,
+    profile: str = None,
+    use_adc: bool = False,
+    **build_kwargs,
+) -> Any:
+    """
+    Get an authenticated Google API service object, reusing earlier ones.
+
+    Services are cached per profile and API and reused by later calls on the
+    same thread, so credentials are loaded and the discovery document parsed
+    once rather than on every call. Each service owns an authorized
+    httplib2 connection, so reusing it also reuses the open HTTPS connection
+    instead of paying a new TLS handshake per request. The credentials
+    refresh themselves when the access token expires.
+
+    Args:
+        api: API name, e.g. "gmail"
+        version: API version, e.g. "v1"
+        profile: Optional profile name to use (defaults to active profile)
+        use_adc: Force use of Application Default Credentials
+        **build_kwargs: Extra arguments for googleapiclient's build()
+
+    Returns:
+        API service object
+
+    Raises:
+        ValueError: If no profile configured
+        Exception: If authentication fails
+    """
+    from googleapiclient.discovery import build
+    from .profiles import get_active_profile_name
+
+    if getattr(_service_cache, "generation", None) != _cache_generation:
+        _service_cache.services = {}
+        _service_cache.generation = _cache_generation
+
+    key = (profile or get_active_profile_name(), use_adc, api, version)
+    service = _service_cache.services.get(key)
+    if service is None:
+        creds, source = get_credentials(profile=profile, use_adc=use_adc)
+        logger.debug(f"Building {api} {version} service using credentials from: {source}")
+        service = build(api, version, credentials=creds, **build_kwargs)
+        _service_cache.services[key] = service
+    return service
+
+
 def refresh_credentials(creds) -> bool:
     """
     Refresh credentials if needed.
@@ -164,6 +248,16 @@ def refresh_credentials(creds) -> bool:
     return True
 
 
+TOKENINFO_URL = "https://www.googleapis.com/oauth2/v3/tokeninfo"
+
+
+@functools.lru_cache(maxsize=1)
+def _http_session():
+    """Shared requests session, so token refreshes and tokeninfo calls reuse connections."""
+    import requests
+    return requests.Session()
+
+
 def get_token_info(creds) -> dict:
     """
     Use Google's tokeninfo endpoint to get info about a credential.
@@ -176,30 +270,27 @@ def get_token_info(creds) -> dict:
     Raises:
         Exception on network error or if token is invalid.
     """
-    import urllib.request
-    import json
     from google.auth.transport.requests import Request
 
+    session = _http_session()
     if not creds.valid and hasattr(creds, 'refresh_token') and creds.refresh_token:
-        creds.refresh(Request())
+        creds.refresh(Request(session=session))
 
     access_token = creds.token
     if not access_token:
         raise ValueError("Credentials object has no access token.")
 
-    url = f"https://www.googleapis.com/oauth2/v3/tokeninfo?access_token={access_token}"
-
-    with urllib.request.urlopen(url) as response:
-        if response.status == 200:
-            data = json.loads(response.read().decode())
-            return {
-                "scopes": data.get("scope", "").split(" "),
-                "email": data.get("email"),
-            }
-        else:
-            raise ConnectionError(
-                f"Tokeninfo endpoint failed with status {response.status}"
-            )
+    response = session.get(TOKENINFO_URL, params={"access_token": access_token}, timeout=10)
+    if response.status_code != 200:
+        raise ConnectionError(
+            f"Tokeninfo endpoint failed with status {response.status_code}"
+        )
+
+    data = response.json()
+    return {
+        "scopes": data.get("scope", "").split(" "),
+        "email": data.get("email"),
+    }
 
 
 # Feature scope definitions
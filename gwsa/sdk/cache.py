@@ -1,74 +1,178 @@
 import os
 import json
-import tempfile
+import atexit
+import time
 import logging
+import functools
+import threading
+from collections import OrderedDict
 from datetime import datetime, timedelta
 
+from .profiles import get_active_profile_name
+
+try:
+    import orjson  # Optional: faster cache file (de)serialization when installed
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
-CACHE_DIR = os.path.join(tempfile.gettempdir(), 'gwsa_cache')
+
+def _default_cache_dir():
+    """Persistent cache location: $GWSA_CACHE_DIR, else the XDG cache directory."""
+    env_path = os.getenv('GWSA_CACHE_DIR')
+    if env_path:
+        return env_path
+    xdg_cache = os.getenv('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(xdg_cache, 'gworkspace-access')
+
+CACHE_DIR = _default_cache_dir()
 PROFILES_CACHE_FILE = os.path.join(CACHE_DIR, 'profiles.json')
 MEMBERS_CACHE_FILE = os.path.join(CACHE_DIR, 'members.json')
+LABELS_CACHE_FILE = os.path.join(CACHE_DIR, 'labels.json')
+TRIAGE_CACHE_FILE = os.path.join(CACHE_DIR, 'triage.json')
 CACHE_TTL = timedelta(days=1)
 
-def _ensure_cache_dir():
-    """Ensure the cache directory exists."""
+# Cache files map key -> [cached_at_epoch, data]; older files used
+# key -> {'data': ..., 'cached_at': ISO-8601} and are migrated on read
+CACHE_FORMAT_VERSION = 2
+_VERSION_KEY = '__v'
+
+# Number of unsaved changes to a cache file before it is written to disk;
+# anything still pending is written at interpreter exit
+FLUSH_THRESHOLD = 50
+
+# Serializes access when callers hit the cache from worker threads
+_cache_lock = threading.RLock()
+
+# Cache files loaded into memory, and the unsaved change count for each
+_caches = {}
+_dirty = {}
+
+def _ensure_cache_dir(cache_file):
+    """Ensure the directory holding a cache file exists."""
+    cache_dir = os.path.dirname(cache_file)
     try:
-        os.makedirs(CACHE_DIR, exist_ok=True)
+        os.makedirs(cache_dir, exist_ok=True)
     except OSError as e:
-        logger.error(f"Failed to create cache directory at {CACHE_DIR}: {e}")
+        logger.error(f"Failed to create cache directory at {cache_dir}: {e}")
         raise
 
-def _load_cache(cache_file):
-    """Load a specific cache file from disk."""
-    _ensure_cache_dir()
+def _read_from_disk(cache_file):
+    """Read a specific cache file from disk."""
     if not os.path.exists(cache_file):
         logger.debug(f"Cache file {cache_file} not found, returning empty cache.")
         return {}
     try:
-        with open(cache_file, 'r') as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError) as e:
+        with open(cache_file, 'rb') as f:
+            cache = orjson.loads(f.read()) if orjson is not None else json.load(f)
+    except (ValueError, IOError) as e:
         logger.warning(f"Error loading cache file {cache_file}, returning empty cache: {e}")
         return {}
+    if cache.get(_VERSION_KEY) != CACHE_FORMAT_VERSION:
+        cache = _migrate_cache(cache)
+    return cache
+
+def _migrate_cache(cache):
+    """Convert legacy {'data', 'cached_at'} entries to [cached_at_epoch, data]."""
+    migrated = {_VERSION_KEY: CACHE_FORMAT_VERSION}
+    for key, item in cache.items():
+        if isinstance(item, dict) and 'cached_at' in item:
+            try:
+                cached_at = datetime.fromisoformat(item['cached_at']).timestamp()
+            except (TypeError, ValueError):
+                continue
+            migrated[key] = [cached_at, item.get('data')]
+    return migrated
+
+def _load_cache(cache_file):
+    """Return the in-memory copy of a cache file, reading it on first use."""
+    with _cache_lock:
+        if cache_file not in _caches:
+            cache = _read_from_disk(cache_file)
+            cache[_VERSION_KEY] = CACHE_FORMAT_VERSION
+            _caches[cache_file] = cache
+        return _caches[cache_file]
 
 def _save_cache(cache_data, cache_file):
-    """Save data to a specific cache file on disk."""
-    _ensure_cache_dir()
+    """Atomically write data to a specific cache file on disk."""
+    _ensure_cache_dir(cache_file)
+    tmp_file = f"{cache_file}.{os.getpid()}.tmp"
     try:
-        with open(cache_file, 'w') as f:
-            json.dump(cache_data, f, indent=2)
+        if orjson is not None:
+            payload = orjson.dumps(cache_data)
+        else:
+            payload = json.dumps(cache_data, separators=(',', ':')).encode()
+        with open(tmp_file, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_file, cache_file)
         logger.debug(f"Cache saved successfully to {cache_file}.")
     except IOError as e:
         logger.error(f"Error saving cache file to {cache_file}: {e}")
 
+def _is_expired(entry, now):
+    """True if a [cached_at_epoch, data] entry is older than CACHE_TTL."""
+    return now - entry[0] > CACHE_TTL.total_seconds()
+
+def _flush(cache_file):
+    """
+    Write a cache file's pending changes, keeping entries other processes added.
+
+    Expired entries on disk are dropped rather than merged back, so entries
+    removed from memory as expired do not reappear and the file can shrink.
+    """
+    with _cache_lock:
+        if not _dirty.pop(cache_file, 0):
+            return
+        now = time.time()
+        merged = {
+            key: entry for key, entry in _read_from_disk(cache_file).items()
+            if key == _VERSION_KEY or not _is_expired(entry, now)
+        }
+        merged.update(_caches[cache_file])
+        _caches[cache_file] = merged
+        _save_cache(merged, cache_file)
+
+def _mark_dirty(cache_file):
+    """Record a change to a cache file, writing it once FLUSH_THRESHOLD is reached."""
+    with _cache_lock:
+        _dirty[cache_file] = _dirty.get(cache_file, 0) + 1
+        if _dirty[cache_file] >= FLUSH_THRESHOLD:
+            _flush(cache_file)
+
+def flush_caches():
+    """Write every cache file with unsaved changes to disk."""
+    with _cache_lock:
+        for cache_file in list(_dirty):
+            _flush(cache_file)
+
+atexit.register(flush_caches)
+
 def get_cached_item(key, cache_file):
     """Generic function to get an item from a specified cache file."""
-    cache = _load_cache(cache_file)
-    if key not in cache:
-        logger.debug(f"Item '{key}' not found in cache file {cache_file}.")
-        return None
+    with _cache_lock:
+        cache = _load_cache(cache_file)
+        if key not in cache or key == _VERSION_KEY:
+            logger.debug(f"Item '{key}' not found in cache file {cache_file}.")
+            return None
+
+        entry = cache[key]
+
+        if _is_expired(entry, time.time()):
+            logger.debug(f"Cache for '{key}' in {cache_file} is expired.")
+            del cache[key]
+            _mark_dirty(cache_file)
+            return None
 
-    cached_item = cache[key]
-    cached_at = datetime.fromisoformat(cached_item.get('cached_at', '1970-01-01'))
-    
-    if datetime.now() - cached_at > CACHE_TTL:
-        logger.debug(f"Cache for '{key}' in {cache_file} is expired.")
-        del cache[key]
-        _save_cache(cache, cache_file)
-        return None
-    
     logger.debug(f"Item '{key}' found in cache {cache_file}, still valid.")
-    return cached_item.get('data')
+    return entry[1]
 
 def set_cached_item(key, data, cache_file):
     """Generic function to save an item to a specified cache file."""
-    cache = _load_cache(cache_file)
-    cache[key] = {
-        'data': data,
-        'cached_at': datetime.now().isoformat()
-    }
-    _save_cache(cache, cache_file)
+    with _cache_lock:
+        cache = _load_cache(cache_file)
+        cache[key] = [time.time(), data]
+        _mark_dirty(cache_file)
     logger.debug(f"Item '{key}' saved to cache file {cache_file}.")
 
 # --- Profile-specific functions ---
@@ -78,9 +182,108 @@ def get_cached_profile(user_id):
 def set_cached_profile(user_id, profile_data):
     set_cached_item(user_id, profile_data, PROFILES_CACHE_FILE)
 
+def get_cached_person_name(user_id):
+    """Return a cached display name for a user ID, or None."""
+    profile = get_cached_profile(user_id)
+    return profile.get('displayName') if profile else None
+
+def set_cached_person_name(user_id, display_name):
+    set_cached_profile(user_id, {'displayName': display_name})
+
 # --- Members-specific functions ---
 def get_cached_members(space_id):
     return get_cached_item(space_id, MEMBERS_CACHE_FILE)
 
 def set_cached_members(space_id, members_data):
-    set_cached_item(space_id, members_data, MEMBERS_CACHE_FILE)
\ No newline at end of file
+    set_cached_item(space_id, members_data, MEMBERS_CACHE_FILE)
+
+# --- Labels-specific functions ---
+def get_cached_labels(account_key):
+    """Return the cached {'etag', 'labels'} entry for an account, or None."""
+    return get_cached_item(account_key, LABELS_CACHE_FILE)
+
+def set_cached_labels(account_key, etag, labels):
+    set_cached_item(account_key, {'etag': etag, 'labels': labels}, LABELS_CACHE_FILE)
+
+# --- Triage-specific functions ---
+def get_cached_triage(space_id, fetch_limit, since):
+    """
+    Return the cached {'last_active', 'since', 'response'} entry for a space, or None.
+
+    An entry only matches if it was listed with the same number of messages
+    and from a createTime cutoff no later than since (RFC 3339), so it holds
+    every message the caller needs as of its lastActiveTime. Callers compare
+    last_active with the space's current lastActiveTime: when equal the
+    response is current; otherwise only newer messages need fetching.
+    Messages deleted since the entry was cached are still served until it
+    expires, and their emojiReactionSummaries may be out of date.
+    """
+    entry = get_cached_item(space_id, TRIAGE_CACHE_FILE)
+    if not entry or entry.get('fetch_limit') != fetch_limit:
+        return None
+    if entry.get('since', '') > since:
+        return None
+    return entry
+
+def set_cached_triage(space_id, last_active, fetch_limit, since, response):
+    set_cached_item(space_id, {
+        'last_active': last_active,
+        'fetch_limit': fetch_limit,
+        'since': since,
+        'response': response,
+    }, TRIAGE_CACHE_FILE)
+
+
+# --- In-process TTL caches for stable identifiers ---
+# Every function wrapped by ttl_cache, so clear_memory_caches can reach them all
+_ttl_cached_functions = []
+
+
+def ttl_cache(ttl=300, maxsize=1024, negative_ttl=30):
+    """
+    Memoize a function in memory with per-entry expiry and LRU eviction.
+
+    Entries are keyed by the active profile plus the call arguments, so
+    switching profiles never returns another account's IDs. A None result
+    (e.g. folder not found) is kept for only negative_ttl seconds, so a
+    transient miss is not remembered for long. Exceptions are not cached.
+    The wrapper gains a cache_clear() method.
+    """
+    def decorator(func):
+        entries = OrderedDict()
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (get_active_profile_name(), args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            with lock:
+                entry = entries.get(key)
+                if entry is not None and entry[1] > now:
+                    entries.move_to_end(key)
+                    return entry[0]
+
+            value = func(*args, **kwargs)
+            expires = now + (negative_ttl if value is None else ttl)
+            with lock:
+                entries[key] = (value, expires)
+                entries.move_to_end(key)
+                while len(entries) > maxsize:
+                    entries.popitem(last=False)
+            return value
+
+        def cache_clear():
+            with lock:
+                entries.clear()
+
+        wrapper.cache_clear = cache_clear
+        _ttl_cached_functions.append(wrapper)
+        return wrapper
+    return decorator
+
+
+def clear_memory_caches():
+    """Drop every in-process ttl_cache entry; returns how many caches were cleared."""
+    for func in _ttl_cached_functions:
+        func.cache_clear()
+    return len(_ttl_cached_functions)
@@ -1,5 +1,7 @@
 """Google Chat SDK for GWSA."""
 
 from .service import get_chat_service
+from .service import clear_service_cache
 from .service import list_messages
-from .service import search_messages
\ No newline at end of file
+from .service import search_messages
+from .recent import get_recent_chats
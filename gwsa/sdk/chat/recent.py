@@ -0,0 +1,127 @@
+"""Recent Direct Message and Group Chat lookups."""
+
+import logging
+from typing import Any, Dict, List
+
+from .service import get_chat_service
+from ..people.service import get_person_name, prefetch_person_names
+
+logger = logging.getLogger(__name__)
+
+# Largest pageSize spaces.list accepts
+_MAX_PAGE_SIZE = 1000
+
+# Sub-requests per batched members.list call
+_BATCH_SIZE = 50
+
+
+def get_recent_chats(chat_type: str, limit: int = 10) -> List[Dict[str, Any]]:
+    """
+    Get the most recently active spaces of a given type.
+
+    Args:
+        chat_type: Space type to list, e.g. 'DIRECT_MESSAGE' or 'GROUP_CHAT'.
+        limit: Maximum number of spaces to return.
+
+    spaces.list returns spaces in no particular order, so every page is
+    listed (at the maximum page size, with only the fields needed for
+    ranking) before the spaces are sorted.
+
+    Returns:
+        List of dicts with 'id' (space resource name) and 'displayName',
+        most recently active first. For DMs without a display name, the
+        other participant's name is resolved.
+    """
+    chat_service = get_chat_service()
+
+    # 1. Fetch every space of the type using server-side filtering
+    filter_query = f"space_type = \"{chat_type}\""
+    fields = "nextPageToken,spaces(name,displayName,lastActiveTime)"
+
+    spaces = []
+    page_token = None
+    while True:
+        results = chat_service.spaces().list(
+            pageSize=_MAX_PAGE_SIZE,
+            pageToken=page_token,
+            filter=filter_query,
+            fields=fields
+        ).execute()
+        spaces.extend(results.get('spaces', []))
+        page_token = results.get('nextPageToken')
+        if not page_token:
+            break
+
+    # 2. Sort by lastActiveTime (descending)
+    # Handle missing timestamps gracefully (treat as very old)
+    sorted_spaces = sorted(
+        spaces,
+        key=lambda x: x.get('lastActiveTime', '1970-01-01T00:00:00Z'),
+        reverse=True
+    )
+
+    top_spaces = sorted_spaces[:limit]
+
+    # 3. For DMs without a display name, list members of all of them in
+    # batched calls rather than one members.list round-trip per space
+    unnamed_dms = [
+        space['name'] for space in top_spaces
+        if chat_type == 'DIRECT_MESSAGE' and space.get('displayName', 'Unknown') == 'Unknown'
+    ]
+    other_members = {}
+    if unnamed_dms:
+        try:
+            other_members = _first_members(chat_service, unnamed_dms)
+        except Exception as e:
+            logger.debug(f"Could not list DM members: {e}")  # Stick with "Unknown"
+    prefetch_person_names([
+        member.get('name') for member in other_members.values() if not member.get('displayName')
+    ])
+
+    # 4. Prepare and return the final list
+    recent_chats = []
+    for space in top_spaces:
+        display_name = space.get('displayName', 'Unknown')
+
+        # For DMs, use the name of the other person
+        other_member = other_members.get(space['name'])
+        if other_member:
+            # The Chat API often returns a displayName for members directly.
+            # If not, we fall back to the People API (prefetched above).
+            display_name = other_member.get('displayName') or get_person_name(other_member.get('name'))
+
+        recent_chats.append({
+            'id': space['name'],
+            'displayName': display_name
+        })
+        
+    return recent_chats
+
+
+def _first_members(chat_service, space_names: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Map each space to the first member listed in it, using batched requests.
+
+    Simplified logic: Assume the first member found is the other user.
+    A robust solution would need to know the current user's ID to filter them out.
+    Spaces whose members can't be listed are left out.
+    """
+    members = {}
+
+    def callback(request_id, response, exception):
+        if exception:
+            logger.debug(f"Could not list members of {request_id}: {exception}")
+            return
+        memberships = response.get('memberships', [])
+        if memberships:
+            members[request_id] = memberships[0].get('member', {})
+
+    for i in range(0, len(space_names), _BATCH_SIZE):
+        batch = chat_service.new_batch_http_request(callback=callback)
+        for space_name in space_names[i:i + _BATCH_SIZE]:
+            batch.add(
+                chat_service.spaces().members().list(parent=space_name, pageSize=2),
+                request_id=space_name
+            )
+        batch.execute()
+    return members
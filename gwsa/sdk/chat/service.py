@@ -3,18 +3,18 @@
 import logging
 from typing import Any
 
-from googleapiclient.discovery import build
-
-from ..auth import get_credentials
+from ..auth import get_service, clear_service_cache
+from ..people import get_person_name, prefetch_person_names
 from ..timing import time_api_call
 
 logger = logging.getLogger(__name__)
 
-
 def get_chat_service(profile: str = None, use_adc: bool = False) -> Any:
     """
     Get an authenticated Google Chat API service object.
 
+    Services are cached per profile and thread (see auth.get_service).
+
     Args:
         profile: Optional profile name to use (defaults to active profile)
         use_adc: Force use of Application Default Credentials
@@ -26,9 +26,7 @@ def get_chat_service(profile: str = None, use_adc: bool = False) -> Any:
         ValueError: If no profile configured
         Exception: If authentication fails
     """
-    creds, source = get_credentials(profile=profile, use_adc=use_adc)
-    logger.debug(f"Building Chat service using credentials from: {source}")
-    return build("chat", "v1", credentials=creds)
+    return get_service("chat", "v1", profile=profile, use_adc=use_adc)
 
 @time_api_call
 def list_messages(space_id: str, filter: str = None, page_size: int = 25, page_token: str = None) -> dict:
@@ -95,27 +93,29 @@ def search_messages(space_id: str, query: str, limit: int = 100) -> dict:
         for msg in messages:
             text = msg.get('text', '')
             if query.lower() in text.lower():
-                import json
-                print("DEBUG: Raw matching message:")
-                print(json.dumps(msg, indent=2))
-                
-                # Resolve author name
-                from gwsa.sdk.people import get_person_name
-                sender = msg.get("sender", {})
-                user_id = sender.get("name")
-                author_name = get_person_name(user_id)
+                logger.debug("Matching message: %s", msg)
                 
                 found_messages.append({
                     "name": msg.get("name"),
                     "text": text,
                     "createTime": msg.get("createTime"),
-                    "author": author_name,
+                    # Sender ID for now; resolved to a name below
+                    "author": msg.get("sender", {}).get("name"),
                     "thread": msg.get("thread", {}).get("name")
                 })
         
         page_token = response.get('nextPageToken')
         if not page_token:
             break
+
+    # Resolve each distinct author once, fetching unknown ones in one batch
+    prefetch_person_names([m["author"] for m in found_messages])
+    names = {}
+    for m in found_messages:
+        user_id = m["author"]
+        if user_id not in names:
+            names[user_id] = get_person_name(user_id)
+        m["author"] = names[user_id]
             
     return {
         "query": query,
@@ -17,20 +17,49 @@ Advanced Chat Triage Strategy (TODO):
            - If I sent any newer message? -> Handled.
            - Else -> Unhandled Mention.
 """
+import bisect
+import functools
 import logging
 import re
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, FrozenSet, Optional, Tuple
 from datetime import datetime, timedelta, timezone
 from .service import get_chat_service
-from ..people.service import get_me, get_person_name
+from ..people.service import get_me, get_person_name, prefetch_person_names
+from ..cache import get_cached_triage, set_cached_triage
 from ..timing import get_api_call_stats, reset_api_call_count, time_api_call
 
 logger = logging.getLogger(__name__)
 
+# Shared stand-in for missing sub-objects, so lookups don't allocate a new dict
+_EMPTY: Dict[str, Any] = {}
+
+# Partial response: the parts of each message the triage analysis reads
+MESSAGE_FIELDS = (
+    "messages(name,createTime,text,sender,thread/name,"
+    "annotations(type,userMention/user/name),emojiReactionSummaries)"
+)
+
+# Largest page spaces.list returns
+MAX_SPACES_PAGE_SIZE = 1000
+
+# Sub-requests per batched Chat API call; also the number of spaces per wave
+BATCH_SIZE = 50
+
+# RFC 3339 UTC timestamps as the Chat API returns them, with 0-9 fractional digits
+_API_TIME_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,9}))?Z$')
+
+@functools.lru_cache(maxsize=1024)
 def _parse_api_time(timestamp: str) -> datetime:
     """Parses Google API timestamp (RFC 3339) to UTC datetime."""
     if not timestamp:
         return datetime.min.replace(tzinfo=timezone.utc)
+    match = _API_TIME_RE.match(timestamp)
+    if match:
+        year, month, day, hour, minute, second, fraction = match.groups()
+        microsecond = int((fraction or '0')[:6].ljust(6, '0'))
+        return datetime(int(year), int(month), int(day), int(hour), int(minute), int(second),
+                        microsecond, tzinfo=timezone.utc)
+    # Anything else (e.g. an explicit offset): trim to microseconds for fromisoformat
     ts = timestamp.replace("Z", "+00:00")
     if "." in ts:
         parts = ts.split(".")
@@ -39,6 +68,10 @@ def _parse_api_time(timestamp: str) -> datetime:
             ts = f"{parts[0]}.{seconds[0][:6]}+{seconds[1]}"
     return datetime.fromisoformat(ts)
 
+def _format_api_time(moment: datetime) -> str:
+    """Formats a UTC datetime as an RFC 3339 timestamp for API filters."""
+    return moment.strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+
 def get_chat_mentions(
     limit: int = 20,
     implicit_mention_threshold: int = 3,
@@ -70,25 +103,49 @@ def get_chat_mentions(
 
     # Friendly wrappers for triage-specific calls
     @time_api_call
-    def _list_spaces(page_token=None):
+    def _list_spaces(page_size, page_token=None):
         fields = "nextPageToken,spaces(name,displayName,spaceType,lastActiveTime,membershipCount)"
-        return service.spaces().list(pageSize=100, fields=fields, pageToken=page_token).execute()
+        return service.spaces().list(pageSize=page_size, fields=fields, pageToken=page_token).execute()
 
     @time_api_call
     def _list_members(space_name):
         return service.spaces().members().list(parent=space_name, pageSize=5).execute()
 
+    def _execute_batch(requests: Dict[str, Any]) -> Dict[str, Any]:
+        """Runs requests in batched HTTP calls, mapping each key to its response or exception."""
+        responses = {}
+
+        def callback(request_id, response, exception):
+            responses[request_id] = exception if exception else response
+
+        keys = list(requests)
+        for i in range(0, len(keys), BATCH_SIZE):
+            batch = service.new_batch_http_request(callback=callback)
+            for key in keys[i:i + BATCH_SIZE]:
+                batch.add(requests[key], request_id=key)
+            batch.execute()
+        return responses
+
     @time_api_call
-    def _list_space_messages(space_name, fetch_limit):
-        return service.spaces().messages().list(
-            parent=space_name, 
-            pageSize=fetch_limit, 
-            orderBy="createTime desc"
-        ).execute()
+    def _batch_list_space_messages(fetches: Dict[str, Tuple[int, str]]) -> Dict[str, Any]:
+        # The server drops messages older than each space's cutoff
+        return _execute_batch({
+            space_name: service.spaces().messages().list(
+                parent=space_name,
+                pageSize=fetch_limit,
+                orderBy="createTime desc",
+                filter=f'createTime > "{since}"',
+                fields=MESSAGE_FIELDS
+            )
+            for space_name, (fetch_limit, since) in fetches.items()
+        })
 
     @time_api_call
-    def _list_reactions(message_name):
-        return service.spaces().messages().reactions().list(parent=message_name).execute()
+    def _batch_list_reactions(message_names: List[str]) -> Dict[str, Any]:
+        return _execute_batch({
+            message_name: service.spaces().messages().reactions().list(parent=message_name)
+            for message_name in message_names
+        })
 
     # Identify myself
     logger.debug("Invoking profile resolution (logical API call)...")
@@ -101,6 +158,26 @@ def get_chat_mentions(
         my_id = f"users/{raw_name.split('/')[1]}"
     
     my_display_name = myself.get('displayName', '').split(' ')[0] if myself.get('displayName') else None
+    # "@Bob" should not match "@Bobby"
+    mention_re = re.compile(r'@' + re.escape(my_display_name) + r'(?!\w)') if my_display_name else None
+
+    # Messages are examined more than once per scan (reaction targets, then
+    # analysis); keyed by message name rather than stored on the message,
+    # which may be shared with the triage cache
+    mention_ids_by_msg: Dict[str, frozenset] = {}
+
+    def _mentioned_user_ids(msg: Dict[str, Any]) -> frozenset:
+        """User IDs tagged by a message's USER_MENTION annotations."""
+        msg_name = msg.get('name')
+        ids = mention_ids_by_msg.get(msg_name)
+        if ids is None:
+            ids = frozenset(
+                ann.get('userMention', {}).get('user', {}).get('name')
+                for ann in msg.get('annotations') or ()
+                if ann.get('type') == 'USER_MENTION'
+            )
+            mention_ids_by_msg[msg_name] = ids
+        return ids
 
     def _analyze_message(msg: Dict[str, Any], my_id: str, my_display_name: str, is_implicit: bool, i_have_responded: bool) -> Optional[Dict[str, Any]]:
         """Determines if a single message constitutes a mention or actionable item."""
@@ -119,16 +196,12 @@ def get_chat_mentions(
         mentioned = False
         
         # 1. Check User Mentions (Annotations)
-        if 'annotations' in msg:
-            for ann in msg['annotations']:
-                if ann.get('type') == 'USER_MENTION':
-                    if my_id and ann.get('userMention', {}).get('user', {}).get('name') == my_id:
-                        mentioned = True
-                        logger.debug(f"     -> User mention annotation matched")
-                        break
+        if my_id and my_id in _mentioned_user_ids(msg):
+            mentioned = True
+            logger.debug(f"     -> User mention annotation matched")
         
         # 2. Check Text Mentions (@Name)
-        if not mentioned and my_display_name and f"@{my_display_name}" in msg.get('text', ''):
+        if not mentioned and mention_re and mention_re.search(msg.get('text', '')):
             mentioned = True
             logger.debug(f"     -> Text mention matched @{my_display_name}")
             
@@ -146,7 +219,10 @@ def get_chat_mentions(
     
     while True:
         try:
-            res = _list_spaces(page_token)
+            # spaces.list can't be ordered by lastActiveTime, so there is no
+            # safe early exit; ask for the whole discovery window at once
+            page_size = min(MAX_SPACES_PAGE_SIZE, max(1, discovery_limit - len(all_spaces)))
+            res = _list_spaces(page_size, page_token)
             all_spaces.extend(res.get('spaces', []))
             page_token = res.get('nextPageToken')
             if not page_token or len(all_spaces) >= discovery_limit:
@@ -158,34 +234,35 @@ def get_chat_mentions(
     # 2. Filter Candidates
     now = datetime.now(timezone.utc)
     candidates = []
+
+    # Tiers as parallel arrays (caps ascending) for bisect lookups
+    tier_caps = [float('inf') if t['max_members'] is None else t['max_members'] for t in tiers]
+    tier_lookbacks = [t.get('lookback_days', 1) for t in tiers]
+    tier_cutoffs = [now - timedelta(days=d) for d in tier_lookbacks]
+
+    # Spaces idle for longer than the widest tier's lookback fail every tier
+    widest_cutoff = now - timedelta(days=max(tier_lookbacks, default=0))
     
     for space in all_spaces:
+        last_active = _parse_api_time(space.get('lastActiveTime'))
+        if last_active <= widest_cutoff:
+            continue
+
         members_count = 0
         if 'membershipCount' in space:
             members_count = space['membershipCount'].get('joinedDirectHumanUserCount', 2)
         elif space.get('spaceType') == 'DIRECT_MESSAGE':
             members_count = 2
             
-        lookback_days = 0 # Default to 0 (exclude) if no tier matches
-        
-        # Match Tier
-        matched_tier = False
-        for tier in tiers:
-            limit_members = tier.get('max_members')
-            # If explicit max limit is set, and we are above it, we stop matching (assuming sorted asc)
-            # BUT tiers logic is: find first tier that FITS.
-            if limit_members is None or members_count <= limit_members:
-                lookback_days = tier.get('lookback_days', 1)
-                matched_tier = True
-                break
-        
-        if not matched_tier or lookback_days <= 0:
+        # Match Tier: the first (smallest) tier whose cap FITS; none -> exclude
+        tier_index = bisect.bisect_left(tier_caps, members_count)
+        if tier_index == len(tiers):
+            continue
+        lookback_days = tier_lookbacks[tier_index]
+        if lookback_days <= 0:
             continue
-            
-        last_active = _parse_api_time(space.get('lastActiveTime'))
-        cutoff = now - timedelta(days=lookback_days)
         
-        if last_active > cutoff:
+        if last_active > tier_cutoffs[tier_index]:
             # Determine Sort Priority
             # 1. Type: DM (0) < Group (1) < Space (2)
             stype = space.get('spaceType', 'SPACE')
@@ -205,26 +282,74 @@ def get_chat_mentions(
 
     # Sort Candidates: Type Score ASC, then Members ASC
     candidates.sort(key=lambda x: (x['type_score'], x['members']))
-    
-    # 3. Analyze Candidates
-    results = []
-    space_stats = []
-    total_messages_scanned = 0
-    exit_reason = "completed"
-    
-    for item in candidates: # Remove slice [:limit], handle loop break manually if needed or rely on message limit
-        # We still respect 'limit' for *spaces to scan* if provided?
-        # The user said "highest users one will be the limit above which no space will be consddered".
-        # But `limit` param (default 20) was "active spaces to scan".
-        # Let's keep respecting `limit` as "max spaces to scan".
-        if len(space_stats) >= limit:
-            exit_reason = "space_limit_reached"
-            break
 
-        if total_messages_scanned >= message_limit:
-            exit_reason = "message_limit_reached"
-            break
+    def _fetch_limit(item: Dict[str, Any]) -> Optional[int]:
+        """Number of recent messages to fetch for a space, or None to skip it."""
+        is_implicit = item['members'] <= implicit_mention_threshold
+        # Safety: Cannot do implicit check without knowing who I am
+        if is_implicit and not my_id:
+            return None
+        return 1 if is_implicit else 20
 
+    def _reaction_targets(item: Dict[str, Any], messages: List[Dict[str, Any]],
+                          fresh_names: FrozenSet[str]) -> List[str]:
+        """
+        Names of the messages whose reactions _analyze_space may check.
+
+        Messages listed in this scan (fresh_names) without
+        emojiReactionSummaries are skipped; cached ones are not, since their
+        summaries predate any reaction added since (reacting doesn't bump
+        lastActiveTime).
+        """
+        cutoff = now - timedelta(days=item['lookback_days'])
+        is_implicit = item['members'] <= implicit_mention_threshold
+        targets = []
+        i_have_responded = False
+        for msg in messages:
+            if _parse_api_time(msg.get('createTime')) < cutoff:
+                continue
+            if (msg.get('sender') or _EMPTY).get('name') == my_id:
+                i_have_responded = True
+                if unanswered_only:
+                    break
+                continue
+            if _analyze_message(msg, my_id, my_display_name, is_implicit, i_have_responded):
+                # A message nobody has reacted to has no emojiReactionSummaries;
+                # only the summaries' counts are returned, not who reacted
+                if not i_have_responded and (msg.get('name') not in fresh_names or msg.get('emojiReactionSummaries')):
+                    targets.append(msg.get('name'))
+                # Only unanswered_only scans past a mention (when it was answered)
+                if not unanswered_only:
+                    break
+        return targets
+
+    def _sender_label(sender_obj: Dict[str, Any]) -> str:
+        """Best available name for a message sender."""
+        final_sender_name = sender_obj.get('displayName')
+        if not final_sender_name:
+            s_id = sender_obj.get('name')
+            if s_id:
+                logger.debug(f"Invoking name resolution for sender {s_id} (logical API call)...")
+                final_sender_name = get_person_name(s_id)
+        
+        # Fallback: Check for email if name is still unknown
+        if (not final_sender_name or final_sender_name == "Unknown"):
+            email = sender_obj.get('email')
+            if email:
+                final_sender_name = email
+            elif sender_obj.get('type') == 'HUMAN':
+                final_sender_name = "External User"
+            else:
+                # Note: We could try the Directory API here for external users, but it adds
+                # significant complexity/latency for a rare edge case. Sticking to "Unknown".
+                # Future: As more customers adopt Workspace federation, they may appear as 
+                # "Unknown" if not in contacts/directory. We're not there yet.
+                logger.debug(f"Sender object for unresolved external user: {sender_obj}")
+
+        return final_sender_name or "Unknown"
+
+    def _analyze_space(item: Dict[str, Any], msgs_res: Any, reactions: Dict[str, Any]) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """Scans one candidate space's prefetched messages, returning its stats and actionable item (if any)."""
         space = item['space']
         members_count = item['members']
         space_name = space['name']
@@ -259,32 +384,29 @@ def get_chat_mentions(
 
         is_implicit = members_count <= implicit_mention_threshold
         
-        # Safety: Cannot do implicit check without knowing who I am
-        if is_implicit and not my_id:
-            space_stats.append(current_space_stat)
-            continue
+        if msgs_res is None:
+            return current_space_stat, None
 
         try:
-            fetch_limit = 1 if is_implicit else 20
-            msgs_res = _list_space_messages(space_name, fetch_limit)
+            if isinstance(msgs_res, Exception):
+                raise msgs_res
             
             messages = msgs_res.get('messages', [])
             current_space_stat["messages_scanned"] = len(messages)
-            total_messages_scanned += len(messages)
             
             if not messages:
                 logger.debug(f"  -> No messages found")
-                space_stats.append(current_space_stat)
-                continue
+                return current_space_stat, None
             
             i_have_responded = False
             for msg in messages:
                 msg_time = _parse_api_time(msg.get('createTime'))
-                sender_id = msg.get('sender', {}).get('name')
-                sender_name = msg.get('sender', {}).get('displayName', 'Unknown')
-                text_snippet = msg.get('text', '')[:50]
+                sender_id = (msg.get('sender') or _EMPTY).get('name')
                 
-                logger.debug(f"  -> Message {msg.get('name')} from {sender_name} ({sender_id}) at {msg_time}: {text_snippet}")
+                if debug:
+                    sender_name = (msg.get('sender') or _EMPTY).get('displayName', 'Unknown')
+                    text_snippet = msg.get('text', '')[:50]
+                    logger.debug(f"  -> Message {msg.get('name')} from {sender_name} ({sender_id}) at {msg_time}: {text_snippet}")
 
                 if msg_time < cutoff:
                     logger.debug(f"     -> Skipped (too old)")
@@ -308,11 +430,14 @@ def get_chat_mentions(
                 
                 if found_item and not is_answered:
                     logger.debug(f"     -> Checking reactions...")
-                    # Check for my reaction to this message (1 extra API call)
+                    # Check for my reaction to this message (fetched in the wave's batch,
+                    # or absent when the message has no reactions at all)
                     try:
-                        reac_res = _list_reactions(msg.get('name'))
-                        reactions = reac_res.get('reactions', [])
-                        for r in reactions:
+                        reac_res = reactions.get(msg.get('name'), {})
+                        if isinstance(reac_res, Exception):
+                            raise reac_res
+                        my_reactions = reac_res.get('reactions', [])
+                        for r in my_reactions:
                             if r.get('user', {}).get('name') == my_id:
                                 is_answered = True
                                 logger.debug(f"     -> Handled by reaction")
@@ -332,49 +457,122 @@ def get_chat_mentions(
 
                     logger.debug(f"     -> Actionable item confirmed: {found_item['reason']} (Answered: {is_answered})")
                     
-                    final_sender_name = msg.get('sender', {}).get('displayName')
-                    if not final_sender_name:
-                        s_id = msg.get('sender', {}).get('name')
-                        if s_id:
-                            logger.debug(f"Invoking name resolution for sender {s_id} (logical API call)...")
-                            final_sender_name = get_person_name(s_id)
-                    
-                    # Fallback: Check for email if name is still unknown
-                    if (not final_sender_name or final_sender_name == "Unknown"):
-                        sender_obj = msg.get('sender', {})
-                        email = sender_obj.get('email')
-                        if email:
-                            final_sender_name = email
-                        elif sender_obj.get('type') == 'HUMAN':
-                            final_sender_name = "External User"
-                        else:
-                            # Note: We could try the Directory API here for external users, but it adds
-                            # significant complexity/latency for a rare edge case. Sticking to "Unknown".
-                            # Future: As more customers adopt Workspace federation, they may appear as 
-                            # "Unknown" if not in contacts/directory. We're not there yet.
-                            logger.debug(f"Sender object for unresolved external user: {msg.get('sender', {})}")
-                            pass
-
-                    results.append({
+                    return current_space_stat, {
                         "type": found_item['type'],
                         "space": display_name,
                         "space_id": space_name,
                         "members": members_count,
                         "thread_name": msg.get('thread', {}).get('name'),
                         "time": msg.get('createTime'),
-                        "sender": final_sender_name or "Unknown",
+                        # Raw sender; resolved to a name once all spaces are scanned
+                        "sender": msg.get('sender', {}),
                         "text": msg.get('text', '')[:100],
                         "reason": found_item['reason'],
                         "answered": is_answered
-                    })
-                    break 
-            
-            space_stats.append(current_space_stat)
+                    }
 
         except Exception as e:
             logger.warning(f"Failed to scan space {space_name}: {e}")
-            space_stats.append(current_space_stat)
-            continue
+
+        return current_space_stat, None
+
+    # 3. Analyze Candidates
+    # Per-message debug lines are only formatted when they will be emitted
+    debug = logger.isEnabledFor(logging.DEBUG)
+    results = []
+    space_stats = []
+    total_messages_scanned = 0
+    exit_reason = "completed"
+
+    # Spaces are scanned in waves of up to BATCH_SIZE: one batched call lists
+    # the wave's messages and a second fetches the reactions it needs.
+    # Results are folded in candidate order and the limits are checked
+    # between spaces, so the output matches a serial scan.
+    pos = 0
+    while pos < len(candidates):
+        # `limit` is the max number of spaces to scan
+        if len(space_stats) >= limit:
+            exit_reason = "space_limit_reached"
+            break
+        if total_messages_scanned >= message_limit:
+            exit_reason = "message_limit_reached"
+            break
+
+        wave = candidates[pos:pos + min(BATCH_SIZE, limit - len(space_stats))]
+        pos += len(wave)
+
+        # Spaces with no activity since the last scan reuse its message list,
+        # and active ones with a cached list fetch only the newer messages.
+        # Reactions are always fetched fresh since they don't bump lastActiveTime.
+        space_messages = {}
+        fetches = {}
+        cached_lists = {}
+        fresh_names = {}
+        for item in wave:
+            fetch_limit = _fetch_limit(item)
+            if fetch_limit is None:
+                continue
+            space_name = item['space']['name']
+            since = _format_api_time(now - timedelta(days=item['lookback_days']))
+            entry = get_cached_triage(space_name, fetch_limit, since)
+            if entry and entry.get('last_active') == item['space'].get('lastActiveTime'):
+                space_messages[space_name] = entry['response']
+                continue
+            cached_msgs = entry['response'].get('messages', []) if entry else []
+            if cached_msgs:
+                # Messages are newest first; the cached list already covers the rest
+                cached_lists[space_name] = (entry.get('since', ''), cached_msgs)
+                since = max(since, cached_msgs[0].get('createTime', ''))
+            fetches[space_name] = (fetch_limit, since)
+        if fetches:
+            fetched = _batch_list_space_messages(fetches)
+            for item in wave:
+                space_name = item['space']['name']
+                response = fetched.get(space_name)
+                if space_name not in fetches or response is None:
+                    continue
+                if not isinstance(response, dict):
+                    space_messages[space_name] = response
+                    continue
+                fetch_limit, since = fetches[space_name]
+                new_names = frozenset(m.get('name') for m in response.get('messages', []))
+                fresh_names[space_name] = new_names
+                if space_name in cached_lists:
+                    since, cached_msgs = cached_lists[space_name]
+                    merged = response.get('messages', []) + [
+                        m for m in cached_msgs if m.get('name') not in new_names
+                    ]
+                    response = {'messages': merged[:fetch_limit]}
+                space_messages[space_name] = response
+                set_cached_triage(space_name, item['space'].get('lastActiveTime'),
+                                  fetch_limit, since, response)
+
+        message_names = []
+        for item in wave:
+            msgs_res = space_messages.get(item['space']['name'])
+            if isinstance(msgs_res, dict):
+                fresh = fresh_names.get(item['space']['name'], frozenset())
+                message_names.extend(_reaction_targets(item, msgs_res.get('messages', []), fresh))
+        reactions = _batch_list_reactions(message_names) if message_names else {}
+
+        for item in wave:
+            if total_messages_scanned >= message_limit:
+                exit_reason = "message_limit_reached"
+                break
+            space_stat, found = _analyze_space(item, space_messages.get(item['space']['name']), reactions)
+            space_stats.append(space_stat)
+            total_messages_scanned += space_stat["messages_scanned"]
+            if found:
+                results.append(found)
+        if exit_reason != "completed":
+            break
+
+    # Resolve every unnamed sender with batched People API calls
+    prefetch_person_names([
+        r["sender"].get("name") for r in results if not r["sender"].get("displayName")
+    ])
+    for r in results:
+        r["sender"] = _sender_label(r["sender"])
 
     stats = get_api_call_stats()
     total_calls = sum(stats.values())
@@ -4,6 +4,7 @@ Handles loading and saving YAML configuration from ~/.config/gworkspace-access/.
 """
 
 import os
+import copy
 import yaml
 import logging
 from pathlib import Path
@@ -37,29 +38,60 @@ DEFAULT_CONFIG = {
 }
 
 
+def _default_config() -> dict:
+    """Return a fresh copy of DEFAULT_CONFIG that callers may mutate."""
+    return copy.deepcopy(DEFAULT_CONFIG)
+
+
+# libyaml's loader when PyYAML was built with it; same safe subset, much faster
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Last parsed config file: (path, mtime_ns, size, merged config)
+_config_cache = None
+
+
 def load_config() -> dict:
-    """Load the gwsa configuration from the config file."""
+    """
+    Load the gwsa configuration from the config file.
+
+    The parsed file is reused until its modification time or size changes;
+    each call returns its own copy.
+    """
+    global _config_cache
     config_file = get_config_file_path()
-    if not config_file.exists():
+    try:
+        stat = config_file.stat()
+    except FileNotFoundError:
         logger.debug(f"Config file not found at {config_file}, using default config.")
-        return DEFAULT_CONFIG.copy()
+        return _default_config()
+    except OSError as e:
+        logger.error(f"An unexpected error occurred while loading config: {e}")
+        return _default_config()
+
+    cached = _config_cache
+    if cached and cached[:3] == (config_file, stat.st_mtime_ns, stat.st_size):
+        return copy.deepcopy(cached[3])
 
     try:
         with open(config_file, 'r') as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=_YamlLoader)
             if config is None:
-                return DEFAULT_CONFIG.copy()
-            return _deep_merge(DEFAULT_CONFIG.copy(), config)
+                return _default_config()
+            merged = _deep_merge(_default_config(), config)
+            _config_cache = (config_file, stat.st_mtime_ns, stat.st_size, merged)
+            return copy.deepcopy(merged)
     except yaml.YAMLError as e:
         logger.error(f"Error loading config file {config_file}: {e}")
-        return DEFAULT_CONFIG.copy()
+        return _default_config()
     except Exception as e:
         logger.error(f"An unexpected error occurred while loading config: {e}")
-        return DEFAULT_CONFIG.copy()
+        return _default_config()
 
 
 def save_config(config_data: dict):
     """Save the gwsa configuration to the config file."""
+    global _config_cache
+    _config_cache = None
     config_file = get_config_file_path()
     config_file.parent.mkdir(parents=True, exist_ok=True)
     try:
@@ -99,10 +131,13 @@ def set_config_value(key: str, value: Any):
 
 
 def _deep_merge(base: dict, new: dict) -> dict:
-    """Recursively merge dictionary `new` into `base`."""
-    for k, v in new.items():
-        if k in base and isinstance(base[k], dict) and isinstance(v, dict):
-            base[k] = _deep_merge(base[k], v)
-        else:
-            base[k] = v
+    """Merge dictionary `new` into `base` in place, nested dicts included."""
+    stack = [(base, new)]
+    while stack:
+        target, source = stack.pop()
+        for k, v in source.items():
+            if isinstance(v, dict) and isinstance(target.get(k), dict):
+                stack.append((target[k], v))
+            else:
+                target[k] = v
     return base
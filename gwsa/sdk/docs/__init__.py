@@ -5,7 +5,7 @@ Provides functions for creating, reading, updating, and listing Google Docs.
 
 from .service import get_docs_service
 from .create import create_document
-from .read import get_document, get_document_text, get_document_content
+from .read import get_document, get_document_text, get_document_content, iter_document_text
 from .update import insert_text, replace_text, append_text, batch_update
 from .list import list_documents
 
@@ -15,6 +15,7 @@ __all__ = [
     "get_document",
     "get_document_text",
     "get_document_content",
+    "iter_document_text",
     "insert_text",
     "replace_text",
     "append_text",
@@ -2,15 +2,13 @@
 
 from typing import Optional, List, Dict, Any
 
-from googleapiclient.discovery import build
-
-from ..auth import get_credentials
+from ..auth import get_service
+from ..drive.search import escape_query_value
 
 
 def get_drive_service():
     """Build and return a Google Drive API service object."""
-    creds, _ = get_credentials()
-    return build("drive", "v3", credentials=creds)
+    return get_service("drive", "v3")
 
 
 def list_documents(
@@ -36,14 +34,16 @@ def list_documents(
     # Build the query - always filter for Google Docs
     q = "mimeType='application/vnd.google-apps.document'"
     if query:
-        q += f" and (name contains '{query}' or fullText contains '{query}')"
+        escaped = escape_query_value(query)
+        q += f" and (name contains '{escaped}' or fullText contains '{escaped}')"
 
     results = service.files().list(
         q=q,
         pageSize=max_results,
         pageToken=page_token,
-        fields="nextPageToken, files(id, name, modifiedTime, createdTime, owners)",
-        orderBy="modifiedTime desc"
+        fields="nextPageToken, files(id, name, modifiedTime, createdTime, owners(emailAddress))",
+        orderBy="modifiedTime desc",
+        spaces="drive"
     ).execute()
 
     documents = []
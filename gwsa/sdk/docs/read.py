@@ -2,19 +2,28 @@
 
 from googleapiclient.errors import HttpError
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional
 
 from .service import get_docs_service
 from .validators import validate_doc_id
 from ..drive.service import get_drive_service
 
+# Field masks limiting documents.get to what text extraction needs
+_PARAGRAPH_TEXT_FIELDS = "paragraph(elements(textRun(content)))"
+TEXT_FIELDS = (
+    f"body(content({_PARAGRAPH_TEXT_FIELDS},"
+    f"table(tableRows(tableCells(content({_PARAGRAPH_TEXT_FIELDS}))))))"
+)
+CONTENT_FIELDS = f"documentId,title,revisionId,{TEXT_FIELDS}"
 
-def get_document(doc_id: str) -> dict:
+
+def get_document(doc_id: str, fields: Optional[str] = None) -> dict:
     """
-    Get a document's full structure after verifying it is a Google Doc.
+    Get a document's full structure.
 
     Args:
         doc_id: The Google Doc ID
+        fields: Optional field mask to limit the response (default: everything)
 
     Returns:
         The full document object from the API including:
@@ -30,25 +39,30 @@ def get_document(doc_id: str) -> dict:
     """
     validate_doc_id(doc_id)
 
-    drive_service = get_drive_service()
+    service = get_docs_service()
     try:
-        file_metadata = drive_service.files().get(fileId=doc_id, fields='mimeType').execute()
-        mime_type = file_metadata.get('mimeType')
-
-        if mime_type != 'application/vnd.google-apps.document':
-            raise ValueError(
-                f"File with ID '{doc_id}' is not a Google Doc (MIME type: {mime_type}). "
-                f"Use the 'drive_download' tool for non-native formats like PDFs or images."
-            )
+        return service.documents().get(documentId=doc_id, fields=fields).execute()
     except HttpError as e:
-        # If the file doesn't exist in Drive at all, the Docs API call will fail anyway.
-        # This check is specifically to prevent trying to read non-docs files.
-        # Re-raise or handle other Drive API errors as needed.
-        # For now, we'll let it proceed and fail at the Docs API level if the file is not found.
-        pass
+        # Only on failure ask Drive what the file is, so the common case is
+        # one request. The Docs API rejects non-Docs files with a terse 400.
+        if e.resp.status in (400, 404):
+            _raise_if_not_google_doc(doc_id)
+        raise
 
-    service = get_docs_service()
-    return service.documents().get(documentId=doc_id).execute()
+
+def _raise_if_not_google_doc(doc_id: str) -> None:
+    """Raise a helpful ValueError if Drive reports the file is not a Google Doc."""
+    try:
+        file_metadata = get_drive_service().files().get(fileId=doc_id, fields='mimeType').execute()
+    except HttpError:
+        # File not found in Drive either; the caller re-raises the Docs API error
+        return
+    mime_type = file_metadata.get('mimeType')
+    if mime_type != 'application/vnd.google-apps.document':
+        raise ValueError(
+            f"File with ID '{doc_id}' is not a Google Doc (MIME type: {mime_type}). "
+            f"Use the 'drive_download' tool for non-native formats like PDFs or images."
+        )
 
 
 def get_document_text(doc_id: str) -> str:
@@ -61,7 +75,7 @@ def get_document_text(doc_id: str) -> str:
     Returns:
         Plain text content of the document
     """
-    doc = get_document(doc_id)
+    doc = get_document(doc_id, fields=TEXT_FIELDS)
     return extract_text_from_document(doc)
 
 
@@ -80,7 +94,7 @@ def get_document_content(doc_id: str) -> dict:
             - text: Plain text content
             - revision_id: Current revision ID
     """
-    doc = get_document(doc_id)
+    doc = get_document(doc_id, fields=CONTENT_FIELDS)
 
     return {
         "id": doc.get("documentId"),
@@ -101,25 +115,32 @@ def extract_text_from_document(doc: dict) -> str:
     Returns:
         Plain text content
     """
-    content = doc.get("body", {}).get("content", [])
-    text_parts = []
+    return "".join(iter_document_text(doc))
+
+
+def iter_document_text(doc: dict) -> Iterator[str]:
+    """
+    Yield a document's text one paragraph at a time.
+
+    Lets callers process or truncate large documents without building the
+    whole text first.
 
-    for element in content:
+    Args:
+        doc: The document object from the API
+
+    Yields:
+        Plain text of each paragraph, including those inside table cells
+    """
+    for element in doc.get("body", {}).get("content", ()):
         if "paragraph" in element:
-            paragraph = element["paragraph"]
-            para_text = extract_paragraph_text(paragraph)
-            text_parts.append(para_text)
+            yield extract_paragraph_text(element["paragraph"])
         elif "table" in element:
             # Extract text from table cells
-            table = element["table"]
-            for row in table.get("tableRows", []):
-                for cell in row.get("tableCells", []):
-                    for cell_content in cell.get("content", []):
+            for row in element["table"].get("tableRows", ()):
+                for cell in row.get("tableCells", ()):
+                    for cell_content in cell.get("content", ()):
                         if "paragraph" in cell_content:
-                            para_text = extract_paragraph_text(cell_content["paragraph"])
-                            text_parts.append(para_text)
-
-    return "".join(text_parts)
+                            yield extract_paragraph_text(cell_content["paragraph"])
 
 
 def extract_paragraph_text(paragraph: dict) -> str:
@@ -132,9 +153,8 @@ def extract_paragraph_text(paragraph: dict) -> str:
     Returns:
         Plain text content of the paragraph
     """
-    text = ""
-    for element in paragraph.get("elements", []):
-        text_run = element.get("textRun")
-        if text_run:
-            text += text_run.get("content", "")
-    return text
+    return "".join(
+        element["textRun"].get("content", "")
+        for element in paragraph.get("elements", ())
+        if element.get("textRun")
+    )
@@ -1,18 +1,16 @@
 """Google Docs service factory."""
 
-from googleapiclient.discovery import build
-
-from ..auth import get_credentials
+from ..auth import get_service
 
 
 def get_docs_service():
     """
     Build and return a Google Docs API service object.
 
-    Uses credentials from the active gwsa profile.
+    Uses credentials from the active gwsa profile. Services are cached per
+    profile and thread (see auth.get_service).
 
     Returns:
         Google Docs API service object
     """
-    creds, _ = get_credentials()
-    return build("docs", "v1", credentials=creds)
+    return get_service("docs", "v1")
@@ -3,24 +3,31 @@
 from .service import get_drive_service
 from .folders import (
     list_folder,
+    iter_folder,
     create_folder,
     find_folder_by_path,
+    find_folders_by_paths,
     search_folders,
+    clear_folder_cache,
     AmbiguousFolderError,
 )
 from .upload import upload_file, update_file
 from .download import download_file
-from .search import search_drive
+from .search import search_drive, escape_query_value
 
 __all__ = [
     "get_drive_service",
     "list_folder",
+    "iter_folder",
     "create_folder",
     "find_folder_by_path",
+    "find_folders_by_paths",
     "search_folders",
+    "clear_folder_cache",
     "AmbiguousFolderError",
     "upload_file",
     "update_file",
     "download_file",
     "search_drive",
+    "escape_query_value",
 ]
\ No newline at end of file
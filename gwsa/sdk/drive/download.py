@@ -8,6 +8,20 @@ from googleapiclient.http import MediaIoBaseDownload
 
 from .service import get_drive_service
 
+# Bytes fetched per request, bounding memory use for large files
+DOWNLOAD_CHUNK_SIZE = 16 * 1024 * 1024
+
+# Google-native files have no binary content; they are exported to these formats
+EXPORT_MIME_TYPES = {
+    "application/vnd.google-apps.document":
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "application/vnd.google-apps.spreadsheet":
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "application/vnd.google-apps.presentation":
+        "application/vnd.openxmlformats-officedocument.presentationml.presentation",
+    "application/vnd.google-apps.drawing": "image/png",
+}
+
 
 def download_file(
     file_id: str,
@@ -17,6 +31,9 @@ def download_file(
     """
     Download a file from Google Drive.
 
+    Content is written to disk chunk by chunk. Google Docs, Sheets, Slides
+    and Drawings are exported to Office formats (PNG for Drawings).
+
     Args:
         file_id: The Drive file ID to download
         save_path: Local path where the file should be saved
@@ -34,14 +51,18 @@ def download_file(
     ).execute()
 
     # Create request for file content
-    request = service.files().get_media(fileId=file_id)
+    export_mime_type = EXPORT_MIME_TYPES.get(file_metadata.get("mimeType"))
+    if export_mime_type:
+        request = service.files().export_media(fileId=file_id, mimeType=export_mime_type)
+    else:
+        request = service.files().get_media(fileId=file_id)
 
     # Ensure parent directory exists
     os.makedirs(os.path.dirname(os.path.abspath(save_path)), exist_ok=True)
 
     # Download to file
     with open(save_path, "wb") as f:
-        downloader = MediaIoBaseDownload(f, request)
+        downloader = MediaIoBaseDownload(f, request, chunksize=DOWNLOAD_CHUNK_SIZE)
         done = False
         while not done:
             status, done = downloader.next_chunk()
@@ -55,5 +76,5 @@ def download_file(
         "file_path": save_path,
         "size": file_size,
         "name": file_metadata.get("name"),
-        "mime_type": file_metadata.get("mimeType")
+        "mime_type": export_mime_type or file_metadata.get("mimeType")
     }
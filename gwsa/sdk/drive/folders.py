@@ -1,15 +1,37 @@
 """Google Drive folder operations."""
 
-from typing import Optional, List, Dict, Any, Literal
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Iterator, Literal
 
+from ..cache import ttl_cache
+from .search import escape_query_value
 from .service import get_drive_service
 
 
+# Largest pageSize files.list accepts
+MAX_PAGE_SIZE = 1000
+
+# Path lookups resolved concurrently by find_folders_by_paths
+MAX_PATH_RESOLVERS = 8
+
+# files.list query templates; values are filled in with escape_query_value
+_FOLDER_QUERY = "mimeType = 'application/vnd.google-apps.folder' and trashed = false"
+_Q_IN_FOLDER = "'{parent}' in parents and trashed = false"
+_Q_CHILD_FOLDER = "'{parent}' in parents and name = '{name}' and " + _FOLDER_QUERY
+_Q_FOLDER_NAME = _FOLDER_QUERY + " and name {op} '{name}'"
+
+
 class AmbiguousFolderError(Exception):
     """Raised when multiple folders match at the same path level."""
     pass
 
 
+def clear_folder_cache() -> None:
+    """Forget cached folder path and name lookups for all profiles."""
+    find_folder_by_path.cache_clear()
+    search_folders.cache_clear()
+
+
 def list_folder(
     folder_id: Optional[str] = None,
     max_results: int = 100,
@@ -20,7 +42,8 @@ def list_folder(
 
     Args:
         folder_id: Folder ID to list. Use 'root' or None for My Drive root.
-        max_results: Maximum number of items to return (default 100)
+        max_results: Maximum number of items to return (default 100, max 1000).
+                     One page is fetched per call.
         page_token: Token for pagination
 
     Returns:
@@ -28,45 +51,84 @@ def list_folder(
             - items: List of file/folder info dicts
             - next_page_token: Token for next page (if more results)
     """
-    service = get_drive_service()
-
     # Default to root folder
     parent_id = folder_id or "root"
+    results = _list_folder_page(parent_id, min(max_results, MAX_PAGE_SIZE), page_token)
 
-    results = service.files().list(
-        q=f"'{parent_id}' in parents and trashed = false",
-        pageSize=max_results,
+    return {
+        "items": [_folder_item(file) for file in results.get("files", [])],
+        "next_page_token": results.get("nextPageToken")
+    }
+
+
+def iter_folder(
+    folder_id: Optional[str] = None,
+    page_size: int = MAX_PAGE_SIZE,
+) -> Iterator[dict]:
+    """
+    Yield every item in a Google Drive folder, following pagination.
+
+    The next page is requested in the background while the current one is
+    consumed, and items are built one at a time, so callers can stop early
+    without listing (or holding) the whole folder.
+
+    Args:
+        folder_id: Folder ID to list. Use 'root' or None for My Drive root.
+        page_size: Items requested per page (max 1000).
+
+    Yields:
+        File/folder info dicts, as in list_folder's items
+    """
+    parent_id = folder_id or "root"
+    page_size = min(page_size, MAX_PAGE_SIZE)
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pending = pool.submit(_list_folder_page, parent_id, page_size, None)
+        try:
+            while pending is not None:
+                results = pending.result()
+                next_token = results.get("nextPageToken")
+                pending = pool.submit(_list_folder_page, parent_id, page_size, next_token) if next_token else None
+                for file in results.get("files", []):
+                    yield _folder_item(file)
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+
+def _list_folder_page(parent_id: str, page_size: int, page_token: Optional[str]) -> dict:
+    """Fetch one files.list page of a folder's contents."""
+    service = get_drive_service()
+    return service.files().list(
+        q=_Q_IN_FOLDER.format(parent=escape_query_value(parent_id)),
+        pageSize=page_size,
         pageToken=page_token,
         fields="nextPageToken, files(id, name, mimeType, modifiedTime, size, shortcutDetails)",
         orderBy="folder,name"
     ).execute()
 
-    items = []
-    for file in results.get("files", []):
-        is_folder = file.get("mimeType") == "application/vnd.google-apps.folder"
-        is_shortcut = file.get("mimeType") == "application/vnd.google-apps.shortcut"
 
-        item = {
-            "id": file.get("id"),
-            "name": file.get("name"),
-            "type": "folder" if is_folder else "file",
-            "mime_type": file.get("mimeType"),
-            "modified_time": file.get("modifiedTime"),
-            "size": file.get("size")
-        }
+def _folder_item(file: dict) -> dict:
+    """Build a folder listing item from a files.list entry."""
+    is_folder = file.get("mimeType") == "application/vnd.google-apps.folder"
+    is_shortcut = file.get("mimeType") == "application/vnd.google-apps.shortcut"
 
-        # For shortcuts, include target info for downloading
-        if is_shortcut:
-            shortcut_details = file.get("shortcutDetails", {})
-            item["target_id"] = shortcut_details.get("targetId")
-            item["target_mime_type"] = shortcut_details.get("targetMimeType")
+    item = {
+        "id": file.get("id"),
+        "name": file.get("name"),
+        "type": "folder" if is_folder else "file",
+        "mime_type": file.get("mimeType"),
+        "modified_time": file.get("modifiedTime"),
+        "size": file.get("size")
+    }
 
-        items.append(item)
+    # For shortcuts, include target info for downloading
+    if is_shortcut:
+        shortcut_details = file.get("shortcutDetails", {})
+        item["target_id"] = shortcut_details.get("targetId")
+        item["target_mime_type"] = shortcut_details.get("targetMimeType")
 
-    return {
-        "items": items,
-        "next_page_token": results.get("nextPageToken")
-    }
+    return item
 
 
 def create_folder(
@@ -97,6 +159,8 @@ def create_folder(
         body=file_metadata,
         fields="id, name"
     ).execute()
+    # A path or name that was not found a moment ago may exist now
+    clear_folder_cache()
 
     return {
         "id": folder.get("id"),
@@ -105,6 +169,7 @@ def create_folder(
     }
 
 
+@ttl_cache(ttl=300, negative_ttl=30)
 def find_folder_by_path(
     path: str,
     drive: str = "my_drive",
@@ -120,6 +185,8 @@ def find_folder_by_path(
 
     Returns:
         Dict with folder id, name, and path, or None if not found.
+        Results are cached in memory per profile for 5 minutes (30 seconds
+        for not found).
 
     Raises:
         AmbiguousFolderError: If multiple folders match at the same path level.
@@ -137,29 +204,11 @@ def find_folder_by_path(
         # Assume drive is a Shared Drive ID
         current_parent = drive
 
-    for part in parts:
-        # Escape single quotes in folder names
-        escaped_name = part.replace("'", "\\'")
-        results = service.files().list(
-            q=f"'{current_parent}' in parents and name = '{escaped_name}' and mimeType = 'application/vnd.google-apps.folder' and trashed = false",
-            fields="files(id, name)",
-            supportsAllDrives=True,
-            includeItemsFromAllDrives=True,
-            pageSize=10  # Get enough to detect ambiguity
-        ).execute()
-
-        files = results.get("files", [])
-        if not files:
+    if parts:
+        current_parent = _resolve_path(service, parts, current_parent)
+        if current_parent is None:
             return None
 
-        if len(files) > 1:
-            folder_names = [f"{f['name']} ({f['id']})" for f in files]
-            raise AmbiguousFolderError(
-                f"Multiple folders named '{part}' at this level: {folder_names}"
-            )
-
-        current_parent = files[0]["id"]
-
     return {
         "id": current_parent,
         "name": parts[-1] if parts else "root",
@@ -167,6 +216,42 @@ def find_folder_by_path(
     }
 
 
+def find_folders_by_paths(
+    paths: List[str],
+    drive: str = "my_drive",
+    folder_id: Optional[str] = None,
+) -> Dict[str, Optional[dict]]:
+    """
+    Find several folders by path, resolving the paths concurrently.
+
+    Each path is looked up as by find_folder_by_path (and shares its cache);
+    independent lookups overlap instead of running one after another.
+
+    Args:
+        paths: Folder paths with '/' separators
+        drive: Starting drive - "my_drive" or a Shared Drive ID. Ignored if folder_id set.
+        folder_id: Start from this folder ID instead of a drive root.
+
+    Returns:
+        Dict mapping each path to its folder dict, or None if not found.
+
+    Raises:
+        AmbiguousFolderError: If multiple folders match at the same level of any path.
+    """
+    unique = list(dict.fromkeys(paths))
+
+    def find(path):
+        return find_folder_by_path(path, drive=drive, folder_id=folder_id)
+
+    if len(unique) > 1:
+        with ThreadPoolExecutor(max_workers=min(MAX_PATH_RESOLVERS, len(unique))) as pool:
+            folders = list(pool.map(find, unique))
+    else:
+        folders = [find(path) for path in unique]
+    return dict(zip(unique, folders))
+
+
+@ttl_cache(ttl=60)
 def search_folders(
     name: str,
     match: Literal["exact", "contains"] = "contains",
@@ -175,7 +260,8 @@ def search_folders(
     """
     Search for folders by name across all accessible locations.
 
-    Single API call. Returns what Drive API provides directly.
+    Single API call. Returns what Drive API provides directly. Results are
+    cached in memory per profile for one minute.
 
     Args:
         name: Folder name to search for.
@@ -188,13 +274,9 @@ def search_folders(
     """
     service = get_drive_service()
 
-    # Build query - escape single quotes
-    escaped_name = name.replace("'", "\\'")
     op = "=" if match == "exact" else "contains"
-    q = f"mimeType = 'application/vnd.google-apps.folder' and name {op} '{escaped_name}' and trashed = false"
-
     results = service.files().list(
-        q=q,
+        q=_Q_FOLDER_NAME.format(op=op, name=escape_query_value(name)),
         corpora="allDrives",
         includeItemsFromAllDrives=True,
         supportsAllDrives=True,
@@ -214,3 +296,76 @@ def search_folders(
         })
 
     return folders
+
+
+def _ambiguous(part: str, files: List[dict]) -> AmbiguousFolderError:
+    folder_names = [f"{f['name']} ({f['id']})" for f in files]
+    return AmbiguousFolderError(
+        f"Multiple folders named '{part}' at this level: {folder_names}"
+    )
+
+
+def _resolve_path(service, parts: List[str], start: str) -> Optional[str]:
+    """
+    Resolve path segments below a starting folder to a folder ID.
+
+    Fetches every candidate folder with one files.list query and matches
+    parents locally. Falls back to one query per segment when that cannot be
+    done reliably: the first segment's name repeats deeper in the path (its
+    candidates can't be told apart from deeper ones without the start ID,
+    which may be the 'root' alias), or the candidates span several pages.
+    """
+    lowered = [part.lower() for part in parts]
+    if lowered[0] in lowered[1:]:
+        return _walk_path(service, parts, start)
+
+    name_clauses = " or ".join(f"name = '{escape_query_value(part)}'" for part in parts[1:])
+    first_clause = f"('{escape_query_value(start)}' in parents and name = '{escape_query_value(parts[0])}')"
+    name_query = f"{first_clause} or {name_clauses}" if name_clauses else first_clause
+    results = service.files().list(
+        q=f"{_FOLDER_QUERY} and ({name_query})",
+        fields="nextPageToken, files(id, name, parents)",
+        supportsAllDrives=True,
+        includeItemsFromAllDrives=True,
+        pageSize=1000
+    ).execute()
+    if results.get("nextPageToken"):
+        return _walk_path(service, parts, start)
+
+    by_name: Dict[str, List[dict]] = {}
+    for f in results.get("files", []):
+        by_name.setdefault(f["name"].lower(), []).append(f)
+
+    # Only the first clause can match the first segment's name
+    matches = by_name.get(lowered[0], [])
+    for depth, part in enumerate(parts):
+        if depth:
+            matches = [f for f in by_name.get(lowered[depth], []) if current in f.get("parents", [])]
+        if not matches:
+            return None
+        if len(matches) > 1:
+            raise _ambiguous(part, matches)
+        current = matches[0]["id"]
+    return current
+
+
+def _walk_path(service, parts: List[str], start: str) -> Optional[str]:
+    """Resolve path segments with one files.list query per segment."""
+    current_parent = start
+    for part in parts:
+        results = service.files().list(
+            q=_Q_CHILD_FOLDER.format(parent=escape_query_value(current_parent), name=escape_query_value(part)),
+            fields="files(id, name)",
+            supportsAllDrives=True,
+            includeItemsFromAllDrives=True,
+            pageSize=10  # Get enough to detect ambiguity
+        ).execute()
+
+        files = results.get("files", [])
+        if not files:
+            return None
+        if len(files) > 1:
+            raise _ambiguous(part, files)
+
+        current_parent = files[0]["id"]
+    return current_parent
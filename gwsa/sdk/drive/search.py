@@ -1,6 +1,12 @@
 """Google Drive search operations."""
 from .service import get_drive_service
 
+
+def escape_query_value(value: str) -> str:
+    """Escape a value for use inside a single-quoted Drive query string."""
+    return value.replace("\\", "\\\\").replace("'", "\\'")
+
+
 def search_drive(query: str, max_results: int = 25):
     """
     Searches Google Drive for files matching a query.
@@ -1,18 +1,16 @@
 """Google Drive service factory."""
 
-from googleapiclient.discovery import build
-
-from ..auth import get_credentials
+from ..auth import get_service
 
 
 def get_drive_service():
     """
     Build and return a Google Drive API service object.
 
-    Uses credentials from the active gwsa profile.
+    Uses credentials from the active gwsa profile. Services are cached per
+    profile and thread (see auth.get_service).
 
     Returns:
         Google Drive API service object
     """
-    creds, _ = get_credentials()
-    return build("drive", "v3", credentials=creds)
+    return get_service("drive", "v3")
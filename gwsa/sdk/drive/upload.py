@@ -8,6 +8,40 @@ from googleapiclient.http import MediaFileUpload
 
 from .service import get_drive_service
 
+# Files at least this large use a chunked resumable upload; smaller ones are
+# sent in a single multipart request, skipping the resumable session setup
+RESUMABLE_THRESHOLD = 5 * 1024 * 1024
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+UPLOAD_NUM_RETRIES = 3
+
+
+def _media_for(local_path: str, mime_type: str) -> MediaFileUpload:
+    """Build the media body, resumable and chunked only for larger files."""
+    if os.path.getsize(local_path) < RESUMABLE_THRESHOLD:
+        return MediaFileUpload(local_path, mimetype=mime_type, resumable=False)
+    return MediaFileUpload(
+        local_path,
+        mimetype=mime_type,
+        resumable=True,
+        chunksize=UPLOAD_CHUNK_SIZE
+    )
+
+
+def _execute_upload(request, idempotent: bool) -> dict:
+    """
+    Run an upload request, sending resumable uploads chunk by chunk.
+
+    Resumable chunks are always retried, since a session only completes once.
+    A single-request upload is retried only if idempotent: retrying a create
+    after a 5xx the server had already acted on would store a duplicate file.
+    """
+    if not request.resumable:
+        return request.execute(num_retries=UPLOAD_NUM_RETRIES if idempotent else 0)
+    response = None
+    while response is None:
+        _, response = request.next_chunk(num_retries=UPLOAD_NUM_RETRIES)
+    return response
+
 
 def upload_file(
     local_path: str,
@@ -40,17 +74,13 @@ def upload_file(
     if folder_id and folder_id != "root":
         file_metadata["parents"] = [folder_id]
 
-    media = MediaFileUpload(
-        local_path,
-        mimetype=mime_type,
-        resumable=True
-    )
+    media = _media_for(local_path, mime_type)
 
-    file = service.files().create(
+    file = _execute_upload(service.files().create(
         body=file_metadata,
         media_body=media,
         fields="id, name, webViewLink"
-    ).execute()
+    ), idempotent=False)
 
     return {
         "id": file.get("id"),
@@ -86,18 +116,14 @@ def update_file(
     if new_name:
         file_metadata["name"] = new_name
 
-    media = MediaFileUpload(
-        local_path,
-        mimetype=mime_type,
-        resumable=True
-    )
+    media = _media_for(local_path, mime_type)
 
-    file = service.files().update(
+    file = _execute_upload(service.files().update(
         fileId=file_id,
         body=file_metadata,
         media_body=media,
         fields="id, name, webViewLink"
-    ).execute()
+    ), idempotent=True)
 
     return {
         "id": file.get("id"),
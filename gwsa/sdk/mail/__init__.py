@@ -20,8 +20,8 @@ Example usage:
 
 from .service import get_gmail_service
 from .search import search_messages
-from .read import read_message, read_messages, get_attachment, get_thread
-from .label import modify_labels, add_label, remove_label, list_labels
+from .read import read_message, read_messages, get_attachment, save_attachment, get_thread
+from .label import modify_labels, add_label, remove_label, list_labels, prefetch_labels, clear_label_cache
 from .send import send_message, create_draft, reply_message
 
 __all__ = [
@@ -30,11 +30,14 @@ __all__ = [
     "read_message",
     "read_messages",
     "get_attachment",
+    "save_attachment",
     "get_thread",
     "modify_labels",
     "add_label",
     "remove_label",
     "list_labels",
+    "prefetch_labels",
+    "clear_label_cache",
     "send_message",
     "create_draft",
     "reply_message",
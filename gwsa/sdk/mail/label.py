@@ -5,10 +5,50 @@ from typing import Dict, Any, List, Optional
 
 from googleapiclient.errors import HttpError
 
+from ..cache import get_cached_labels, set_cached_labels, ttl_cache
+from ..profiles import get_active_profile_name
 from .service import get_gmail_service
 
 logger = logging.getLogger(__name__)
 
+# Partial response for labels.list: only the documented fields of each label
+LABEL_FIELDS = 'labels(id,name,type)'
+
+# Gmail allows up to 100 calls per batch; larger batches are often throttled
+_BATCH_SIZE = 50
+
+
+def _account_key(profile: Optional[str], use_adc: bool) -> str:
+    """Key identifying the account a profile/use_adc pair resolves to."""
+    return 'adc' if use_adc else (profile or get_active_profile_name() or 'adc')
+
+
+def clear_label_cache() -> None:
+    """Forget cached label name -> ID maps for all accounts."""
+    _get_label_map.cache_clear()
+
+
+# Cached so labelling a message costs one modify call
+@ttl_cache(ttl=300, maxsize=64)
+def _get_label_map(profile: Optional[str], use_adc: bool) -> Dict[str, str]:
+    """Return the label name -> ID map for an account."""
+    labels = list_labels(profile=profile, use_adc=use_adc)
+    return {label['name']: label['id'] for label in labels}
+
+
+def prefetch_labels(profile: str = None, use_adc: bool = False) -> int:
+    """
+    Load an account's label name -> ID map ahead of the first label change.
+
+    Args:
+        profile: Optional profile name to use
+        use_adc: Force use of Application Default Credentials
+
+    Returns:
+        Number of labels cached
+    """
+    return len(_get_label_map(profile, use_adc))
+
 
 def list_labels(
     profile: str = None,
@@ -21,12 +61,36 @@ def list_labels(
         profile: Optional profile name to use
         use_adc: Force use of Application Default Credentials
 
+    The last response is cached per account together with its ETag, and later
+    calls send it as If-None-Match so an unchanged label list comes back as a
+    bodyless 304.
+
     Returns:
         List of label dicts with 'id', 'name', 'type' fields
     """
     service = get_gmail_service(profile=profile, use_adc=use_adc)
-    results = service.users().labels().list(userId='me').execute()
-    return results.get('labels', [])
+    account_key = _account_key(profile, use_adc)
+    cached = get_cached_labels(account_key)
+
+    request = service.users().labels().list(userId='me', fields=LABEL_FIELDS)
+    if cached and cached.get('etag'):
+        request.headers['If-None-Match'] = cached['etag']
+    response_headers = {}
+    request.add_response_callback(response_headers.update)
+
+    try:
+        results = request.execute()
+    except HttpError as e:
+        if cached and e.resp.status == 304:
+            logger.debug(f"Labels for '{account_key}' not modified, using cached list")
+            return cached['labels']
+        raise
+
+    labels = results.get('labels', [])
+    etag = response_headers.get('etag')
+    if etag:
+        set_cached_labels(account_key, etag, labels)
+    return labels
 
 
 def get_or_create_label(
@@ -45,24 +109,71 @@ def get_or_create_label(
     Returns:
         Label ID
     """
+    label_map = _get_label_map(profile, use_adc)
+    if label_name in label_map:
+        logger.debug(f"Label '{label_name}' exists with ID: {label_map[label_name]}")
+        return label_map[label_name]
+
+    return _create_labels([label_name], label_map, profile, use_adc)[label_name]
+
+
+def _create_labels(
+    label_names: List[str],
+    label_map: Dict[str, str],
+    profile: Optional[str],
+    use_adc: bool,
+) -> Dict[str, str]:
+    """Create labels in batched requests and record their IDs in label_map.
+
+    Returns the name -> ID map of the created labels. A label that already
+    exists (created since the label map was cached) is resolved from a fresh
+    listing instead. If any create still fails, the labels that were created
+    are recorded and the first error is raised.
+    """
     service = get_gmail_service(profile=profile, use_adc=use_adc)
-    labels = service.users().labels().list(userId='me').execute().get('labels', [])
-
-    for label in labels:
-        if label['name'] == label_name:
-            logger.debug(f"Label '{label_name}' exists with ID: {label['id']}")
-            return label['id']
-
-    # Create the label
-    logger.debug(f"Creating label '{label_name}'")
-    create_body = {
-        'name': label_name,
-        'labelListVisibility': 'labelShow',
-        'messageListVisibility': 'show'
-    }
-    created = service.users().labels().create(userId='me', body=create_body).execute()
-    logger.debug(f"Created label '{label_name}' with ID: {created['id']}")
-    return created['id']
+    created = {}
+    conflicts = {}
+    errors = []
+
+    def callback(request_id, response, exception):
+        name = label_names[int(request_id)]
+        if isinstance(exception, HttpError) and exception.resp.status == 409:
+            logger.debug(f"Label '{name}' already exists")
+            conflicts[name] = exception
+        elif exception:
+            logger.warning(f"Error creating label '{name}': {exception}")
+            errors.append(exception)
+        else:
+            logger.debug(f"Created label '{name}' with ID: {response['id']}")
+            created[name] = response['id']
+
+    for i in range(0, len(label_names), _BATCH_SIZE):
+        batch = service.new_batch_http_request(callback=callback)
+        for j, name in enumerate(label_names[i:i + _BATCH_SIZE], start=i):
+            logger.debug(f"Creating label '{name}'")
+            create_body = {
+                'name': name,
+                'labelListVisibility': 'labelShow',
+                'messageListVisibility': 'show'
+            }
+            batch.add(service.users().labels().create(userId='me', body=create_body),
+                      request_id=str(j))
+        batch.execute()
+
+    label_map.update(created)
+    if conflicts:
+        # The cached map is stale; relist and pick up the existing labels
+        clear_label_cache()
+        fresh_map = _get_label_map(profile, use_adc)
+        label_map.update(fresh_map)
+        for name, exception in conflicts.items():
+            if name in fresh_map:
+                created[name] = fresh_map[name]
+            else:
+                errors.append(exception)
+    if errors:
+        raise errors[0]
+    return created
 
 
 def modify_labels(
@@ -91,14 +202,16 @@ def modify_labels(
     add_label_ids = []
     remove_label_ids = []
 
+    label_map = _get_label_map(profile, use_adc) if add_labels or remove_labels else {}
+
     if add_labels:
-        for name in add_labels:
-            label_id = get_or_create_label(name, profile=profile, use_adc=use_adc)
-            add_label_ids.append(label_id)
+        # Missing labels are created together in one batch
+        missing = list(dict.fromkeys(name for name in add_labels if name not in label_map))
+        if missing:
+            _create_labels(missing, label_map, profile, use_adc)
+        add_label_ids = [label_map[name] for name in add_labels]
 
     if remove_labels:
-        labels = list_labels(profile=profile, use_adc=use_adc)
-        label_map = {l['name']: l['id'] for l in labels}
         for name in remove_labels:
             if name in label_map:
                 remove_label_ids.append(label_map[name])
@@ -114,9 +227,14 @@ def modify_labels(
         'removeLabelIds': remove_label_ids
     }
 
-    updated = service.users().messages().modify(
-        userId='me', id=message_id, body=body
-    ).execute()
+    try:
+        updated = service.users().messages().modify(
+            userId='me', id=message_id, body=body
+        ).execute()
+    except HttpError:
+        # A cached ID may belong to a label deleted elsewhere; relist next time
+        clear_label_cache()
+        raise
 
     logger.debug(f"Modified labels for message {message_id}")
     return updated
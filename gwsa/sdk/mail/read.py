@@ -56,16 +56,23 @@ def _extract_attachments(payload: dict) -> List[Dict[str, Any]]:
     return attachments
 
 
+# Partial response for messages.get: only the parts read_message(s) use
+MESSAGE_FIELDS = 'id,threadId,labelIds,snippet,payload'
+
+
 def read_message(
     message_id: str,
     profile: str = None,
     use_adc: bool = False,
+    format: str = 'full',
 ) -> Dict[str, Any]:
     """
     Retrieve the full content of a specific Gmail message.
 
     Args:
         message_id: The Gmail message ID
+        format: 'full' (default, includes body and attachments) or
+                'metadata' (headers, snippet and labels only)
         profile: Optional profile name to use
         use_adc: Force use of Application Default Credentials
 
@@ -85,7 +92,7 @@ def read_message(
     logger.debug(f"Retrieving message with ID: {message_id}")
 
     msg = service.users().messages().get(
-        userId='me', id=message_id, format='full'
+        userId='me', id=message_id, format=format, fields=MESSAGE_FIELDS
     ).execute()
 
     headers = msg['payload']['headers']
@@ -181,7 +188,10 @@ def read_messages(
         chunk = message_ids[i:i + batch_size]
         
         for msg_id in chunk:
-            batch.add(service.users().messages().get(userId='me', id=msg_id, format='full'), request_id=msg_id)
+            batch.add(
+                service.users().messages().get(userId='me', id=msg_id, format='full', fields=MESSAGE_FIELDS),
+                request_id=msg_id
+            )
         
         batch.execute()
 
@@ -200,46 +210,46 @@ def _extract_body_parts(payload: dict) -> tuple:
     """
     Extract text and HTML body parts from a message payload.
 
+    Parts are visited depth-first in document order, and the first
+    text/plain and text/html parts win. The walk stops once both are found.
+
     Returns:
         Tuple of (text_body, html_body)
     """
+    if 'parts' not in payload:
+        # Simple message, check top-level body
+        return _decode_part_body(payload), None
+
     text_body = None
     html_body = None
-
-    def extract_from_part(part: dict) -> Optional[str]:
-        """Extract and decode body content from a MIME part."""
-        if 'body' in part and 'data' in part['body']:
-            encoded_data = part['body']['data']
-            return base64.urlsafe_b64decode(encoded_data).decode('utf-8', errors='ignore')
-        return None
-
-    def process_part(part: dict):
-        """Process a single part, looking for text/plain and text/html."""
-        nonlocal text_body, html_body
-
+    stack = list(reversed(payload['parts']))
+    while stack and (text_body is None or html_body is None):
+        part = stack.pop()
         mime_type = part.get('mimeType', '')
 
-        if mime_type == 'text/plain' and text_body is None:
-            text_body = extract_from_part(part)
-        elif mime_type == 'text/html' and html_body is None:
-            html_body = extract_from_part(part)
+        if mime_type == 'text/plain':
+            if text_body is None:
+                text_body = _decode_part_body(part)
+        elif mime_type == 'text/html':
+            if html_body is None:
+                html_body = _decode_part_body(part)
 
-        # Also check nested parts
-        if 'parts' in part:
-            for subpart in part['parts']:
-                process_part(subpart)
-
-    # Check for multipart message
-    if 'parts' in payload:
-        for part in payload['parts']:
-            process_part(part)
-    else:
-        # Simple message, check top-level body
-        text_body = extract_from_part(payload)
+        # Nested parts are visited before the next sibling
+        subparts = part.get('parts')
+        if subparts:
+            stack.extend(reversed(subparts))
 
     return text_body, html_body
 
 
+def _decode_part_body(part: dict) -> Optional[str]:
+    """Extract and decode body content from a MIME part."""
+    data = part.get('body', {}).get('data')
+    if data is None:
+        return None
+    return base64.urlsafe_b64decode(data).decode('utf-8', errors='ignore')
+
+
 def get_attachment(
     message_id: str,
     attachment_id: str,
@@ -278,6 +288,57 @@ def get_attachment(
         'size': attachment.get('size', len(data)),
     }
 
+
+# Base64 characters decoded per write; a multiple of 4 so chunks decode independently
+_ATTACHMENT_DECODE_CHUNK = 1024 * 1024
+
+
+def save_attachment(
+    message_id: str,
+    attachment_id: str,
+    save_path: str,
+    profile: str = None,
+    use_adc: bool = False,
+) -> int:
+    """
+    Download an attachment from a Gmail message straight to a file.
+
+    Unlike get_attachment, the decoded content is written to disk chunk by
+    chunk rather than materialized as one bytes object.
+
+    Args:
+        message_id: The Gmail message ID containing the attachment
+        attachment_id: The attachment ID (from read_message attachments list)
+        save_path: Local file path to write the attachment to
+        profile: Optional profile name to use
+        use_adc: Force use of Application Default Credentials
+
+    Returns:
+        Number of bytes written
+    """
+    service = get_gmail_service(profile=profile, use_adc=use_adc)
+    logger.debug(f"Saving attachment {attachment_id} from message {message_id} to {save_path}")
+
+    attachment = service.users().messages().attachments().get(
+        userId='me',
+        messageId=message_id,
+        id=attachment_id
+    ).execute()
+
+    encoded = attachment['data']
+    written = 0
+    with open(save_path, 'wb') as f:
+        for i in range(0, len(encoded), _ATTACHMENT_DECODE_CHUNK):
+            written += f.write(base64.urlsafe_b64decode(encoded[i:i + _ATTACHMENT_DECODE_CHUNK]))
+
+    logger.debug(f"Saved attachment: {written} bytes")
+    return written
+
+
+# Headers read from each message in get_thread
+_THREAD_HEADERS = ['Subject', 'From', 'To', 'Date']
+
+
 def get_thread(
     thread_id: str,
     profile: str = None,
@@ -297,7 +358,12 @@ def get_thread(
     service = get_gmail_service(profile=profile, use_adc=use_adc)
     logger.debug(f"Retrieving thread with ID: {thread_id}")
 
-    thread = service.users().threads().get(userId='me', id=thread_id).execute()
+    # threads.get already returns every message in one call; only the headers
+    # and snippet are used, so skip the bodies
+    thread = service.users().threads().get(
+        userId='me', id=thread_id, format='metadata',
+        metadataHeaders=_THREAD_HEADERS
+    ).execute()
 
     # Simplify each message in the thread
     simplified_messages = []
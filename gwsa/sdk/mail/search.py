@@ -25,7 +25,9 @@ def search_messages(
         query: Gmail API query string (e.g., "from:user@example.com")
         page_token: Token for pagination (None for first page)
         max_results: Maximum number of messages to return (default 25, max 500)
-        format: 'full' (includes body) or 'metadata' (headers only, faster)
+        format: 'full' (includes body) or 'metadata' (headers only, faster: only
+                METADATA_HEADERS are returned). Either way the messages are
+                fetched in batched requests rather than one call each.
         profile: Optional profile name to use
         use_adc: Force use of Application Default Credentials
 
@@ -39,7 +41,7 @@ def search_messages(
     logger.debug(f"Searching for emails with query: '{query}'")
 
     # Build the list request with pagination
-    list_kwargs = {"userId": "me", "q": query, "maxResults": max_results}
+    list_kwargs = {"userId": "me", "q": query, "maxResults": max_results, "fields": LIST_FIELDS}
     if page_token:
         list_kwargs["pageToken"] = page_token
 
@@ -59,55 +61,97 @@ def search_messages(
 
     logger.debug(f"Found {len(messages)} messages on this page")
 
-    parsed_messages = []
-    for message in messages:
-        msg = service.users().messages().get(
-            userId='me', id=message['id'], format=format
-        ).execute()
-
-        headers = msg['payload'].get('headers', [])
-        label_ids = msg.get('labelIds', [])
-
-        subject = "N/A"
-        from_addr = "N/A"
-        to_addr = "N/A"
-        date = "N/A"
-
-        for header in headers:
-            name = header['name'].lower()
-            if name == 'subject':
-                subject = header['value']
-            elif name == 'from':
-                from_addr = header['value']
-            elif name == 'to':
-                to_addr = header['value']
-            elif name == 'date':
-                date = header['value']
-
-        msg_dict = {
-            "id": message['id'],
-            "subject": subject,
-            "from": from_addr,
-            "to": to_addr,
-            "date": date,
-            "labelIds": label_ids
-        }
-
-        # Extract body, snippet, and attachments only if format='full'
-        if format == 'full':
-            body = _extract_body(msg)
-            snippet = msg.get('snippet', '')
-            attachments = _extract_attachments(msg['payload'])
-            msg_dict['body'] = body
-            msg_dict['snippet'] = snippet
-            msg_dict['attachments'] = attachments
-
-        parsed_messages.append(msg_dict)
+    fetched = _batch_get_messages(service, [m['id'] for m in messages], format)
+    parsed_messages = [
+        _parse_message(m['id'], fetched[m['id']], format)
+        for m in messages if m['id'] in fetched
+    ]
 
     logger.debug(f"Successfully parsed {len(parsed_messages)} messages")
     return parsed_messages, metadata
 
 
+# Headers requested for metadata-format searches (all that _parse_message reads)
+METADATA_HEADERS = ['Subject', 'From', 'To', 'Date']
+
+# Partial responses: only the parts of each resource that search_messages uses
+LIST_FIELDS = 'messages/id,nextPageToken,resultSizeEstimate'
+METADATA_FIELDS = 'id,labelIds,payload/headers'
+
+# Gmail accepts up to 100 calls per batch but recommends smaller batches
+_BATCH_SIZE = 50
+
+
+def _batch_get_messages(service, message_ids: List[str], format: str) -> Dict[str, dict]:
+    """Fetch message resources in batched requests, keyed by ID.
+
+    Metadata-format requests ask only for METADATA_HEADERS. Messages that fail
+    to load are logged and left out.
+    """
+    fetched = {}
+
+    def callback(request_id, response, exception):
+        if exception:
+            logger.warning(f"Error retrieving message {request_id}: {exception}")
+        else:
+            fetched[request_id] = response
+
+    get_kwargs = {'userId': 'me', 'format': format}
+    if format == 'metadata':
+        get_kwargs['metadataHeaders'] = METADATA_HEADERS
+        get_kwargs['fields'] = METADATA_FIELDS
+
+    for i in range(0, len(message_ids), _BATCH_SIZE):
+        batch = service.new_batch_http_request(callback=callback)
+        for msg_id in message_ids[i:i + _BATCH_SIZE]:
+            batch.add(service.users().messages().get(id=msg_id, **get_kwargs), request_id=msg_id)
+        batch.execute()
+
+    return fetched
+
+
+def _parse_message(message_id: str, msg: dict, format: str) -> Dict[str, Any]:
+    """Build a search result dict from a messages.get response."""
+    headers = msg['payload'].get('headers', [])
+    label_ids = msg.get('labelIds', [])
+
+    subject = "N/A"
+    from_addr = "N/A"
+    to_addr = "N/A"
+    date = "N/A"
+
+    for header in headers:
+        name = header['name'].lower()
+        if name == 'subject':
+            subject = header['value']
+        elif name == 'from':
+            from_addr = header['value']
+        elif name == 'to':
+            to_addr = header['value']
+        elif name == 'date':
+            date = header['value']
+
+    msg_dict = {
+        "id": message_id,
+        "subject": subject,
+        "from": from_addr,
+        "to": to_addr,
+        "date": date,
+        "labelIds": label_ids
+    }
+
+    # Extract body, snippet, and attachments only if format='full'
+    if format == 'full':
+        body = _extract_body(msg)
+        snippet = msg.get('snippet', '')
+        attachments = _extract_attachments(msg['payload'])
+        msg_dict['body'] = body
+        msg_dict['snippet'] = snippet
+        msg_dict['attachments'] = attachments
+
+    return msg_dict
+
+
 def _extract_body(msg: dict) -> str:
     """Extract plain text body from a message."""
     body = ""
@@ -220,8 +220,11 @@ def reply_message(
     """
     service = get_gmail_service(profile=profile, use_adc=use_adc)
 
-    # Fetch original message to get threading info
-    original = read_message(reply_to_message_id, profile=profile, use_adc=use_adc)
+    # Fetch original message to get threading info (the body is only needed for quoting)
+    original = read_message(
+        reply_to_message_id, profile=profile, use_adc=use_adc,
+        format='full' if include_quote else 'metadata'
+    )
     thread_id = original.get("threadId")
     message_id = original.get("messageId")  # RFC 2822 Message-ID header
     original_subject = original.get("subject", "")
@@ -3,9 +3,7 @@
 import logging
 from typing import Optional, Any
 
-from googleapiclient.discovery import build
-
-from ..auth import get_credentials
+from ..auth import get_service
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +12,8 @@ def get_gmail_service(profile: str = None, use_adc: bool = False) -> Any:
     """
     Get an authenticated Gmail API service object.
 
+    Services are cached per profile and thread (see auth.get_service).
+
     Args:
         profile: Optional profile name to use (defaults to active profile)
         use_adc: Force use of Application Default Credentials
@@ -25,6 +25,4 @@ def get_gmail_service(profile: str = None, use_adc: bool = False) -> Any:
         ValueError: If no profile configured
         Exception: If authentication fails
     """
-    creds, source = get_credentials(profile=profile, use_adc=use_adc)
-    logger.debug(f"Building Gmail service using credentials from: {source}")
-    return build("gmail", "v1", credentials=creds)
+    return get_service("gmail", "v1", profile=profile, use_adc=use_adc)
@@ -1 +1 @@
-from .service import get_person_name, get_me
\ No newline at end of file
+from .service import get_person_name, get_first_name, get_me, prefetch_person_names
\ No newline at end of file
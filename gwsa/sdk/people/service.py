@@ -1,19 +1,30 @@
 """Google People API service for GWSA SDK."""
 
 import logging
-from typing import Any, Dict
+import time
+from typing import Any, Dict, Iterable, Optional, Tuple
 
-from googleapiclient.discovery import build
-from ..auth import get_credentials
-from ..cache import get_cached_profile, set_cached_profile
+from ..auth import get_service
+from ..cache import get_cached_profile, set_cached_profile, get_cached_person_name, set_cached_person_name, ttl_cache
 from ..timing import time_api_call
 
 logger = logging.getLogger(__name__)
 
+# Process-wide memo of resolved names: user_id -> (display_name, expires_at).
+# Failed lookups are remembered too, for a shorter time, so unresolvable
+# users (deleted accounts, external users) don't cost a round-trip per call.
+_PERSON_TTL = 3600.0
+_PERSON_NEGATIVE_TTL = 300.0
+_person_name_memo: Dict[str, Tuple[str, float]] = {}
+
+# people.getBatchGet accepts at most 200 resource names per call
+_BATCH_GET_SIZE = 200
+
 def get_people_service() -> Any:
     """Get an authenticated Google People API service object."""
-    creds, _ = get_credentials()
-    return build("people", "v1", credentials=creds, static_discovery=False)
+    # Uses the discovery document bundled with googleapiclient, so building
+    # the service needs no network round-trip
+    return get_service("people", "v1")
 
 @time_api_call
 def _fetch_person_from_api(resource_name: str, fields: str = 'names'):
@@ -41,10 +52,16 @@ def get_person_name(user_id: str) -> str:
     
     resource_name = f"people/{user_id}"
 
-    # Try the cache first
-    cached_data = get_cached_profile(user_id)
-    if cached_data:
-        return cached_data.get('displayName', 'Unknown')
+    # In-process memo avoids re-reading the disk cache for repeat senders
+    memo = _person_name_memo.get(user_id)
+    if memo and memo[1] > time.monotonic():
+        return memo[0]
+
+    # Try the cache next
+    display_name = get_cached_person_name(user_id)
+    if display_name:
+        _person_name_memo[user_id] = (display_name, time.monotonic() + _PERSON_TTL)
+        return display_name
 
     # Fetch from API
     try:
@@ -55,17 +72,95 @@ def get_person_name(user_id: str) -> str:
             display_name = person['names'][0].get('displayName', 'Unknown')
         
         # Cache the result
-        set_cached_profile(user_id, {'displayName': display_name})
+        set_cached_person_name(user_id, display_name)
+        _person_name_memo[user_id] = (display_name, time.monotonic() + _PERSON_TTL)
         return display_name
     except Exception as e:
         logger.error(f"Error fetching name for {user_id}: {e}")
+        _person_name_memo[user_id] = ("Unknown", time.monotonic() + _PERSON_NEGATIVE_TTL)
         return "Unknown"
 
+@time_api_call
+def _batch_fetch_people_from_api(resource_names, fields: str = 'names'):
+    """Helper function to isolate the batch API call for timing."""
+    service = get_people_service()
+    return service.people().getBatchGet(
+        resourceNames=resource_names,
+        personFields=fields
+    ).execute()
+
+def prefetch_person_names(user_ids: Iterable[str]) -> int:
+    """
+    Resolve many user IDs with batched People API calls.
+
+    IDs already memoized or cached are skipped; the rest are fetched up to
+    200 per request and cached, so later get_person_name calls for them
+    make no API call. Returns the number of names fetched.
+    """
+    now = time.monotonic()
+    pending = []
+    for user_id in dict.fromkeys(user_ids):
+        if not user_id:
+            continue
+        if user_id.startswith('users/'):
+            user_id = user_id.split('/')[1]
+        memo = _person_name_memo.get(user_id)
+        if memo and memo[1] > now:
+            continue
+        display_name = get_cached_person_name(user_id)
+        if display_name:
+            _person_name_memo[user_id] = (display_name, now + _PERSON_TTL)
+            continue
+        pending.append(user_id)
+
+    fetched = 0
+    for i in range(0, len(pending), _BATCH_GET_SIZE):
+        chunk = pending[i:i + _BATCH_GET_SIZE]
+        try:
+            response = _batch_fetch_people_from_api([f"people/{u}" for u in chunk], fields='names')
+        except Exception as e:
+            # Leave these to get_person_name's per-user lookup
+            logger.error(f"Error batch fetching {len(chunk)} names: {e}")
+            continue
+
+        for entry in response.get('responses', []):
+            user_id = entry.get('requestedResourceName', '').split('/')[-1]
+            person = entry.get('person')
+            if not user_id:
+                continue
+            if not person:
+                _person_name_memo[user_id] = ("Unknown", time.monotonic() + _PERSON_NEGATIVE_TTL)
+                continue
+            display_name = "Unknown"
+            if person.get('names'):
+                display_name = person['names'][0].get('displayName', 'Unknown')
+            set_cached_person_name(user_id, display_name)
+            _person_name_memo[user_id] = (display_name, time.monotonic() + _PERSON_TTL)
+            fetched += 1
+    return fetched
+
+def get_first_name(user_id: str) -> str:
+    """
+    Resolve a Google User ID to the first word of its display name.
+
+    Backed by get_person_name's in-process memo, so repeat calls for the
+    same user don't hit the cache file or the API.
+    """
+    return get_person_name(user_id).split(' ', 1)[0]
+
 @time_api_call
 def get_me() -> Dict[str, Any]:
     """
     Get the authenticated user's profile information.
+
+    Memoized in memory per active profile, so repeat calls (e.g. every
+    triage run in the MCP server) skip the cache file and the API.
     """
+    return _get_me() or {}
+
+@ttl_cache(ttl=_PERSON_TTL, maxsize=16)
+def _get_me() -> Optional[Dict[str, Any]]:
+    """Load the profile behind get_me(); None on failure, so that isn't kept long."""
     user_id = "me"
     
     # Try cache (keyed by 'me')
@@ -85,4 +180,4 @@ def get_me() -> Dict[str, Any]:
         return person
     except Exception as e:
         logger.error(f"Error fetching 'me' profile: {e}")
-        return {}
\ No newline at end of file
+        return None
\ No newline at end of file
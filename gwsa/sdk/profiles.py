@@ -265,7 +265,7 @@ def create_profile(name: str, token_data: dict, profile_type: ProfileType = Prof
     profile_dir.mkdir(parents=True, exist_ok=True)
 
     with open(token_path, 'w') as f:
-        json.dump(token_data, f, indent=2)
+        json.dump(token_data, f, separators=(",", ":"))
 
     metadata = {
         "created": datetime.now().isoformat(),
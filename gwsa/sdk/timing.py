@@ -1,11 +1,14 @@
 import time
 import logging
+import threading
 from functools import wraps
 
 logger = logging.getLogger(__name__)
 
 # Dictionary to track counts per API function name
 _api_call_stats = {}
+# Calls may be made from worker threads (e.g. chat triage)
+_api_call_stats_lock = threading.Lock()
 
 def get_api_call_count():
     """Returns the total global API call count."""
@@ -27,7 +30,8 @@ def time_api_call(func):
         api_name = func.__name__
         
         # Track stats
-        _api_call_stats[api_name] = _api_call_stats.get(api_name, 0) + 1
+        with _api_call_stats_lock:
+            _api_call_stats[api_name] = _api_call_stats.get(api_name, 0) + 1
         
         logger.debug(f"Invoking {api_name} google api...")
         
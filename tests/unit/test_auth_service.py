@@ -0,0 +1,51 @@
+import threading
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from gwsa.sdk import auth
+
+
+@pytest.fixture
+def mock_build():
+    """Fixture to stub credential loading and service construction."""
+    auth.clear_service_cache()
+    with patch.object(auth, "get_credentials", return_value=(MagicMock(), "test")) as mock_creds, \
+         patch("googleapiclient.discovery.build", side_effect=lambda *a, **kw: MagicMock()) as build, \
+         patch("gwsa.sdk.profiles.get_active_profile_name", return_value="work"):
+        build.get_credentials = mock_creds
+        yield build
+    auth.clear_service_cache()
+
+
+def test_get_service_reuses_service(mock_build):
+    """The same API and profile returns the cached service on the same thread."""
+    first = auth.get_service("gmail", "v1")
+    assert auth.get_service("gmail", "v1") is first
+    assert mock_build.call_count == 1
+    assert mock_build.get_credentials.call_count == 1
+
+
+def test_get_service_keys_on_api_and_profile(mock_build):
+    """Different APIs or profiles get their own services."""
+    gmail = auth.get_service("gmail", "v1")
+    assert auth.get_service("drive", "v3") is not gmail
+    assert auth.get_service("gmail", "v1", profile="personal") is not gmail
+    assert mock_build.call_count == 3
+
+
+def test_get_service_is_per_thread(mock_build):
+    """Services are not shared across threads."""
+    main_service = auth.get_service("gmail", "v1")
+    other = []
+    thread = threading.Thread(target=lambda: other.append(auth.get_service("gmail", "v1")))
+    thread.start()
+    thread.join()
+    assert other[0] is not main_service
+
+
+def test_clear_service_cache(mock_build):
+    """Clearing the cache forces a rebuild."""
+    first = auth.get_service("gmail", "v1")
+    auth.clear_service_cache()
+    assert auth.get_service("gmail", "v1") is not first
@@ -0,0 +1,148 @@
+import json
+import os
+from datetime import datetime, timedelta
+
+import pytest
+from unittest.mock import patch
+
+from gwsa.sdk import cache
+
+
+@pytest.fixture
+def active_profile():
+    """Fixture to control the active profile seen by ttl_cache keys."""
+    with patch.object(cache, "get_active_profile_name", return_value="work") as mock_name:
+        yield mock_name
+
+
+def test_ttl_cache_reuses_results(active_profile):
+    """Repeated calls with the same arguments hit the function once."""
+    calls = []
+
+    @cache.ttl_cache(ttl=60)
+    def lookup(name):
+        calls.append(name)
+        return f"id-{name}"
+
+    assert lookup("Projects") == "id-Projects"
+    assert lookup("Projects") == "id-Projects"
+    assert calls == ["Projects"]
+
+
+def test_ttl_cache_keys_on_active_profile(active_profile):
+    """Switching profiles never returns another profile's cached value."""
+    calls = []
+
+    @cache.ttl_cache(ttl=60)
+    def lookup(name):
+        calls.append(name)
+        return f"id-{name}"
+
+    lookup("Projects")
+    active_profile.return_value = "personal"
+    lookup("Projects")
+    assert calls == ["Projects", "Projects"]
+
+
+def test_ttl_cache_evicts_least_recently_used(active_profile):
+    """The oldest entry is dropped once maxsize is exceeded."""
+    calls = []
+
+    @cache.ttl_cache(ttl=60, maxsize=2)
+    def lookup(name):
+        calls.append(name)
+        return name
+
+    lookup("a")
+    lookup("b")
+    lookup("a")
+    lookup("c")
+    lookup("a")
+    lookup("b")
+    assert calls == ["a", "b", "c", "b"]
+
+
+def test_ttl_cache_expires_negative_results_sooner(active_profile):
+    """None results use the shorter negative_ttl."""
+    calls = []
+
+    @cache.ttl_cache(ttl=60, negative_ttl=10)
+    def lookup(name):
+        calls.append(name)
+        return None
+
+    with patch.object(cache.time, "monotonic", return_value=100.0):
+        lookup("missing")
+    with patch.object(cache.time, "monotonic", return_value=105.0):
+        lookup("missing")
+    with patch.object(cache.time, "monotonic", return_value=111.0):
+        lookup("missing")
+    assert calls == ["missing", "missing"]
+
+
+def test_clear_memory_caches(active_profile):
+    """clear_memory_caches empties every ttl_cache."""
+    calls = []
+
+    @cache.ttl_cache(ttl=60)
+    def lookup(name):
+        calls.append(name)
+        return name
+
+    lookup("a")
+    assert cache.clear_memory_caches() >= 1
+    lookup("a")
+    assert calls == ["a", "a"]
+
+
+@pytest.fixture
+def cache_file(tmp_path):
+    """Fixture providing an isolated cache file and in-memory cache state."""
+    with patch.dict(cache._caches, clear=True), patch.dict(cache._dirty, clear=True):
+        yield str(tmp_path / "members.json")
+
+
+def test_set_cached_item_defers_disk_writes(cache_file):
+    """Items are served from memory and only written on flush."""
+    cache.set_cached_item("spaces/a", ["alice"], cache_file)
+    assert cache.get_cached_item("spaces/a", cache_file) == ["alice"]
+    assert not os.path.exists(cache_file)
+
+    cache.flush_caches()
+    with open(cache_file) as f:
+        assert json.load(f)["spaces/a"][1] == ["alice"]
+
+
+def test_flush_writes_after_threshold(cache_file):
+    """Reaching FLUSH_THRESHOLD unsaved changes writes the file."""
+    with patch.object(cache, "FLUSH_THRESHOLD", 2):
+        cache.set_cached_item("spaces/a", [], cache_file)
+        assert not os.path.exists(cache_file)
+        cache.set_cached_item("spaces/b", [], cache_file)
+        assert os.path.exists(cache_file)
+
+
+def test_flush_keeps_entries_from_other_processes(cache_file):
+    """Flushing merges with entries written to disk since the file was loaded."""
+    cache.set_cached_item("spaces/a", ["alice"], cache_file)
+    cache._save_cache({"__v": 2, "spaces/b": [4102444800.0, ["bob"]]}, cache_file)
+    cache.flush_caches()
+    with open(cache_file) as f:
+        assert set(json.load(f)) == {"__v", "spaces/a", "spaces/b"}
+
+
+def test_legacy_cache_entries_are_migrated(cache_file):
+    """Files in the old {'data', 'cached_at'} format are still readable."""
+    recent = (datetime.now() - timedelta(hours=1)).isoformat()
+    with open(cache_file, "w") as f:
+        json.dump({"spaces/a": {"data": ["alice"], "cached_at": recent}}, f)
+    assert cache.get_cached_item("spaces/a", cache_file) == ["alice"]
+
+
+def test_flush_drops_expired_entries(cache_file):
+    """An entry expired in memory is not merged back from disk on flush."""
+    cache._save_cache({"__v": 2, "spaces/old": [0.0, ["gone"]], "spaces/b": [4102444800.0, ["bob"]]}, cache_file)
+    assert cache.get_cached_item("spaces/old", cache_file) is None
+    cache.flush_caches()
+    with open(cache_file) as f:
+        assert set(json.load(f)) == {"__v", "spaces/b"}
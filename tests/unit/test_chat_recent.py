@@ -0,0 +1,76 @@
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from gwsa.sdk.chat import recent
+
+
+class FakeBatch:
+    """Stand-in for BatchHttpRequest that executes each request in turn."""
+
+    def __init__(self, callback):
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request, request_id):
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        for request_id, request in self.requests:
+            self.callback(request_id, request.execute(), None)
+
+
+@pytest.fixture
+def chat_service():
+    """Fixture to stub a Chat API with five unnamed DMs."""
+    service = MagicMock()
+    service.spaces().list().execute.return_value = {"spaces": [
+        {"name": f"spaces/{i}", "lastActiveTime": f"2026-01-0{i + 1}T00:00:00Z"}
+        for i in range(5)
+    ]}
+    service.spaces().list.reset_mock()
+
+    def list_members(parent, pageSize):
+        request = MagicMock()
+        member = {"name": f"users/{parent.split('/')[1]}"}
+        if parent != "spaces/0":
+            member["displayName"] = f"Person {parent.split('/')[1]}"
+        request.execute.return_value = {"memberships": [{"member": member}]}
+        return request
+
+    service.spaces().members().list.side_effect = list_members
+    service.new_batch_http_request.side_effect = lambda callback: FakeBatch(callback)
+    with patch.object(recent, "get_chat_service", return_value=service):
+        yield service
+
+
+def test_get_recent_chats_ranks_spaces_from_every_page(chat_service):
+    """Spaces on later spaces.list pages are ranked too, newest first."""
+    pages = {
+        None: {"spaces": [{"name": "spaces/0", "lastActiveTime": "2026-01-01T00:00:00Z"}],
+               "nextPageToken": "p2"},
+        "p2": {"spaces": [{"name": f"spaces/{i}", "lastActiveTime": f"2026-01-0{i + 1}T00:00:00Z"}
+                          for i in (1, 4)]},
+    }
+
+    def list_spaces(pageToken=None, **kwargs):
+        request = MagicMock()
+        request.execute.return_value = pages[pageToken]
+        return request
+
+    chat_service.spaces().list.side_effect = list_spaces
+    with patch.object(recent, "prefetch_person_names"), \
+         patch.object(recent, "get_person_name", return_value="Person 0"):
+        chats = recent.get_recent_chats("DIRECT_MESSAGE", limit=2)
+    assert chat_service.spaces().list.call_count == 2
+    assert [c["id"] for c in chats] == ["spaces/4", "spaces/1"]
+
+
+def test_get_recent_chats_batches_dm_member_lookups(chat_service):
+    """Unnamed DMs are named from one batched members lookup."""
+    with patch.object(recent, "prefetch_person_names") as prefetch, \
+         patch.object(recent, "get_person_name", return_value="Person 0"):
+        chats = recent.get_recent_chats("DIRECT_MESSAGE", limit=5)
+    chat_service.new_batch_http_request.assert_called_once()
+    prefetch.assert_called_once_with(["users/0"])
+    assert [c["displayName"] for c in chats] == [f"Person {i}" for i in (4, 3, 2, 1, 0)]
@@ -0,0 +1,316 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from gwsa.sdk import cache
+from gwsa.sdk.chat import triage
+
+
+class FakeBatch:
+    """Stand-in for BatchHttpRequest that executes each request in turn."""
+
+    def __init__(self, callback):
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request, request_id):
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        for request_id, request in self.requests:
+            self.callback(request_id, request.execute(), None)
+
+
+def _ts(minutes_ago):
+    moment = datetime.now(timezone.utc) - timedelta(minutes=minutes_ago)
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+@pytest.fixture
+def chat_api(tmp_path):
+    """Fixture to stub the Chat and People APIs with one DM per space."""
+    spaces = [
+        {
+            "name": f"spaces/{i}",
+            "displayName": f"Space {i}",
+            "spaceType": "DIRECT_MESSAGE",
+            "lastActiveTime": _ts(i),
+        }
+        for i in range(20)
+    ]
+    service = MagicMock()
+    service.spaces().list().execute.return_value = {"spaces": spaces}
+
+    def list_messages(parent, **kwargs):
+        request = MagicMock()
+        request.execute.return_value = {"messages": [{
+            "name": f"{parent}/messages/1",
+            "createTime": _ts(1),
+            "sender": {"name": "users/other", "displayName": "Other"},
+            "text": "ping",
+            "emojiReactionSummaries": [{"emoji": {"unicode": "👍"}, "reactionCount": 1}],
+        }]}
+        return request
+
+    def list_reactions(parent):
+        request = MagicMock()
+        # The user reacted to the mention in spaces/0 only
+        reacted = parent.startswith("spaces/0/")
+        request.execute.return_value = {"reactions": [{"user": {"name": "users/me"}}]} if reacted else {}
+        return request
+
+    service.spaces().messages().list.side_effect = list_messages
+    service.spaces().messages().reactions().list.side_effect = list_reactions
+    service.new_batch_http_request.side_effect = lambda callback: FakeBatch(callback)
+
+    with patch.dict(cache._caches, clear=True), patch.dict(cache._dirty, clear=True), \
+         patch.object(cache, "CACHE_DIR", str(tmp_path)), \
+         patch.object(cache, "TRIAGE_CACHE_FILE", str(tmp_path / "triage.json")), \
+         patch.object(cache, "PROFILES_CACHE_FILE", str(tmp_path / "profiles.json")), \
+         patch.object(triage, "get_chat_service", return_value=service), \
+         patch.object(triage, "get_me", return_value={"resourceName": "people/me", "displayName": "Me"}):
+        yield service
+
+
+def test_get_chat_mentions_keeps_candidate_order(chat_api):
+    """Spaces scanned in batched waves are reported in candidate order."""
+    result = triage.get_chat_mentions(limit=12)
+    assert [s["id"] for s in result["source"]["spaces"]] == [f"spaces/{i}" for i in range(12)]
+    assert [m["space_id"] for m in result["mentions"]] == [f"spaces/{i}" for i in range(12)]
+    assert result["source"]["exit_reason"] == "space_limit_reached"
+
+
+def test_get_chat_mentions_respects_message_limit(chat_api):
+    """Spaces scanned past the message limit are not reported."""
+    result = triage.get_chat_mentions(limit=20, message_limit=3)
+    assert result["source"]["total_spaces_scanned"] == 3
+    assert result["source"]["exit_reason"] == "message_limit_reached"
+
+
+def test_get_chat_mentions_batches_message_and_reaction_lookups(chat_api):
+    """Messages and reactions for a wave of spaces are fetched in one batch each."""
+    result = triage.get_chat_mentions(limit=12)
+    assert result["api_stats"]["_batch_list_space_messages"] == 1
+    assert result["api_stats"]["_batch_list_reactions"] == 1
+    assert chat_api.new_batch_http_request.call_count == 2
+    answered = {m["space_id"]: m["answered"] for m in result["mentions"]}
+    assert answered["spaces/0"] is True
+    assert answered["spaces/1"] is False
+
+
+def test_get_chat_mentions_reuses_messages_for_idle_spaces(chat_api):
+    """A rescan skips listing messages for spaces whose lastActiveTime is unchanged."""
+    first = triage.get_chat_mentions(limit=5)
+    second = triage.get_chat_mentions(limit=5)
+    assert "_batch_list_space_messages" not in second["api_stats"]
+    assert second["api_stats"]["_batch_list_reactions"] == 1
+    assert second["mentions"] == first["mentions"]
+
+
+def test_get_chat_mentions_fetches_only_newer_messages_for_active_spaces(chat_api):
+    """A space active since the last scan lists only messages after its cached ones."""
+    triage.get_chat_mentions(limit=1)
+    cached_time = cache.get_cached_triage("spaces/0", 1, "9999")["response"]["messages"][0]["createTime"]
+
+    chat_api.spaces().list().execute.return_value["spaces"][0]["lastActiveTime"] = _ts(0)
+    newer = MagicMock()
+    newer.execute.return_value = {"messages": [{
+        "name": "spaces/0/messages/2",
+        "createTime": _ts(0),
+        "sender": {"name": "users/other", "displayName": "Other"},
+        "text": "ping again",
+    }]}
+    chat_api.spaces().messages().list.side_effect = lambda parent, **kwargs: newer
+    result = triage.get_chat_mentions(limit=1)
+
+    kwargs = chat_api.spaces().messages().list.call_args.kwargs
+    assert kwargs["filter"] == f'createTime > "{cached_time}"'
+    assert result["source"]["spaces"][0]["messages_scanned"] == 1
+    cached = cache.get_cached_triage("spaces/0", 1, "9999")["response"]["messages"]
+    assert [m["name"] for m in cached] == ["spaces/0/messages/2"]
+
+
+def test_get_chat_mentions_rechecks_reactions_on_cached_mentions(chat_api):
+    """A cached mention is still checked for reactions added after it was cached."""
+    space = {
+        "name": "spaces/0",
+        "spaceType": "SPACE",
+        "lastActiveTime": _ts(5),
+        "membershipCount": {"joinedDirectHumanUserCount": 8},
+    }
+    chat_api.spaces().list().execute.return_value = {"spaces": [space]}
+    mention = {
+        "name": "spaces/0/messages/1",
+        "createTime": _ts(5),
+        "sender": {"name": "users/other", "displayName": "Other"},
+        "text": "@Me can you look?",
+    }
+    first_page = MagicMock()
+    first_page.execute.return_value = {"messages": [mention]}
+    chat_api.spaces().messages().list.side_effect = lambda parent, **kwargs: first_page
+    first = triage.get_chat_mentions()
+    assert first["mentions"][0]["answered"] is False
+
+    # The user reacts (no lastActiveTime change), then someone else posts
+    space["lastActiveTime"] = _ts(0)
+    newer = MagicMock()
+    newer.execute.return_value = {"messages": [{
+        "name": "spaces/0/messages/2",
+        "createTime": _ts(0),
+        "sender": {"name": "users/other", "displayName": "Other"},
+        "text": "unrelated",
+    }]}
+    chat_api.spaces().messages().list.side_effect = lambda parent, **kwargs: newer
+    second = triage.get_chat_mentions()
+    assert second["api_stats"]["_batch_list_reactions"] == 1
+    assert second["mentions"][0]["answered"] is True
+
+
+def test_get_chat_mentions_resolves_unnamed_senders_together(chat_api):
+    """Senders without a display name are looked up in one prefetch."""
+    def list_messages(parent, **kwargs):
+        request = MagicMock()
+        request.execute.return_value = {"messages": [{
+            "name": f"{parent}/messages/1",
+            "createTime": _ts(1),
+            "sender": {"name": f"users/{parent.split('/')[1]}"},
+            "text": "ping",
+        }]}
+        return request
+
+    chat_api.spaces().messages().list.side_effect = list_messages
+    with patch.object(triage, "prefetch_person_names") as prefetch, \
+         patch.object(triage, "get_person_name", side_effect=lambda user_id: f"Name {user_id}"):
+        result = triage.get_chat_mentions(limit=3)
+    prefetch.assert_called_once()
+    assert prefetch.call_args.args[0] == ["users/0", "users/1", "users/2"]
+    assert [m["sender"] for m in result["mentions"]] == ["Name users/0", "Name users/1", "Name users/2"]
+
+
+def test_get_chat_mentions_matches_whole_display_name(chat_api):
+    """A text mention of "@Me" does not match "@Meredith"."""
+    chat_api.spaces().list().execute.return_value = {"spaces": [
+        {
+            "name": f"spaces/{i}",
+            "spaceType": "SPACE",
+            "lastActiveTime": _ts(i),
+            "membershipCount": {"joinedDirectHumanUserCount": 5},
+        }
+        for i in range(2)
+    ]}
+    texts = {"spaces/0": "@Me can you look?", "spaces/1": "@Meredith can you look?"}
+
+    def list_messages(parent, **kwargs):
+        request = MagicMock()
+        request.execute.return_value = {"messages": [{
+            "name": f"{parent}/messages/1",
+            "createTime": _ts(1),
+            "sender": {"name": "users/other", "displayName": "Other"},
+            "text": texts[parent],
+        }]}
+        return request
+
+    chat_api.spaces().messages().list.side_effect = list_messages
+    result = triage.get_chat_mentions()
+    assert [m["space_id"] for m in result["mentions"]] == ["spaces/0"]
+
+
+def test_get_chat_mentions_matches_user_mention_annotations(chat_api):
+    """An annotation tagging the user counts as an explicit mention."""
+    chat_api.spaces().list().execute.return_value = {"spaces": [
+        {
+            "name": f"spaces/{i}",
+            "spaceType": "SPACE",
+            "lastActiveTime": _ts(i),
+            "membershipCount": {"joinedDirectHumanUserCount": 5},
+        }
+        for i in range(2)
+    ]}
+    tagged = {"spaces/0": "users/me", "spaces/1": "users/someone-else"}
+
+    def list_messages(parent, **kwargs):
+        request = MagicMock()
+        request.execute.return_value = {"messages": [{
+            "name": f"{parent}/messages/1",
+            "createTime": _ts(1),
+            "sender": {"name": "users/other", "displayName": "Other"},
+            "text": "can you look?",
+            "annotations": [{"type": "USER_MENTION", "userMention": {"user": {"name": tagged[parent]}}}],
+        }]}
+        return request
+
+    chat_api.spaces().messages().list.side_effect = list_messages
+    result = triage.get_chat_mentions()
+    assert [m["space_id"] for m in result["mentions"]] == ["spaces/0"]
+
+
+def test_get_chat_mentions_checks_reactions_on_every_mention_in_a_space(chat_api):
+    """Each mention in a space is checked against its own reactions."""
+    chat_api.spaces().list().execute.return_value = {"spaces": [{
+        "name": "spaces/0",
+        "spaceType": "SPACE",
+        "lastActiveTime": _ts(1),
+        "membershipCount": {"joinedDirectHumanUserCount": 5},
+    }]}
+
+    def list_messages(parent, **kwargs):
+        request = MagicMock()
+        request.execute.return_value = {"messages": [
+            {
+                "name": f"{parent}/messages/{i}",
+                "createTime": _ts(i),
+                "sender": {"name": "users/other", "displayName": "Other"},
+                "text": "@Me can you look?",
+                "emojiReactionSummaries": [{"emoji": {"unicode": "👍"}, "reactionCount": 1}],
+            }
+            for i in (1, 2)
+        ]}
+        return request
+
+    chat_api.spaces().messages().list.side_effect = list_messages
+    result = triage.get_chat_mentions(unanswered_only=True)
+    assert result["mentions"] == []
+    assert result["source"]["spaces"][0]["mentions_found"] == 2
+    assert result["source"]["spaces"][0]["unanswered_mentions"] == 0
+
+
+def test_get_chat_mentions_skips_reaction_lookup_without_reactions(chat_api):
+    """Messages with no emoji reactions are not checked for the user's reaction."""
+    def list_messages(parent, **kwargs):
+        request = MagicMock()
+        request.execute.return_value = {"messages": [{
+            "name": f"{parent}/messages/1",
+            "createTime": _ts(1),
+            "sender": {"name": "users/other", "displayName": "Other"},
+            "text": "ping",
+        }]}
+        return request
+
+    chat_api.spaces().messages().list.side_effect = list_messages
+    result = triage.get_chat_mentions(limit=5)
+    assert "_batch_list_reactions" not in result["api_stats"]
+    assert [m["answered"] for m in result["mentions"]] == [False] * 5
+
+
+def test_get_chat_mentions_applies_tier_lookback_by_size(chat_api):
+    """Each space uses the lookback of the smallest tier its size fits."""
+    chat_api.spaces().list().execute.return_value = {"spaces": [
+        # 2-member tier looks back 14 days; the unbounded tier only 1 day
+        {"name": "spaces/small", "spaceType": "DIRECT_MESSAGE", "lastActiveTime": _ts(3 * 24 * 60)},
+        {"name": "spaces/big-old", "spaceType": "SPACE", "lastActiveTime": _ts(3 * 24 * 60),
+         "membershipCount": {"joinedDirectHumanUserCount": 80}},
+        {"name": "spaces/big-new", "spaceType": "SPACE", "lastActiveTime": _ts(60),
+         "membershipCount": {"joinedDirectHumanUserCount": 80}},
+    ]}
+    result = triage.get_chat_mentions()
+    assert [s["id"] for s in result["source"]["spaces"]] == ["spaces/small", "spaces/big-new"]
+    assert [s["lookback_days"] for s in result["source"]["spaces"]] == [14, 1]
+
+
+def test_get_chat_mentions_filters_messages_by_cutoff_on_server(chat_api):
+    """messages.list is asked only for messages newer than the tier cutoff."""
+    triage.get_chat_mentions(limit=1)
+    kwargs = chat_api.spaces().messages().list.call_args.kwargs
+    cutoff = datetime.now(timezone.utc) - timedelta(days=14)
+    assert kwargs["filter"].startswith(f'createTime > "{cutoff:%Y-%m-%dT%H}')
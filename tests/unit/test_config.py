@@ -0,0 +1,42 @@
+from unittest.mock import patch
+
+import pytest
+
+from gwsa.sdk import config
+
+
+@pytest.fixture
+def config_dir(tmp_path, monkeypatch):
+    """Fixture to point the config file at an empty temp directory."""
+    monkeypatch.setenv("GWSA_CONFIG_DIR", str(tmp_path))
+    monkeypatch.delenv("GWSA_CONFIG_FILE", raising=False)
+    monkeypatch.setattr(config, "_config_cache", None)
+    yield tmp_path
+
+
+def test_load_config_does_not_alias_defaults(config_dir):
+    """Mutating a loaded config leaves DEFAULT_CONFIG untouched."""
+    loaded = config.load_config()
+    loaded["auth"]["mode"] = "adc"
+    assert config.DEFAULT_CONFIG["auth"]["mode"] is None
+
+
+def test_set_config_value_merges_nested_keys(config_dir):
+    """Saved nested values are merged over the defaults."""
+    config.set_config_value("auth.mode", "token")
+    config.set_config_value("active_profile", "work")
+    assert config.get_config_value("auth.mode") == "token"
+    assert config.get_config_value("active_profile") == "work"
+    assert config.DEFAULT_CONFIG["auth"]["mode"] is None
+
+
+def test_load_config_parses_file_once_until_it_changes(config_dir):
+    """Repeat reads reuse the parsed file; a rewrite is picked up."""
+    config.set_config_value("active_profile", "work")
+    with patch.object(config.yaml, "load", wraps=config.yaml.load) as load:
+        assert config.get_config_value("active_profile") == "work"
+        assert config.get_config_value("auth.mode") is None
+        assert load.call_count == 1
+
+    (config_dir / "config.yaml").write_text("active_profile: personal-account\n")
+    assert config.get_config_value("active_profile") == "personal-account"
@@ -0,0 +1,120 @@
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from gwsa.sdk import cache
+from gwsa.sdk.drive import folders
+
+
+@pytest.fixture
+def drive_api():
+    """Fixture to stub the Drive API so every path segment resolves."""
+    service = MagicMock()
+
+    def list_files(q, **kwargs):
+        request = MagicMock()
+        name = q.split("name = '")[1].split("'")[0]
+        request.execute.return_value = {"files": [{"id": f"id-{name}", "name": name, "parents": ["root"]}]}
+        return request
+
+    service.files().list.side_effect = list_files
+    cache.clear_memory_caches()
+    with patch.object(cache, "get_active_profile_name", return_value="work"), \
+         patch.object(folders, "get_drive_service", return_value=service):
+        yield service
+    cache.clear_memory_caches()
+
+
+def test_find_folders_by_paths_resolves_each_path_once(drive_api):
+    """Every distinct path is resolved and duplicates share one lookup."""
+    result = folders.find_folders_by_paths(["Alpha", "Beta", "Alpha"])
+    assert list(result) == ["Alpha", "Beta"]
+    assert result["Beta"] == {"id": "id-Beta", "name": "Beta", "path": "Beta"}
+    assert drive_api.files().list.call_count == 2
+
+
+def test_create_folder_clears_cached_lookups(drive_api):
+    """A path cached as not found is looked up again after a folder is created."""
+    drive_api.files().list.side_effect = None
+    drive_api.files().list.return_value.execute.return_value = {"files": []}
+    drive_api.files().create.return_value.execute.return_value = {"id": "id-New", "name": "New"}
+    assert folders.find_folder_by_path("New") is None
+
+    folders.create_folder("New")
+    drive_api.files().list.return_value.execute.return_value = {
+        "files": [{"id": "id-New", "name": "New", "parents": ["root"]}]
+    }
+    assert folders.find_folder_by_path("New")["id"] == "id-New"
+
+
+def test_iter_folder_follows_pages(drive_api):
+    """iter_folder yields items from every page in order."""
+    pages = {
+        None: {"files": [{"id": "a", "name": "a"}], "nextPageToken": "p2"},
+        "p2": {"files": [{"id": "b", "name": "b", "mimeType": "application/vnd.google-apps.folder"}]},
+    }
+
+    def list_files(q, pageToken=None, **kwargs):
+        request = MagicMock()
+        request.execute.return_value = pages[pageToken]
+        return request
+
+    drive_api.files().list.side_effect = list_files
+    items = list(folders.iter_folder("parent"))
+    assert [(i["id"], i["type"]) for i in items] == [("a", "file"), ("b", "folder")]
+
+
+def _respond(drive_api, *responses):
+    """Make successive files.list calls return the given responses."""
+    pending = list(responses)
+
+    def list_files(**kwargs):
+        request = MagicMock()
+        request.execute.return_value = pending.pop(0)
+        return request
+
+    drive_api.files().list.side_effect = list_files
+
+
+def test_find_folder_by_path_matches_parents_locally(drive_api):
+    """One query resolves a path whose last name also exists under another parent."""
+    _respond(drive_api, {"files": [
+        {"id": "a", "name": "Projects", "parents": ["root"]},
+        {"id": "s-other", "name": "Shared", "parents": ["elsewhere"]},
+        {"id": "s", "name": "Shared", "parents": ["a"]},
+    ]})
+    assert folders.find_folder_by_path("Projects/Shared")["id"] == "s"
+    assert drive_api.files().list.call_count == 1
+
+
+def test_find_folder_by_path_raises_on_ambiguous_level(drive_api):
+    """Two folders with the same name under the same parent are ambiguous."""
+    _respond(drive_api, {"files": [
+        {"id": "a", "name": "Projects", "parents": ["root"]},
+        {"id": "s1", "name": "Shared", "parents": ["a"]},
+        {"id": "s2", "name": "Shared", "parents": ["a"]},
+    ]})
+    with pytest.raises(folders.AmbiguousFolderError):
+        folders.find_folder_by_path("Projects/Shared")
+
+
+def test_find_folder_by_path_walks_when_first_segment_repeats(drive_api):
+    """A path repeating its first segment is resolved one segment at a time."""
+    _respond(drive_api, *({"files": [{"id": f"id-{i}", "name": "x"}]} for i in range(3)))
+    assert folders.find_folder_by_path("Archive/2024/Archive")["id"] == "id-2"
+    queries = [c.kwargs["q"] for c in drive_api.files().list.call_args_list]
+    assert queries[0].startswith("'root' in parents and name = 'Archive'")
+    assert queries[1].startswith("'id-0' in parents and name = '2024'")
+    assert len(queries) == 3
+
+
+def test_find_folder_by_path_walks_when_candidates_span_pages(drive_api):
+    """A paged candidate listing falls back to one query per segment."""
+    _respond(
+        drive_api,
+        {"files": [{"id": "a", "name": "Projects", "parents": ["root"]}], "nextPageToken": "p2"},
+        {"files": [{"id": "a", "name": "Projects"}]},
+        {"files": [{"id": "s", "name": "Shared"}]},
+    )
+    assert folders.find_folder_by_path("Projects/Shared")["id"] == "s"
+    assert drive_api.files().list.call_count == 3
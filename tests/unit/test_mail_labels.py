@@ -0,0 +1,73 @@
+from unittest.mock import patch, MagicMock
+
+import pytest
+from googleapiclient.errors import HttpError
+
+from gwsa.sdk.mail import label
+
+
+class FakeBatch:
+    """Stand-in for BatchHttpRequest that executes each request in turn."""
+
+    def __init__(self, callback):
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request, request_id):
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        for request_id, request in self.requests:
+            try:
+                response = request.execute()
+            except HttpError as e:
+                self.callback(request_id, None, e)
+            else:
+                self.callback(request_id, response, None)
+
+
+@pytest.fixture
+def gmail_api():
+    """Fixture to stub the Gmail API with one existing label."""
+    service = MagicMock()
+
+    def create_label(userId, body):
+        request = MagicMock()
+        request.execute.return_value = {"id": f"Label_{body['name']}", "name": body["name"]}
+        return request
+
+    service.users().labels().create.side_effect = create_label
+    service.users().messages().modify().execute.return_value = {"id": "m1"}
+    service.new_batch_http_request.side_effect = lambda callback: FakeBatch(callback)
+
+    label.clear_label_cache()
+    with patch.object(label, "get_gmail_service", return_value=service), \
+         patch.object(label, "list_labels", return_value=[{"id": "Label_1", "name": "Existing"}]):
+        yield service
+    label.clear_label_cache()
+
+
+def test_modify_labels_creates_missing_labels_in_one_batch(gmail_api):
+    """Labels not yet in the account are created together before the modify."""
+    label.modify_labels("m1", add_labels=["Existing", "New A", "New B", "New A"])
+    assert gmail_api.new_batch_http_request.call_count == 1
+    created = [c.kwargs["body"]["name"] for c in gmail_api.users().labels().create.call_args_list]
+    assert created == ["New A", "New B"]
+    body = gmail_api.users().messages().modify.call_args.kwargs["body"]
+    assert body["addLabelIds"] == ["Label_1", "Label_New A", "Label_New B", "Label_New A"]
+
+
+def test_modify_labels_resolves_label_created_elsewhere(gmail_api):
+    """A create conflict relists labels instead of failing on a stale map."""
+    def create_label(userId, body):
+        request = MagicMock()
+        request.execute.side_effect = HttpError(MagicMock(status=409), b"Label name exists or conflicts")
+        return request
+
+    gmail_api.users().labels().create.side_effect = create_label
+    relisted = [{"id": "Label_1", "name": "Existing"}, {"id": "Label_2", "name": "Elsewhere"}]
+    with patch.object(label, "list_labels", side_effect=[[{"id": "Label_1", "name": "Existing"}], relisted]):
+        label.modify_labels("m1", add_labels=["Elsewhere"])
+    body = gmail_api.users().messages().modify.call_args.kwargs["body"]
+    assert body["addLabelIds"] == ["Label_2"]
+    assert label.get_or_create_label("Elsewhere") == "Label_2"
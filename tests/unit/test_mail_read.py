@@ -0,0 +1,29 @@
+import base64
+
+from gwsa.sdk.mail.read import _extract_body_parts
+
+
+def _part(mime_type, text=None, parts=None):
+    part = {"mimeType": mime_type, "body": {}}
+    if text is not None:
+        part["body"]["data"] = base64.urlsafe_b64encode(text.encode()).decode()
+    if parts is not None:
+        part["parts"] = parts
+    return part
+
+
+def test_extract_body_parts_prefers_first_part_in_document_order():
+    """A nested body part that comes earlier wins over a later sibling."""
+    payload = _part("multipart/mixed", parts=[
+        _part("multipart/alternative", parts=[
+            _part("text/plain", "nested text"),
+            _part("text/html", "<p>nested</p>"),
+        ]),
+        _part("text/plain", "attached text"),
+    ])
+    assert _extract_body_parts(payload) == ("nested text", "<p>nested</p>")
+
+
+def test_extract_body_parts_simple_message():
+    """A message without parts uses its top-level body as text."""
+    assert _extract_body_parts(_part("text/plain", "hello")) == ("hello", None)
@@ -0,0 +1,59 @@
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from gwsa.sdk import cache
+from gwsa.sdk.people import service as people
+
+
+@pytest.fixture
+def people_api(tmp_path):
+    """Fixture to stub the People API with isolated name caches."""
+    api = MagicMock()
+    api.people().getBatchGet().execute.return_value = {"responses": [
+        {"requestedResourceName": "people/1", "person": {"names": [{"displayName": "Ada Lovelace"}]}},
+        {"requestedResourceName": "people/2", "status": {"code": 5}},
+    ]}
+    api.people().getBatchGet.reset_mock()
+    with patch.dict(cache._caches, clear=True), patch.dict(cache._dirty, clear=True), \
+         patch.object(cache, "PROFILES_CACHE_FILE", str(tmp_path / "profiles.json")), \
+         patch.dict(people._person_name_memo, clear=True), \
+         patch.object(people, "get_people_service", return_value=api):
+        yield api
+
+
+def test_prefetch_person_names_uses_one_batch_call(people_api):
+    """Unknown senders are resolved together, deduplicated, in one request."""
+    assert people.prefetch_person_names(["users/1", "users/2", "users/1"]) == 1
+    people_api.people().getBatchGet.assert_called_once_with(
+        resourceNames=["people/1", "people/2"], personFields="names"
+    )
+
+    # Both are now answered without another API call
+    assert people.get_person_name("users/1") == "Ada Lovelace"
+    assert people.get_person_name("users/2") == "Unknown"
+    people_api.people().get.assert_not_called()
+
+
+def test_prefetch_person_names_skips_cached_users(people_api):
+    """Users already in the cache are not requested again."""
+    cache.set_cached_person_name("1", "Ada Lovelace")
+    people.prefetch_person_names(["users/1"])
+    people_api.people().getBatchGet.assert_not_called()
+
+
+def test_get_me_is_memoized_per_profile(people_api):
+    """get_me fetches once per profile, and a failure is not memoized as success."""
+    people_api.people().get().execute.return_value = {"names": [{"displayName": "Ada Lovelace"}]}
+    people_api.people().get.reset_mock()
+    people._get_me.cache_clear()
+    with patch.object(cache, "get_active_profile_name", return_value="work"):
+        assert people.get_me()["displayName"] == "Ada Lovelace"
+        people.get_me()
+    assert people_api.people().get.call_count == 1
+
+    people_api.people().get().execute.side_effect = Exception("boom")
+    with patch.object(cache, "get_active_profile_name", return_value="personal"), \
+         patch.object(people, "get_cached_profile", return_value=None):
+        assert people.get_me() == {}
+    people._get_me.cache_clear()